@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+"""
+Measures the memory held by each ``Board``, counting the board, its
+pieces and everything they allocate, by copying a position many times
+and reading the growth of the traced heap. Boards made with
+``Board.child`` share what the move did not touch and are measured
+separately.
+
+| python -m benchmarks.board_memory
+| python -m benchmarks.board_memory --boards 5000
+
+Copyright © 2016 Aubhro Sengupta. All rights reserved.
+"""
+
+from __future__ import print_function
+
+import argparse
+import gc
+import tracemalloc
+from copy import copy as cp
+
+from chess_py import Board, color, converter
+
+OPENING = ("e4", "e5", "Nf3", "Nc6", "Bb5", "a6", "Ba4", "Nf6", "O-O", "Be7")
+
+
+def _opening_board():
+    board = Board.init_default()
+    input_color = color.white
+    for move in OPENING:
+        board.update(converter.short_alg(move, input_color, board))
+        input_color = -input_color
+
+    return board
+
+
+def bytes_per_board(board, count, make=cp):
+    """
+    Finds the average number of bytes allocated by each of
+    ``count`` boards made from ``board`` by ``make``.
+
+    :type: board: Board
+    :type: count: int
+    :type: make: function
+    :rtype: float
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    boards = [make(board) for _ in range(count)]
+
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del boards
+    return (after - before) / float(count)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure bytes held per Board.")
+    parser.add_argument("--boards", type=int, default=2000,
+                        help="number of copies to measure (default 2000)")
+    args = parser.parse_args()
+
+    for name, board in (("start position", Board.init_default()),
+                        ("after 5 moves", _opening_board())):
+        print("{:<16} {:>10.0f} bytes per Board".format(name, bytes_per_board(board, args.boards)))
+
+    board = _opening_board()
+    move = board.packed_moves(color.white)[0]
+    print("{:<16} {:>10.0f} bytes per Board".format("child", bytes_per_board(board, args.boards,
+                                                                              lambda parent: parent.child(move))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+
+"""
+Times the operations engines built on chess_py call most, on a fixed set
+of positions, and fails when one has slowed down too much compared to a
+stored baseline.
+
+| python -m benchmarks.micro
+| python -m benchmarks.micro --threshold 10 --output results.json
+| python -m benchmarks.micro --save-baseline
+
+Each metric is the median time per call over ``--repeat`` rounds. The
+number of calls in a round is calibrated so that a round lasts at least
+``--min-time`` seconds, and the garbage collector is off while calls are
+timed. Every call gets a fresh copy of the position where the operation
+changes it or fills its move cache, so the timings are of cold calls.
+Results are written as JSON mapping each metric to seconds per call.
+
+The run exits with 1 if a metric is more than ``--threshold`` percent
+slower than in the baseline file, which ``--save-baseline`` replaces with
+the current results. Baselines only compare runs on the same machine, so
+they are not committed: record one before making a change.
+
+Copyright © 2016 Aubhro Sengupta. All rights reserved.
+"""
+
+from __future__ import print_function
+
+import argparse
+import gc
+import json
+import os
+import sys
+from copy import copy as cp
+from timeit import default_timer
+
+from chess_py import Board, Game, MoveCache, Player, color, converter
+from chess_py.pieces.piece_const import PieceValues
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_OUTPUT = "benchmark_results.json"
+DEFAULT_THRESHOLD = 25.0
+DEFAULT_REPEAT = 5
+DEFAULT_MIN_TIME = 0.2
+
+# Most prepared arguments held at once while timing
+_BATCH = 1000
+
+# Morphy against the Duke of Brunswick and Count Isouard, Paris 1858
+OPERA_GAME = ("e4", "e5", "Nf3", "d6", "d4", "Bg4", "dxe5", "Bxf3", "Qxf3", "dxe5", "Bc4", "Nf6",
+              "Qb3", "Qe7", "Nc3", "c6", "Bg5", "b5", "Nxb5", "cxb5", "Bxb5", "Nbd7", "O-O-O", "Rd8",
+              "Rxd7", "Rxd7", "Rd1", "Qe6", "Bxd7", "Nxd7", "Qb8", "Nxb8", "Rd8")
+
+# Name, moves from the starting position, then a move for white in
+# short and in long algebraic notation
+POSITIONS = (
+    ("start", (), "Nf3", "e2e4"),
+    ("ruy lopez", ("e4", "e5", "Nf3", "Nc6", "Bb5", "a6", "Ba4", "Nf6", "O-O", "Be7"), "Re1", "d2d4"),
+    ("opera game", OPERA_GAME[:18], "Nxb5", "c4b5"),
+)
+
+
+class ScriptedPlayer(Player):
+    def __init__(self, input_color, moves):
+        """
+        Creates a player that plays ``moves`` in order.
+
+        :type: input_color: Color
+        :type: moves: tuple
+        """
+        super(ScriptedPlayer, self).__init__(input_color)
+        self.moves = list(moves)
+
+    def generate_move(self, position):
+        return converter.short_alg(self.moves.pop(0), self.color, position)
+
+
+def _board_after(moves):
+    board = Board.init_default()
+    input_color = color.white
+    for move in moves:
+        board.update(converter.short_alg(move, input_color, board))
+        input_color = -input_color
+
+    return board
+
+
+def _opera_game():
+    return Game(ScriptedPlayer(color.white, OPERA_GAME[0::2]),
+                ScriptedPlayer(color.black, OPERA_GAME[1::2]))
+
+
+def _time_calls(prepare, run, number):
+    """
+    Times ``number`` calls of ``run``, each given its own result of
+    ``prepare``. Only the calls are timed, with the garbage collector
+    off.
+
+    :type: prepare: function
+    :type: run: function
+    :type: number: int
+    :rtype: float
+    """
+    elapsed = 0.0
+    gc_was_enabled = gc.isenabled()
+    while number > 0:
+        args = [prepare() for _ in range(min(number, _BATCH))]
+        number -= len(args)
+
+        gc.disable()
+        try:
+            start = default_timer()
+            for arg in args:
+                run(arg)
+            elapsed += default_timer() - start
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    return elapsed
+
+
+def _calibrate(prepare, run, min_time):
+    """
+    Finds how many calls of ``run`` last at least ``min_time`` seconds.
+
+    :type: prepare: function
+    :type: run: function
+    :type: min_time: float
+    :rtype: int
+    """
+    number = 1
+    while True:
+        elapsed = _time_calls(prepare, run, number)
+        if elapsed >= min_time:
+            return number
+
+        # Aim a little past min_time, growing at most tenfold per try
+        number = max(number + 1, min(number * 10, int(number * min_time * 1.2 / max(elapsed, 1e-9))))
+
+
+def _median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+
+    return (values[middle - 1] + values[middle]) / 2.0
+
+
+def _time(prepare, run, repeat, min_time=DEFAULT_MIN_TIME):
+    """
+    Finds the median time per call of ``run`` over ``repeat`` rounds
+    lasting at least ``min_time`` seconds each.
+
+    :type: prepare: function
+    :type: run: function
+    :type: repeat: int
+    :type: min_time: float
+    :rtype: float
+    """
+    number = _calibrate(prepare, run, min_time)
+    return _median([_time_calls(prepare, run, number) / number for _ in range(repeat)])
+
+
+def metrics():
+    """
+    Finds every metric as a name and the ``prepare`` and ``run``
+    functions to time it with.
+
+    :rtype: list
+    """
+    values = PieceValues()
+    found = []
+    for name, moves, short, long_move in POSITIONS:
+        board = _board_after(moves)
+        move = converter.long_alg(long_move, board)
+        king = board.get_king(color.white)
+
+        def fresh(board=board):
+            # Copies share the move cache, so give each its own
+            copied = cp(board)
+            copied.move_cache = MoveCache()
+            return copied
+
+        def same(board=board):
+            return board
+
+        found += [
+            ("Board.__copy__[{}]".format(name), same, cp),
+            ("Board.update[{}]".format(name), fresh, lambda b, move=move: b.update(move)),
+            ("Board.all_possible_moves[{}]".format(name), fresh,
+             lambda b: b.all_possible_moves(color.white)),
+            ("King.in_check[{}]".format(name), same, lambda b, king=king: king.in_check(b)),
+            ("converter.short_alg[{}]".format(name), fresh,
+             lambda b, short=short: converter.short_alg(short, color.white, b)),
+            ("converter.long_alg[{}]".format(name), fresh,
+             lambda b, long_move=long_move: converter.long_alg(long_move, b)),
+            ("Board.material_advantage[{}]".format(name), same,
+             lambda b: b.material_advantage(color.white, values)),
+        ]
+
+    found.append(("Game.play[opera game]", _opera_game, lambda game: game.play()))
+    return found
+
+
+def run(repeat=DEFAULT_REPEAT, min_time=DEFAULT_MIN_TIME):
+    """
+    Times every metric.
+
+    :type: repeat: int
+    :type: min_time: float
+    :rtype: dict
+    """
+    return dict((name, _time(prepare, fn, repeat, min_time)) for name, prepare, fn in metrics())
+
+
+def regressions(results, baseline, threshold):
+    """
+    Finds the metrics more than ``threshold`` percent slower than in
+    ``baseline``, with how much slower they are in percent. Metrics
+    missing from either are ignored.
+
+    :type: results: dict
+    :type: baseline: dict
+    :type: threshold: float
+    :rtype: dict
+    """
+    slower = {}
+    for name, seconds in results.items():
+        if name in baseline and baseline[name] > 0:
+            change = (seconds - baseline[name]) / baseline[name] * 100
+            if change > threshold:
+                slower[name] = change
+
+    return slower
+
+
+def _load(path):
+    with open(path) as json_file:
+        return json.load(json_file)
+
+
+def _save(results, path):
+    with open(path, "w") as json_file:
+        json.dump(results, json_file, indent=2, sort_keys=True)
+        json_file.write("\n")
+
+
+def main(args=None):
+    """
+    Runs the benchmarks from the command line. Returns 1 if a metric
+    regressed past the threshold.
+
+    :type: args: list
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.micro",
+                                     description="Time chess_py operations against a baseline.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE,
+                        help="baseline JSON to compare with (default benchmarks/baseline.json)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT,
+                        help="file to write results to (default {})".format(DEFAULT_OUTPUT))
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="percent slowdown that fails the run (default {:g})".format(DEFAULT_THRESHOLD))
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help="rounds to take the median of (default {})".format(DEFAULT_REPEAT))
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME,
+                        help="least seconds per round (default {:g})".format(DEFAULT_MIN_TIME))
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="replace the baseline with these results")
+    args = parser.parse_args(args)
+
+    results = run(args.repeat, args.min_time)
+    _save(results, args.output)
+
+    baseline = _load(args.baseline) if os.path.exists(args.baseline) else {}
+    slower = regressions(results, baseline, args.threshold)
+
+    for name in sorted(results):
+        line = "{:<44} {:>12.1f} us".format(name, results[name] * 1e6)
+        if name in baseline and baseline[name] > 0:
+            line += " {:>+8.1f} %".format((results[name] - baseline[name]) / baseline[name] * 100)
+        if name in slower:
+            line += "  REGRESSED"
+        print(line)
+
+    if args.save_baseline:
+        _save(results, args.baseline)
+        print("Saved baseline to {}".format(args.baseline))
+        return 0
+
+    if not baseline:
+        print("No baseline at {}, record one with --save-baseline".format(args.baseline))
+    elif slower:
+        print("{} metrics regressed more than {:g} %".format(len(slower), args.threshold))
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
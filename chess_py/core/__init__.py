@@ -2,5 +2,9 @@ from . import algebraic, color
 from .algebraic import Move, Location
 from .algebraic import converter, notation_const
 from .board import Board
+from .bitboard import BitBoard
+from .move_cache import MoveCache
+from .move_picker import MovePicker
+from .transposition_table import TranspositionTable
 
-__all__ = ['Board', 'color'] + algebraic.__all__
+__all__ = ['Board', 'BitBoard', 'MoveCache', 'MovePicker', 'TranspositionTable', 'color'] + algebraic.__all__
@@ -6,8 +6,6 @@ to turn them into usable commands.
 
 Copyright © 2016 Aubhro Sengupta. All rights reserved.
 """
-from copy import copy as cp
-
 from .. import color
 from . import notation_const
 from .location import Location
@@ -87,16 +85,15 @@ def _get_piece_start_location(end_location,
     else:
         for empty_board_move in empty_board_valid_moves:
             poss_piece = position.piece_at_square(empty_board_move.end_loc)
-            for real_board_move in poss_piece.possible_moves(position):
-                test_in_check_board = cp(position)
-                test_move = Move(end_loc=real_board_move.end_loc,
-                                 piece=test_in_check_board.piece_at_square(real_board_move.start_loc),
-                                 status=real_board_move.status,
-                                 start_loc=real_board_move.start_loc,
-                                 promoted_to_piece=real_board_move.promoted_to_piece)
-                test_in_check_board.update(test_move)
-                if real_board_move.end_loc == end_location and \
-                        not test_in_check_board.get_king(input_color).in_check(test_in_check_board):
+            for real_board_move in list(poss_piece.possible_moves(position)):
+                if real_board_move.end_loc != end_location:
+                    continue
+
+                undo = position.make_move(real_board_move)
+                in_check = position.get_king(input_color).in_check(position)
+                position.unmake_move(undo)
+
+                if not in_check:
                     return poss_piece, real_board_move.start_loc
 
     raise ValueError("No valid piece move found")
@@ -305,19 +302,24 @@ def incomplete_alg(alg_str, input_color, position):
     raise ValueError("algebraic string {} is invalid in \n{}".format(alg_str, position))
 
 
-def make_legal(move, position):
+def make_legal(move, position, legal_moves=None):
     """
     Converts an incomplete move (initial ``Location`` not specified)
     and the corresponding position into the a complete move
     with the most likely starting point specified. If no moves match, ``None``
-    is returned.
+    is returned. ``legal_moves`` are the legal moves of the side moving
+    if they are already known.
 
     :type: move: Move
     :type: position: Board
+    :type: legal_moves: list
     :rtype: Move
     """
     assert isinstance(move, Move)
-    for legal_move in position.all_possible_moves(move.color):
+    if legal_moves is None:
+        legal_moves = position.all_possible_moves(move.color)
+
+    for legal_move in legal_moves:
 
         if move.status == notation_const.LONG_ALG:
             if move.end_loc == legal_move.end_loc and \
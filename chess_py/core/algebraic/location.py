@@ -11,7 +11,15 @@ on the chess board, however, such locations
 will not work properly with other classes
 such as ``Board``.
 
-Location is immutable.
+Location is immutable. There is exactly one ``Location`` per square:
+``Location(rank, file)`` and ``Location.from_index(index)`` return the
+same shared instance, so locations compare by identity. Squares are
+indexed ``rank * 8 + file`` from a1 (0) to h8 (63).
+
+``NEIGHBORS`` maps a (rank offset, file offset) step, such as ``(1, 0)``
+for up or ``(2, 1)`` for a knight jump, to the ``Location`` reached from
+every square, or ``None`` where the step leaves the board. The king,
+knight and pawn tables in ``attack_tables`` are built from it.
 
 Examples (shown on board below):
 
@@ -45,19 +53,34 @@ class Direction:
     LEFT = 3
 
 
-class Location:
-    def __init__(self, rank, file):
+class Location(object):
+    __slots__ = ('_rank', '_file', '_index')
+
+    def __new__(cls, rank, file):
         """
-        Creates a location on a chessboard given x and y coordinates.
+        Finds the location on a chessboard given x and y coordinates.
 
         :type: rank: int
         :type: file: int
+        :rtype: Location
         """
         if rank < 0 or rank > 7 or file < 0 or file > 7:
             raise IndexError("Location must be on the board")
 
-        self._rank = rank
-        self._file = file
+        return _LOCATIONS[rank * 8 + file]
+
+    @classmethod
+    def from_index(cls, index):
+        """
+        Finds the location of a square index ``rank * 8 + file``.
+
+        :type: index: int
+        :rtype: Location
+        """
+        if index < 0 or index > 63:
+            raise IndexError("Location index must be on the board")
+
+        return _LOCATIONS[index]
 
     @classmethod
     def from_string(cls, alg_str):
@@ -83,28 +106,41 @@ class Location:
     def file(self):
         return self._file
 
-    def __key(self):
-        return self.rank, self.file
+    @property
+    def index(self):
+        return self._index
 
     def __hash__(self):
-        return hash(self.__key())
+        return self._index
 
-    def __eq__(self, other):
+    def __reduce__(self):
+        return Location, (self._rank, self._file)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def neighbor(self, rank_offset, file_offset):
         """
-        Tests to see if both locations
-        are the same ie rank and file is 
-        the same.
+        Finds the location ``rank_offset`` ranks and ``file_offset`` files
+        away, or ``None`` if it is off the board.
 
-        :type: other: Location
+        :type: rank_offset: int
+        :type: file_offset: int
+        :rtype: Location
         """
-        if not isinstance(other, self.__class__):
-            raise TypeError("Cannot compare other types with Location")
+        table = NEIGHBORS.get((rank_offset, file_offset))
+        if table is not None:
+            return table[self._index]
 
-        return int(self.rank) == int(other.rank) and \
-            int(self.file) == int(other.file)
+        rank = self._rank + rank_offset
+        file = self._file + file_offset
+        if 0 <= rank < 8 and 0 <= file < 8:
+            return _LOCATIONS[rank * 8 + file]
 
-    def __ne__(self, other):
-        return not self.__eq__(other)
+        return None
 
     def __repr__(self):
         return "Location({}, {} ({}))".format(self._rank, self._file, str(self))
@@ -263,3 +299,26 @@ class Location:
             return Location(self._rank - times, self._file - times)
         except IndexError as e:
             raise IndexError(e)
+
+
+def _create(index):
+    location = object.__new__(Location)
+    location._rank = index >> 3
+    location._file = index & 7
+    location._index = index
+    return location
+
+
+_LOCATIONS = tuple(_create(index) for index in range(64))
+
+_NEIGHBOR_OFFSETS = ((1, 0), (0, 1), (-1, 0), (0, -1),
+                     (1, 1), (1, -1), (-1, 1), (-1, -1),
+                     (2, 1), (1, 2), (-1, 2), (-2, 1),
+                     (-2, -1), (-1, -2), (1, -2), (2, -1))
+
+NEIGHBORS = dict(((rank_offset, file_offset),
+                  tuple(_LOCATIONS[location.index + rank_offset * 8 + file_offset]
+                        if 0 <= location.rank + rank_offset < 8 and 0 <= location.file + file_offset < 8
+                        else None
+                        for location in _LOCATIONS))
+                 for rank_offset, file_offset in _NEIGHBOR_OFFSETS)
@@ -15,7 +15,9 @@ Copyright © 2016 Aubhro Sengupta. All rights reserved.
 from .location import Location
 
 
-class Move:
+class Move(object):
+    __slots__ = ('_end_loc', '_status', '_piece', '_start_loc', 'color', 'promoted_to_piece')
+
     def __init__(self,
                  end_loc,
                  piece,
@@ -92,7 +94,7 @@ class Move:
         return not self.__eq__(other)
 
     def __repr__(self):
-        return "Move({})".format(self.__dict__)
+        return "Move({})".format(dict((name, getattr(self, name)) for name in self.__slots__))
 
     def __str__(self):
         """
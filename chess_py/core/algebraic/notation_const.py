@@ -24,3 +24,12 @@ CAPTURE_AND_PROMOTE = 6
 NOT_IMPLEMENTED = 7
 
 LONG_ALG = 8
+
+# Bits of ``Board.castling_rights``
+WHITE_KING_SIDE = 1
+
+WHITE_QUEEN_SIDE = 2
+
+BLACK_KING_SIDE = 4
+
+BLACK_QUEEN_SIDE = 8
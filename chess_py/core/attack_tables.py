@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+
+"""
+Lookup tables of the squares knights, kings and pawns can reach,
+built once when the module is imported.
+
+Every table is indexed by square, numbered ``rank * 8 + file`` from
+a1 (0) to h8 (63). Targets are stored both as tuples of ``Location``
+for the piece move generators and as 64 bit masks for bitboard code.
+Squares off the edge of the board are simply left out, so callers never
+need to catch ``IndexError``.
+
+Pawn tables are additionally indexed by side, ``True`` for white and
+``False`` for black, for example ``PAWN_CAPTURES[True][12]`` holds the
+squares a white pawn on e2 attacks.
+
+Rook, bishop and queen attacks depend on which squares are occupied.
+``rook_attacks`` and ``bishop_attacks`` look the whole attack set up by
+square and by the occupancy of the squares that can block the piece; a
+queen combines both. Each attack set is computed the first time it is needed
+and then served from the table.
+
+Copyright © 2016 Aubhro Sengupta. All rights reserved.
+"""
+
+from .algebraic.location import NEIGHBORS, Location
+
+def popcount(bitboard):
+    """
+    Counts the number of set bits.
+
+    :type: bitboard: int
+    :rtype: int
+    """
+    return bin(bitboard).count("1")
+
+
+def lowest_bit(bitboard):
+    """
+    Finds the index of the least significant set bit.
+
+    :type: bitboard: int
+    :rtype: int
+    """
+    return (bitboard & -bitboard).bit_length() - 1
+
+
+def iter_bits(bitboard):
+    """
+    Yields the index of every set bit from a1 to h8.
+
+    :type: bitboard: int
+    :rtype: gen
+    """
+    while bitboard:
+        lsb = bitboard & -bitboard
+        yield lsb.bit_length() - 1
+        bitboard ^= lsb
+
+
+# Location of every square index
+SQUARES = tuple(Location.from_index(index) for index in range(64))
+
+KNIGHT_OFFSETS = ((2, 1), (1, 2), (-1, 2), (-2, 1),
+                  (-2, -1), (-1, -2), (1, -2), (2, -1))
+
+CROSS_OFFSETS = ((1, 0), (0, 1), (-1, 0), (0, -1))
+
+DIAG_OFFSETS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+KING_OFFSETS = CROSS_OFFSETS + DIAG_OFFSETS
+
+
+def _targets(offsets):
+    """
+    Builds the target squares of every square for a set of offsets from
+    the ``NEIGHBORS`` table.
+
+    :type: offsets: tuple
+    :rtype: tuple
+    """
+    return tuple(tuple(NEIGHBORS[offset][index] for offset in offsets
+                       if NEIGHBORS[offset][index] is not None)
+                 for index in range(64))
+
+
+def _masks(table):
+    """
+    Converts a table of ``Location`` tuples into bit masks.
+
+    :type: table: tuple
+    :rtype: tuple
+    """
+    return tuple(sum(1 << loc.index for loc in targets)
+                 for targets in table)
+
+
+KNIGHT_TARGETS = _targets(KNIGHT_OFFSETS)
+KING_TARGETS = _targets(KING_OFFSETS)
+PAWN_PUSHES = {True: NEIGHBORS[(1, 0)], False: NEIGHBORS[(-1, 0)]}
+
+# Captures towards the h-file come first, then towards the a-file
+PAWN_CAPTURES = {True: _targets(((1, 1), (1, -1))),
+                 False: _targets(((-1, 1), (-1, -1)))}
+
+KNIGHT_ATTACKS = _masks(KNIGHT_TARGETS)
+KING_ATTACKS = _masks(KING_TARGETS)
+PAWN_ATTACKS = {True: _masks(PAWN_CAPTURES[True]),
+                False: _masks(PAWN_CAPTURES[False])}
+
+
+def _rays(offset):
+    """
+    Builds the mask of every square along one direction from each square,
+    up to the edge of the board.
+
+    :type: offset: tuple
+    :rtype: tuple
+    """
+    rank_offset, file_offset = offset
+    table = []
+    for index in range(64):
+        rank, file = (index >> 3) + rank_offset, (index & 7) + file_offset
+        ray = 0
+        while 0 <= rank < 8 and 0 <= file < 8:
+            ray |= 1 << (rank * 8 + file)
+            rank, file = rank + rank_offset, file + file_offset
+        table.append(ray)
+
+    return tuple(table)
+
+
+# Rays in every direction, keyed by (rank offset, file offset)
+RAYS = dict((offset, _rays(offset)) for offset in KING_OFFSETS)
+
+
+def _relevant_occupancy(offsets):
+    """
+    Finds for every square which squares can block a slider moving along
+    ``offsets``. The last square of each ray is left out because a piece
+    there cannot hide anything behind it.
+
+    :type: offsets: tuple
+    :rtype: tuple
+    """
+    masks = []
+    for index in range(64):
+        mask = 0
+        for offset in offsets:
+            ray = RAYS[offset][index]
+            if ray:
+                last = ray.bit_length() - 1 if offset[0] * 8 + offset[1] > 0 \
+                    else (ray & -ray).bit_length() - 1
+                mask |= ray & ~(1 << last)
+        masks.append(mask)
+
+    return tuple(masks)
+
+
+ROOK_MASKS = _relevant_occupancy(CROSS_OFFSETS)
+BISHOP_MASKS = _relevant_occupancy(DIAG_OFFSETS)
+
+# Attack sets keyed by square, then by the occupancy of the relevant squares.
+# Filled in the first time each (square, occupancy) pair is looked up.
+_ROOK_ATTACKS = tuple({} for _ in range(64))
+_BISHOP_ATTACKS = tuple({} for _ in range(64))
+
+
+def _slide(index, occupancy, offsets):
+    """
+    Walks every direction in ``offsets`` from ``index`` until it leaves
+    the board or reaches an occupied square.
+
+    :type: index: int
+    :type: occupancy: int
+    :type: offsets: tuple
+    :rtype: int
+    """
+    attacks = 0
+    for offset in offsets:
+        ray = RAYS[offset][index]
+        blockers = ray & occupancy
+        if blockers:
+            if offset[0] * 8 + offset[1] > 0:
+                first = (blockers & -blockers).bit_length() - 1
+            else:
+                first = blockers.bit_length() - 1
+            ray ^= RAYS[offset][first]
+        attacks |= ray
+
+    return attacks
+
+
+def rook_attacks(index, occupancy):
+    """
+    Finds every square a rook on ``index`` attacks given the bitboard of
+    occupied squares, including the first piece it hits in each direction.
+
+    :type: index: int
+    :type: occupancy: int
+    :rtype: int
+    """
+    key = occupancy & ROOK_MASKS[index]
+    table = _ROOK_ATTACKS[index]
+    attacks = table.get(key)
+    if attacks is None:
+        attacks = table[key] = _slide(index, key, CROSS_OFFSETS)
+
+    return attacks
+
+
+def bishop_attacks(index, occupancy):
+    """
+    Finds every square a bishop on ``index`` attacks given the bitboard of
+    occupied squares, including the first piece it hits in each direction.
+
+    :type: index: int
+    :type: occupancy: int
+    :rtype: int
+    """
+    key = occupancy & BISHOP_MASKS[index]
+    table = _BISHOP_ATTACKS[index]
+    attacks = table.get(key)
+    if attacks is None:
+        attacks = table[key] = _slide(index, key, DIAG_OFFSETS)
+
+    return attacks
+
+
+def iter_ray(ray, offset):
+    """
+    Yields the square indices of ``ray`` in the order a slider moving
+    along ``offset`` reaches them.
+
+    :type: ray: int
+    :type: offset: tuple
+    :rtype: gen
+    """
+    if offset[0] * 8 + offset[1] > 0:
+        while ray:
+            bit = ray & -ray
+            yield bit.bit_length() - 1
+            ray ^= bit
+    else:
+        while ray:
+            index = ray.bit_length() - 1
+            yield index
+            ray ^= 1 << index
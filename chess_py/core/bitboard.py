@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+
+"""
+Board backend which mirrors the position into 64 bit integer bitboards,
+one per color and piece type.
+
+Squares are numbered from a1 to h8 so bit ``rank * 8 + file`` of a
+bitboard is set if the square holds a piece of that type and color.
+
+| rank
+| 7 8 ║56 57 58 59 60 61 62 63
+| 6 7 ║48 49 50 51 52 53 54 55
+| 5 6 ║40 41 42 43 44 45 46 47
+| 4 5 ║32 33 34 35 36 37 38 39
+| 3 4 ║24 25 26 27 28 29 30 31
+| 2 3 ║16 17 18 19 20 21 22 23
+| 1 2 ║ 8  9 10 11 12 13 14 15
+| 0 1 ║ 0  1  2  3  4  5  6  7
+| ----╚═══════════════════════
+| ——---a  b  c  d  e  f  g  h
+
+``BitBoard`` is a drop-in replacement for ``Board``. Pieces are still
+stored in ``position`` so the piece classes, ``converter`` and ``Game``
+work unchanged, but occupancy tests, piece lookup and material counting
+are answered from the bitboards instead of scanning all 64 squares.
+
+All changes to the position must go through ``place_piece_at_square``,
+``remove_piece_at_square``, ``move_piece`` or ``update`` so the bitboards
+stay in sync.
+
+Copyright © 2016 Aubhro Sengupta. All rights reserved.
+"""
+
+
+from .board import Board, PIECE_TYPES
+from .algebraic.location import Location
+from .attack_tables import popcount, lowest_bit, iter_bits, \
+    KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, rook_attacks, bishop_attacks
+from ..pieces.bishop import Bishop
+from ..pieces.king import King
+from ..pieces.knight import Knight
+from ..pieces.pawn import Pawn
+from ..pieces.queen import Queen
+from ..pieces.rook import Rook
+
+def location_of(index):
+    """
+    Finds the ``Location`` of a bit index.
+
+    :type: index: int
+    :rtype: Location
+    """
+    return Location.from_index(index)
+
+
+class BitBoard(Board):
+    def __init__(self, position, castling_rights=None, en_passant_square=None):
+        """
+        Creates a ``BitBoard`` given an array of ``Piece`` and ``None``
+        objects to represent the given position of the board.
+
+        :type: position: list
+        :type: castling_rights: int
+        :type: en_passant_square: Location
+        """
+        self.bitboards = {True: dict.fromkeys(PIECE_TYPES, 0),
+                          False: dict.fromkeys(PIECE_TYPES, 0)}
+
+        for rank, row in enumerate(position):
+            for file, piece in enumerate(row):
+                if piece is not None:
+                    self._toggle(piece, rank * 8 + file)
+
+        super(BitBoard, self).__init__(position, castling_rights, en_passant_square)
+
+    def _toggle(self, piece, index):
+        """
+        Flips the bit of ``piece`` at ``index`` in its piece bitboard.
+        Color occupancy is kept by ``Board``.
+
+        :type: piece: Piece
+        :type: index: int
+        """
+        self.bitboards[bool(piece.color)][type(piece)] ^= 1 << index
+
+    def pieces(self):
+        """
+        Yields only the pieces on occupied squares, from a1 to h8.
+        Iterating over the board itself yields every square, as for
+        ``Board``.
+
+        :rtype: gen
+        """
+        for index in iter_bits(self.occupancy):
+            yield self.position[index >> 3][index & 7]
+
+    def _copy(self, shared):
+        """
+        Copies the board, reusing the bitboards instead of rebuilding them.
+
+        :type: shared: bool
+        :rtype: BitBoard
+        """
+        board = super(BitBoard, self)._copy(shared)
+        board.bitboards = {True: dict(self.bitboards[True]),
+                           False: dict(self.bitboards[False])}
+        return board
+
+    def is_square_empty(self, location):
+        """
+        Finds whether a chess piece occupies a square of the position.
+
+        :type: location: Location
+        :rtype: bool
+        """
+        return not (self.occupancy >> location.index) & 1
+
+    def pieces_bitboard(self, piece_type, input_color):
+        """
+        Finds the bitboard of every piece of one type and color.
+
+        :type: piece_type: type
+        :type: input_color: Color
+        :rtype: int
+        """
+        return self.bitboards[bool(input_color)][piece_type]
+
+    def is_square_attacked(self, location, by_color):
+        """
+        Finds if any piece of ``by_color`` attacks ``location`` by
+        intersecting the attack sets from ``location`` with the
+        attacker's piece bitboards.
+
+        :type: location: Location
+        :type: by_color: Color
+        :rtype: bool
+        """
+        index = location.index
+        side = bool(by_color)
+        pieces = self.bitboards[side]
+        occupancy = self.occupancy
+
+        return bool(KNIGHT_ATTACKS[index] & pieces[Knight] or
+                    PAWN_ATTACKS[not side][index] & pieces[Pawn] or
+                    KING_ATTACKS[index] & pieces[King] or
+                    rook_attacks(index, occupancy) & (pieces[Rook] | pieces[Queen]) or
+                    bishop_attacks(index, occupancy) & (pieces[Bishop] | pieces[Queen]))
+
+    def material_advantage(self, input_color, val_scheme):
+        """
+        Finds the advantage a particular side possesses given a value scheme
+        by counting the bits of each bitboard.
+
+        :type: input_color: Color
+        :type: val_scheme: PieceValues
+        :rtype: double
+        """
+        if self.get_king(input_color).in_check(self) and self.no_moves(input_color):
+            return -100
+
+        if self.get_king(-input_color).in_check(self) and self.no_moves(-input_color):
+            return 100
+
+        advantage = 0
+        for side in self.bitboards:
+            for bitboard in self.bitboards[side].values():
+                if bitboard:
+                    index = lowest_bit(bitboard)
+                    piece = self.position[index >> 3][index & 7]
+                    advantage += popcount(bitboard) * val_scheme.val(piece, input_color)
+
+        return advantage
+
+    def find_piece(self, piece):
+        """
+        Finds Location of the first piece that matches piece.
+        If none is found, Exception is raised.
+
+        :type: piece: Piece
+        :rtype: Location
+        """
+        bitboard = self.bitboards[bool(piece.color)][type(piece)]
+        if not bitboard:
+            raise ValueError("{} \nPiece not found: {}".format(self, piece))
+
+        return location_of(lowest_bit(bitboard))
+
+    def get_piece(self, piece_type, input_color):
+        """
+        Gets location of a piece on the board given the type and color.
+
+        :type: piece_type: Piece
+        :type: input_color: Color
+        :rtype: Location
+        """
+        bitboard = self.bitboards[bool(input_color)][piece_type]
+        if not bitboard:
+            raise Exception("{} \nPiece not found: {}".format(self, piece_type))
+
+        return location_of(lowest_bit(bitboard))
+
+    def remove_piece_at_square(self, location):
+        """
+        Removes piece at square
+
+        :type: location: Location
+        """
+        piece = self.position[location.rank][location.file]
+        if piece is not None:
+            self._toggle(piece, location.index)
+
+        super(BitBoard, self).remove_piece_at_square(location)
+
+    def place_piece_at_square(self, piece, location):
+        """
+        Places piece at given get_location
+
+        :type: piece: Piece
+        :type: location: Location
+        """
+        index = location.index
+        occupant = self.position[location.rank][location.file]
+        if occupant is not None:
+            self._toggle(occupant, index)
+
+        super(BitBoard, self).place_piece_at_square(piece, location)
+        self._toggle(piece, index)
@@ -24,6 +24,37 @@ Default Array
 Pieces on the board are flipped in position array so white home row is at index 0
 and black home row is at index 7
 
+The board also keeps a bitboard of the squares occupied by each color, used
+by sliding piece move generation and ``is_square_attacked``. Change the
+position through ``place_piece_at_square``, ``remove_piece_at_square``,
+``move_piece`` or ``update`` rather than assigning into ``position`` so
+it stays in sync.
+
+``zobrist_key`` is a 64 bit key of the position covering the pieces, the
+side to move, castling rights and the en passant file. The piece part is
+updated as pieces are placed and removed, and ``update`` and
+``unmake_move`` keep the rest in step, so reading it never scans the board.
+
+Moves can be generated in several modes with ``generate``:
+
+| PSEUDO    every move the pieces can make, ignoring checks and pins
+| LEGAL     only the moves that do not leave the King in check
+| CAPTURES  only the legal captures, en passant and capturing promotions
+| EVASIONS  the legal moves of a side in check
+
+The ``possible_moves`` method of each piece is pseudo legal too, and
+gives the same moves as ``PSEUDO`` except that ``King.possible_moves``
+leaves out the squares next to the enemy King, which ``PSEUDO`` keeps.
+Both only give castling moves that are legal. ``is_legal`` tests one move without generating the others, so
+a search can generate pseudo legal moves and only test those it plays.
+
+Positions can be read from and written to Forsyth-Edwards Notation,
+including the side to move, castling rights, en passant square and the
+halfmove clock and fullmove number, which ``update`` keeps counting.
+
+| board = Board.from_fen("r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3")
+| board.to_fen()
+
 | Copyright © 2016 Aubhro Sengupta. All rights reserved.
 """
 
@@ -31,13 +62,17 @@ from __future__ import print_function
 
 import inspect
 from multiprocessing import Process
-from copy import copy as cp
-from math import fabs
 
 from .color import white, black
+from .attack_tables import KNIGHT_OFFSETS, CROSS_OFFSETS, DIAG_OFFSETS, \
+    KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, SQUARES, rook_attacks, bishop_attacks, iter_bits
+from . import packed_move
 from .algebraic import notation_const
+from .algebraic.notation_const import WHITE_KING_SIDE, WHITE_QUEEN_SIDE, BLACK_KING_SIDE, BLACK_QUEEN_SIDE
 from .algebraic.location import Location
 from .algebraic.move import Move
+from .move_cache import MoveCache
+from .zobrist import PIECE_KEYS, CASTLING_KEYS, EN_PASSANT_KEYS, BLACK_TO_MOVE_KEY
 from ..pieces.piece import Piece
 from ..pieces.bishop import Bishop
 from ..pieces.king import King
@@ -46,6 +81,60 @@ from ..pieces.queen import Queen
 from ..pieces.rook import Rook
 from ..pieces.knight import Knight
 
+PIECE_TYPES = (Pawn, Knight, Bishop, Rook, Queen, King)
+
+ALL_SQUARES = (1 << 64) - 1
+
+# Promotions are generated to Queen, Rook, Bishop then Knight
+PROMOTION_FLAGS = (3, 2, 1, 0)
+
+# Modes of ``Board.generate``
+PSEUDO = "pseudo"
+LEGAL = "legal"
+CAPTURES = "captures"
+EVASIONS = "evasions"
+PSEUDO_CAPTURES = "pseudo captures"
+PSEUDO_QUIETS = "pseudo quiets"
+
+ALL_CASTLING_RIGHTS = WHITE_KING_SIDE | WHITE_QUEEN_SIDE | BLACK_KING_SIDE | BLACK_QUEEN_SIDE
+
+# Bits of ``Board._shared_ranks`` and ``Board._shared_locations`` when
+# everything is shared with another board
+ALL_RANKS = 0xFF
+ALL_LOCATION_SETS = 0xFFF
+
+# Bit of each piece location set in ``Board._shared_locations``
+_LOCATION_SET_BITS = {True: dict((piece_type, 1 << index) for index, piece_type in enumerate(PIECE_TYPES)),
+                      False: dict((piece_type, 1 << index + 6) for index, piece_type in enumerate(PIECE_TYPES))}
+
+# Castling rights kept by a move from or to each square
+CASTLING_MASKS = tuple(ALL_CASTLING_RIGHTS & ~{0: WHITE_QUEEN_SIDE,
+                                               4: WHITE_KING_SIDE | WHITE_QUEEN_SIDE,
+                                               7: WHITE_KING_SIDE,
+                                               56: BLACK_QUEEN_SIDE,
+                                               60: BLACK_KING_SIDE | BLACK_QUEEN_SIDE,
+                                               63: BLACK_KING_SIDE}.get(index, 0)
+                       for index in range(64))
+
+STARTING_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+_FEN_PIECE_TYPES = {"p": Pawn, "n": Knight, "b": Bishop, "r": Rook, "q": Queen, "k": King}
+
+# Shared instance of the piece of each FEN letter on each square index
+_FEN_PIECES = dict((letter.upper() if side else letter,
+                    tuple(piece_type(white if side else black, SQUARES[index]) for index in range(64)))
+                   for letter, piece_type in _FEN_PIECE_TYPES.items() for side in (True, False))
+
+_FEN_LETTERS = dict(((piece_type, side), letter.upper() if side else letter)
+                    for letter, piece_type in _FEN_PIECE_TYPES.items() for side in (True, False))
+
+_FEN_EMPTY = dict((str(count), [None] * count) for count in range(1, 9))
+
+_FEN_CASTLING = (("K", WHITE_KING_SIDE), ("Q", WHITE_QUEEN_SIDE),
+                 ("k", BLACK_KING_SIDE), ("q", BLACK_QUEEN_SIDE))
+
+_FEN_CASTLING_RIGHTS = dict(_FEN_CASTLING)
+
 
 class Board:
     """
@@ -54,21 +143,71 @@ class Board:
 
     """
 
-    def __init__(self, position):
+    def __init__(self, position, castling_rights=None, en_passant_square=None):
         """
         Creates a ``Board`` given an array of ``Piece`` and ``None``
         objects to represent the given position of the board.
 
+        ``castling_rights`` is a mask of ``WHITE_KING_SIDE``,
+        ``WHITE_QUEEN_SIDE``, ``BLACK_KING_SIDE`` and ``BLACK_QUEEN_SIDE``.
+        If it is not given, a side may castle with every Rook still on
+        its corner while its King is on the e-file of its home rank.
+        ``en_passant_square`` is the square a pawn that just moved two
+        steps passed over, if any.
+
         :type: position: list
+        :type: castling_rights: int
+        :type: en_passant_square: Location
         """
         self.position = position
-        self.possible_moves = dict()
+        self.move_cache = MoveCache()
+        self._legality = None
+        self.side_to_move = white
+        self.halfmove_clock = 0
+        self.fullmove_number = 1
+        self._shared_ranks = 0
+        self._shared_locations = 0
+        self.piece_locations = {True: dict((piece_type, set()) for piece_type in PIECE_TYPES),
+                                False: dict((piece_type, set()) for piece_type in PIECE_TYPES)}
+        # Same as calling _add_piece_location for every piece, which
+        # is too slow for boards built by the million from FEN
+        occupancy = {True: 0, False: 0}
+        pieces_key = 0
+        locations = self.piece_locations
+        index = -1
+        for row in position:
+            for piece in row:
+                index += 1
+                if piece is None:
+                    continue
+
+                location = SQUARES[index]
+                if piece.location is not location:
+                    row[index & 7] = piece = piece.at(location)
+
+                # Pieces only hold the shared white and black
+                side = piece.color is white
+                piece_type = type(piece)
+                occupancy[side] |= 1 << index
+                locations[side][piece_type].add(location)
+                pieces_key ^= PIECE_KEYS[side][piece_type][index]
+
+        self.color_occupancy = occupancy
+        self._pieces_key = pieces_key
+
         try:
             self.king_loc_dict = {white: self.find_king(white),
                                   black: self.find_king(black)}
         except ValueError:
             self.king_loc_dict = None
 
+        if castling_rights is None:
+            castling_rights = self._default_castling_rights()
+
+        self.castling_rights = castling_rights
+        self.en_passant_square = en_passant_square
+        self._state_key = self._calc_state_key()
+
     @classmethod
     def init_default(cls):
         """
@@ -107,15 +246,185 @@ class Board:
              Knight(black, Location(7, 6)), Rook(black, Location(7, 7))]
         ])
 
+    @classmethod
+    def from_fen(cls, fen):
+        """
+        Creates a board from a position in Forsyth-Edwards Notation.
+        The halfmove clock and fullmove number may be left out, as in
+        EPD, and are then 0 and 1.
+
+        :type: fen: str
+        :rtype: Board
+        """
+        fields = fen.split()
+        if len(fields) != 6 and len(fields) != 4:
+            raise ValueError("FEN must have 4 or 6 fields: {}".format(fen))
+
+        rows = fields[0].split("/")
+        if len(rows) != 8:
+            raise ValueError("FEN must have 8 ranks: {}".format(fen))
+
+        position = []
+        for rank in range(8):
+            squares = []
+            for char in rows[7 - rank]:
+                empty = _FEN_EMPTY.get(char)
+                if empty is not None:
+                    squares += empty
+                elif char in _FEN_PIECES and len(squares) < 8:
+                    squares.append(_FEN_PIECES[char][rank * 8 + len(squares)])
+                else:
+                    raise ValueError("Invalid rank {} in FEN: {}".format(rows[7 - rank], fen))
+
+            if len(squares) != 8:
+                raise ValueError("Invalid rank {} in FEN: {}".format(rows[7 - rank], fen))
+            position.append(squares)
+
+        if fields[1] != "w" and fields[1] != "b":
+            raise ValueError("Invalid side to move in FEN: {}".format(fen))
+
+        castling_rights = 0
+        if fields[2] != "-":
+            for char in fields[2]:
+                if char not in _FEN_CASTLING_RIGHTS:
+                    raise ValueError("Invalid castling rights in FEN: {}".format(fen))
+                castling_rights |= _FEN_CASTLING_RIGHTS[char]
+
+        en_passant_square = None
+        if fields[3] != "-":
+            # The pawn that just moved two steps must stand in front of
+            # the square, with the square it passed and left empty
+            rank_char, pawn_rank, start_rank, pawn = ("6", 4, 6, "p") if fields[1] == "w" else ("3", 3, 1, "P")
+            if len(fields[3]) != 2 or fields[3][0] not in "abcdefgh" or fields[3][1] != rank_char:
+                raise ValueError("Invalid en passant square in FEN: {}".format(fen))
+
+            en_passant_square = Location.from_string(fields[3])
+            file = en_passant_square.file
+            if position[pawn_rank][file] is not _FEN_PIECES[pawn][pawn_rank * 8 + file] or \
+                    position[en_passant_square.rank][file] is not None or position[start_rank][file] is not None:
+                raise ValueError("No pawn can be taken en passant in FEN: {}".format(fen))
+
+        board = cls(position, castling_rights, en_passant_square)
+        board.side_to_move = white if fields[1] == "w" else black
+
+        # Rights the placement cannot support, such as a King off its
+        # home square, are dropped
+        board.castling_rights &= board._default_castling_rights()
+        board._state_key = board._calc_state_key()
+
+        if len(fields) == 6:
+            board.halfmove_clock = int(fields[4])
+            board.fullmove_number = int(fields[5])
+            if board.halfmove_clock < 0 or board.fullmove_number < 1:
+                raise ValueError("Invalid move counters in FEN: {}".format(fen))
+
+        return board
+
+    def to_fen(self):
+        """
+        Writes the position in Forsyth-Edwards Notation.
+
+        :rtype: str
+        """
+        rows = []
+        for row in reversed(self.position):
+            text = ""
+            empty = 0
+            for piece in row:
+                if piece is None:
+                    empty += 1
+                    continue
+
+                if empty:
+                    text += str(empty)
+                    empty = 0
+                text += _FEN_LETTERS[type(piece), bool(piece.color)]
+
+            rows.append(text + str(empty) if empty else text)
+
+        castling = "".join(char for char, right in _FEN_CASTLING if self.castling_rights & right) or "-"
+        en_passant = "-" if self.en_passant_square is None else str(self.en_passant_square)
+
+        return "{} {} {} {} {} {}".format("/".join(rows), "w" if self.side_to_move == white else "b",
+                                          castling, en_passant, self.halfmove_clock, self.fullmove_number)
+
+    @property
+    def occupancy(self):
+        """
+        Bitboard of every occupied square, with bit ``rank * 8 + file``
+        set if the square holds a piece.
+
+        :rtype: int
+        """
+        return self.color_occupancy[True] | self.color_occupancy[False]
+
     @property
     def position_tuple(self):
-        return ((str(piece) for piece in self.position[index]) for index, row in enumerate(self.position))
+        return tuple(tuple(str(piece) for piece in row) for row in self.position)
+
+    def _default_castling_rights(self):
+        """
+        Finds the castling rights of a position whose history is not
+        known: every Rook on its corner may castle with a King on the
+        e-file of the same home rank.
+
+        :rtype: int
+        """
+        rights = 0
+        for input_color, rank, king_side, queen_side in ((white, 0, WHITE_KING_SIDE, WHITE_QUEEN_SIDE),
+                                                         (black, 7, BLACK_KING_SIDE, BLACK_QUEEN_SIDE)):
+            king = self.position[rank][4]
+            if type(king) is not King or king.color != input_color:
+                continue
+
+            for file, right in ((7, king_side), (0, queen_side)):
+                rook = self.position[rank][file]
+                if type(rook) is Rook and rook.color == input_color:
+                    rights |= right
+
+        return rights
+
+    @property
+    def zobrist_key(self):
+        """
+        64 bit Zobrist key of the position. Positions with the same
+        pieces on the same squares, side to move, castling rights and
+        en passant file share a key.
+
+        :rtype: int
+        """
+        return self._pieces_key ^ self._state_key
+
+    def _calc_state_key(self):
+        """
+        Builds the part of the Zobrist key that does not depend on
+        where the pieces stand. The en passant file is only part of the
+        key when a pawn of the side to move could capture there, so
+        positions reached by a double pawn push that cannot be taken
+        share the key of the same position reached otherwise.
+
+        :rtype: int
+        """
+        key = CASTLING_KEYS[self.castling_rights]
+        if self.side_to_move == black:
+            key ^= BLACK_TO_MOVE_KEY
+
+        en_passant = self.en_passant_square
+        if en_passant is not None:
+            side = bool(self.side_to_move)
+            for index in iter_bits(PAWN_ATTACKS[not side][en_passant.index]):
+                pawn = self.position[index >> 3][index & 7]
+                if type(pawn) is Pawn and bool(pawn.color) == side:
+                    key ^= EN_PASSANT_KEYS[en_passant.file]
+                    break
+
+        return key
 
     def __key(self):
         return self.position
 
     def __hash__(self):
-        return hash(tuple([hash(piece) for piece in self]))
+        return self._pieces_key
 
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
@@ -156,13 +465,70 @@ class Board:
 
     def __copy__(self):
         """
-        Copies the board faster than deepcopy
+        Copies the board faster than deepcopy. Pieces are immutable
+        so only the rows and the bookkeeping are copied.
 
         :rtype: Board
         """
-        return Board([[cp(piece) or None
-                       for piece in self.position[index]]
-                      for index, row in enumerate(self.position)])
+        return self._copy(shared=False)
+
+    def _copy(self, shared):
+        """
+        Copies the board. The move cache is always shared, since it is
+        keyed by Zobrist key and holds moves for any position. If
+        ``shared`` is set the rank lists and piece location sets are
+        shared with the copy too instead of copied, and both boards
+        copy a rank or set the first time they change it.
+
+        :type: shared: bool
+        :rtype: Board
+        """
+        board = self.__class__.__new__(self.__class__)
+        board.side_to_move = self.side_to_move
+        board.halfmove_clock = self.halfmove_clock
+        board.fullmove_number = self.fullmove_number
+        board.castling_rights = self.castling_rights
+        board.en_passant_square = self.en_passant_square
+        board._pieces_key = self._pieces_key
+        board._state_key = self._state_key
+        board.color_occupancy = dict(self.color_occupancy)
+        board.king_loc_dict = None if self.king_loc_dict is None else dict(self.king_loc_dict)
+        board.move_cache = self.move_cache
+        board._legality = None
+
+        if shared:
+            board.position = list(self.position)
+            board.piece_locations = dict((side, dict(self.piece_locations[side]))
+                                         for side in self.piece_locations)
+            board._shared_ranks = self._shared_ranks = ALL_RANKS
+            board._shared_locations = self._shared_locations = ALL_LOCATION_SETS
+        else:
+            board.position = [list(row) for row in self.position]
+            board.piece_locations = dict((side, dict((piece_type, set(locations))
+                                                     for piece_type, locations in self.piece_locations[side].items()))
+                                         for side in self.piece_locations)
+            board._shared_ranks = 0
+            board._shared_locations = 0
+
+        return board
+
+    def child(self, move):
+        """
+        Finds the board after ``move`` without changing this board.
+
+        The child shares every rank, piece location set and the move
+        cache with this board, and either board only copies what a
+        later move changes. Storing every board of a search tree this
+        way costs little more than the squares each move touched.
+
+        ``move`` may be a ``Move`` or a packed move from ``packed_moves``.
+
+        :type: move: Move
+        :rtype: Board
+        """
+        board = self._copy(shared=True)
+        board.make_move(move)
+        return board
 
     def piece_at_square(self, location):
         """
@@ -182,6 +548,45 @@ class Board:
         """
         return self.position[location.rank][location.file] is None
 
+    def _has_piece_of_type(self, squares, piece_types):
+        """
+        Finds if any square in the bitboard ``squares`` holds
+        a piece whose type is one of ``piece_types``.
+
+        :type: squares: int
+        :type: piece_types: tuple
+        :rtype: bool
+        """
+        position = self.position
+        for index in iter_bits(squares):
+            if type(position[index >> 3][index & 7]) in piece_types:
+                return True
+
+        return False
+
+    def is_square_attacked(self, location, by_color):
+        """
+        Finds if any piece of ``by_color`` attacks ``location``.
+        Instead of generating the opponent's moves, looks outward
+        from ``location`` along knight jumps, pawn diagonals,
+        king steps and sliding rays for a matching attacker.
+
+        :type: location: Location
+        :type: by_color: Color
+        :rtype: bool
+        """
+        index = location.index
+        side = bool(by_color)
+        attackers = self.color_occupancy[side]
+        occupancy = attackers | self.color_occupancy[not side]
+
+        # Pawns of by_color attack from where the other side's pawns would capture
+        return self._has_piece_of_type(KNIGHT_ATTACKS[index] & attackers, (Knight,)) or \
+            self._has_piece_of_type(PAWN_ATTACKS[not side][index] & attackers, (Pawn,)) or \
+            self._has_piece_of_type(KING_ATTACKS[index] & attackers, (King,)) or \
+            self._has_piece_of_type(rook_attacks(index, occupancy) & attackers, (Rook, Queen)) or \
+            self._has_piece_of_type(bishop_attacks(index, occupancy) & attackers, (Bishop, Queen))
+
     def material_advantage(self, input_color, val_scheme):
         """
         Finds the advantage a particular side possesses given a value scheme.
@@ -197,7 +602,8 @@ class Board:
         if self.get_king(-input_color).in_check(self) and self.no_moves(-input_color):
             return 100
 
-        return sum([val_scheme.val(piece, input_color) for piece in self])
+        return sum([val_scheme.val(piece, input_color)
+                    for piece in self.pieces_of(white) + self.pieces_of(black)])
 
     def advantage_as_result(self, move, val_scheme):
         """
@@ -207,62 +613,383 @@ class Board:
         :type: val_scheme: PieceValues
         :rtype: double
         """
-        test_board = cp(self)
-        test_board.update(move)
-        return test_board.material_advantage(move.color, val_scheme)
+        undo = self.make_move(move)
+        advantage = self.material_advantage(move.color, val_scheme)
+        self.unmake_move(undo)
+        return advantage
 
     def all_possible_moves(self, input_color):
         """
-        Checks if all the possible moves has already been calculated
-        and is stored in `possible_moves` dictionary. If not, it is calculated
-        with `_calc_all_possible_moves`.
-        
+        Finds every legal move of input_color. The moves are built as
+        ``Move`` objects from the packed moves of ``packed_moves``.
+
         :type: input_color: Color
         :rtype: list
         """
-        position_tuple = self.position_tuple
-        if position_tuple not in self.possible_moves:
-            self.possible_moves[position_tuple] = tuple(self._calc_all_possible_moves(input_color))
+        return [packed_move.to_move(move, self) for move in self.packed_moves(input_color)]
+
+    def packed_moves(self, input_color):
+        """
+        Checks if all the legal moves of input_color have already been
+        calculated and are stored in the ``move_cache``. If not, they are
+        generated as packed ints with ``_calc_packed_moves`` and cached
+        under the Zobrist key and the side to move.
+
+        :type: input_color: Color
+        :rtype: tuple
+        """
+        key = self.zobrist_key, bool(input_color)
+        moves = self.move_cache.get(key)
+        if moves is None:
+            moves = tuple(self._calc_packed_moves(input_color))
+            self.move_cache.put(key, moves)
 
-        return self.possible_moves[position_tuple]
+        return moves
 
-    def _calc_all_possible_moves(self, input_color):
+    def staged_moves(self, input_color, tt_move=0, killers=()):
         """
-        Returns list of all possible moves
+        Finds the legal packed moves of input_color in the order a
+        search should try them, generated and tested for legality one
+        stage at a time. See ``MovePicker``.
 
         :type: input_color: Color
+        :type: tt_move: int
+        :type: killers: tuple
+        :rtype: MovePicker
+        """
+        from .move_picker import MovePicker
+        return MovePicker(self, input_color, tt_move, killers)
+
+    def pieces_of(self, input_color, piece_type=None):
+        """
+        Finds every piece of input_color, or only those of ``piece_type``
+        if it is given, without scanning the board.
+
+        :type: input_color: Color
+        :type: piece_type: type
         :rtype: list
         """
-        for piece in self:
+        locations = self.piece_locations[bool(input_color)]
+        if piece_type is not None:
+            return [self.position[loc.rank][loc.file] for loc in locations.get(piece_type, ())]
+
+        return [self.position[loc.rank][loc.file]
+                for piece_type in locations
+                for loc in locations[piece_type]]
+
+    def king_square(self, input_color):
+        """
+        Finds the Location of the King of input_color without
+        scanning the board. Returns ``None`` if there is no King.
 
-            # Tests if square on the board is not empty
-            if piece is not None and piece.color == input_color:
+        :type: input_color: Color
+        :rtype: Location
+        """
+        for location in self.piece_locations[bool(input_color)][King]:
+            return location
 
-                for move in piece.possible_moves(self):
+        return None
 
-                    test = cp(self)
-                    test_move = Move(end_loc=move.end_loc,
-                                     piece=test.piece_at_square(move.start_loc),
-                                     status=move.status,
-                                     start_loc=move.start_loc,
-                                     promoted_to_piece=move.promoted_to_piece)
-                    test.update(test_move)
+    def _checks_and_pins(self, king_loc, input_color):
+        """
+        Finds the pieces checking the King of input_color and the pieces
+        pinned to it. Each checker is given as a bit mask of the squares
+        that resolve the check: the checker itself and, for sliding
+        pieces, the squares in between. Pins map the pinned piece's square
+        index to the mask of squares it may still move to.
 
-                    if self.king_loc_dict is None:
-                        yield move
-                        continue
+        Squares are indexed ``rank * 8 + file``.
 
-                    my_king = test.piece_at_square(self.king_loc_dict[input_color])
+        :type: king_loc: Location
+        :type: input_color: Color
+        :rtype: tuple
+        """
+        position = self.position
+        rank = king_loc.rank
+        file = king_loc.file
+        checkers = []
+        pins = {}
+
+        for rank_offset, file_offset in KNIGHT_OFFSETS:
+            r, f = rank + rank_offset, file + file_offset
+            if 0 <= r < 8 and 0 <= f < 8:
+                piece = position[r][f]
+                if type(piece) is Knight and piece.color != input_color:
+                    checkers.append(1 << (r * 8 + f))
+
+        # Enemy pawns check from the squares diagonally in front of the King
+        pawn_rank = rank + 1 if input_color == white else rank - 1
+        if 0 <= pawn_rank < 8:
+            for f in (file - 1, file + 1):
+                if 0 <= f < 8:
+                    piece = position[pawn_rank][f]
+                    if type(piece) is Pawn and piece.color != input_color:
+                        checkers.append(1 << (pawn_rank * 8 + f))
+
+        for offsets, sliders in ((CROSS_OFFSETS, (Rook, Queen)),
+                                 (DIAG_OFFSETS, (Bishop, Queen))):
+            for rank_offset, file_offset in offsets:
+                r, f = rank + rank_offset, file + file_offset
+                ray = 0
+                blocker = None
+                while 0 <= r < 8 and 0 <= f < 8:
+                    ray |= 1 << (r * 8 + f)
+                    piece = position[r][f]
+                    if piece is not None:
+                        if piece.color == input_color:
+                            if blocker is not None:
+                                break
+                            blocker = r * 8 + f
+                        else:
+                            if type(piece) in sliders:
+                                if blocker is None:
+                                    checkers.append(ray)
+                                else:
+                                    pins[blocker] = ray
+                            break
+
+                    r += rank_offset
+                    f += file_offset
+
+        return checkers, pins
+
+    def _legal_king_move(self, king_loc, end):
+        """
+        Finds if a non-castling King move onto square index ``end``
+        lands on a safe square. The King is lifted off the board during
+        the test so it does not block rays through its own square.
 
-                    if my_king is None or \
-                            not isinstance(my_king, King) or \
-                            my_king.color != input_color:
-                        self.king_loc_dict[input_color] = test.find_king(input_color)
-                        my_king = test.piece_at_square(self.king_loc_dict[input_color])
+        :type: king_loc: Location
+        :type: end: int
+        :rtype: bool
+        """
+        king = self.piece_at_square(king_loc)
+        self.remove_piece_at_square(king_loc)
+        attacked = self.is_square_attacked(SQUARES[end], -king.color)
+        self.place_piece_at_square(king, king_loc)
+        return not attacked
 
-                    if not my_king.in_check(test):
+    def _castle_moves(self, king):
+        """
+        Yields the packed castling moves of ``king``, which must not be
+        in check. The King must be on its home square and the side must
+        still have the castling right, every
+        square between the King and Rook must be empty and the King may
+        not cross an attacked square.
+
+        :type: king: King
+        :rtype: gen
+        """
+        rights = self.castling_rights & (WHITE_KING_SIDE | WHITE_QUEEN_SIDE
+                                         if king.color == white else
+                                         BLACK_KING_SIDE | BLACK_QUEEN_SIDE)
+        home_rank = 0 if king.color == white else 7
+        if not rights or king.location is not SQUARES[home_rank * 8 + 4]:
+            return
+
+        rank = king.location.rank
+        file = king.location.file
+        occupancy = self.occupancy
+
+        for rook_file, step, flag, right in ((7, 1, packed_move.KING_CASTLE, WHITE_KING_SIDE | BLACK_KING_SIDE),
+                                             (0, -1, packed_move.QUEEN_CASTLE, WHITE_QUEEN_SIDE | BLACK_QUEEN_SIDE)):
+            rook = self.position[home_rank][rook_file]
+            if not rights & right or type(rook) is not Rook or rook.color != king.color:
+                continue
+
+            low, high = sorted((file, rook_file))
+            path = [rank * 8 + path_file for path_file in range(low + 1, high)]
+            crossed = [rank * 8 + file + step, rank * 8 + file + 2 * step]
+            if any(occupancy >> index & 1 for index in path + crossed) or \
+                    any(self.is_square_attacked(SQUARES[index], -king.color) for index in crossed):
+                continue
+
+            yield packed_move.pack(rank * 8 + file, rank * 8 + file + 2 * step, flag)
+
+    @staticmethod
+    def _piece_attacks(piece_type, index, occupancy):
+        """
+        Finds the squares a Knight, Bishop, Rook or Queen on ``index`` attacks.
+
+        :type: piece_type: type
+        :type: index: int
+        :type: occupancy: int
+        :rtype: int
+        """
+        if piece_type is Knight:
+            return KNIGHT_ATTACKS[index]
+        if piece_type is Bishop:
+            return bishop_attacks(index, occupancy)
+        if piece_type is Rook:
+            return rook_attacks(index, occupancy)
+
+        return rook_attacks(index, occupancy) | bishop_attacks(index, occupancy)
+
+    def _calc_packed_moves(self, input_color, captures=True, quiets=True, legal=True,
+                           start_squares=ALL_SQUARES):
+        """
+        Generates the moves of input_color as packed ints.
+
+        Checkers and pinned pieces are found once per position. In
+        double check only King moves are considered; otherwise moves
+        must land inside the check mask, and pinned pieces must stay on
+        their pin ray. King moves are tested against attacks on the
+        destination. Only en passant, which can uncover a check along
+        the rank by removing two pawns at once, is tested by playing it.
+        Without a King on the board every pseudo legal move is generated.
+
+        If ``legal`` is not set none of these tests are made, except
+        that castling is always checked in full, and the moves are
+        pseudo legal. ``captures`` and ``quiets`` choose which kinds of
+        move are generated. Captures include en passant and capturing
+        promotions; quiet moves include castling and other promotions.
+        Only pieces on ``start_squares`` are moved.
+
+        :type: input_color: Color
+        :type: captures: bool
+        :type: quiets: bool
+        :type: legal: bool
+        :type: start_squares: int
+        :rtype: gen
+        """
+        side = bool(input_color)
+        own = self.color_occupancy[side]
+        enemy = self.color_occupancy[not side]
+        occupancy = own | enemy
+        locations = self.piece_locations[side]
+        pack = packed_move.pack
+
+        targets = (enemy if captures else 0) | (~occupancy & ALL_SQUARES if quiets else 0)
+
+        king_loc = self.king_square(input_color)
+        checkers, pins = [], {}
+        if king_loc is not None:
+            if legal:
+                checkers, pins = self._checks_and_pins(king_loc, input_color)
+
+            king_index = king_loc.index
+            if start_squares >> king_index & 1:
+                for end in iter_bits(KING_ATTACKS[king_index] & targets):
+                    if not legal or self._legal_king_move(king_loc, end):
+                        yield pack(king_index, end, packed_move.CAPTURE if enemy >> end & 1 else packed_move.QUIET)
+
+                in_check = checkers if legal else self.is_square_attacked(king_loc, -input_color)
+                if quiets and not in_check:
+                    for move in self._castle_moves(self.position[king_loc.rank][king_loc.file]):
                         yield move
 
+            if len(checkers) > 1:
+                return
+
+        if checkers:
+            targets &= checkers[0]
+
+        for piece_type in (Knight, Bishop, Rook, Queen):
+            for loc in list(locations[piece_type]):
+                start = loc.index
+                if not start_squares >> start & 1:
+                    continue
+
+                attacks = self._piece_attacks(piece_type, start, occupancy)
+                for end in iter_bits(attacks & targets & pins.get(start, ALL_SQUARES)):
+                    yield pack(start, end, packed_move.CAPTURE if enemy >> end & 1 else packed_move.QUIET)
+
+        forward = 8 if side else -8
+        home_rank, last_rank, en_passant_rank = (1, 6, 4) if side else (6, 1, 3)
+        en_passant = self.en_passant_square if captures else None
+
+        for loc in list(locations[Pawn]):
+            start = loc.index
+            if not start_squares >> start & 1:
+                continue
+
+            allowed = targets & pins.get(start, ALL_SQUARES)
+
+            one_step = start + forward
+            if 0 <= one_step < 64 and not occupancy >> one_step & 1:
+                if allowed >> one_step & 1:
+                    if loc.rank == last_rank:
+                        for promotion in PROMOTION_FLAGS:
+                            yield pack(start, one_step, packed_move.PROMOTION | promotion)
+                    else:
+                        yield pack(start, one_step)
+
+                two_steps = one_step + forward
+                if loc.rank == home_rank and not occupancy >> two_steps & 1 and allowed >> two_steps & 1:
+                    yield pack(start, two_steps, packed_move.DOUBLE_PAWN_PUSH)
+
+            for end in iter_bits(PAWN_ATTACKS[side][start] & enemy & allowed):
+                if loc.rank == last_rank:
+                    for promotion in PROMOTION_FLAGS:
+                        yield pack(start, end, packed_move.CAPTURE_PROMOTION | promotion)
+                else:
+                    yield pack(start, end, packed_move.CAPTURE)
+
+            if en_passant is not None and loc.rank == en_passant_rank and \
+                    PAWN_ATTACKS[side][start] >> en_passant.index & 1:
+                pawn = self.position[loc.rank][en_passant.file]
+                if type(pawn) is not Pawn or pawn.color == input_color:
+                    continue
+
+                move = pack(start, en_passant.index, packed_move.EN_PASSANT)
+                if legal and not self._legal_en_passant(move, king_loc, input_color):
+                    continue
+
+                yield move
+
+    def _legal_en_passant(self, move, king_loc, input_color):
+        """
+        Finds if the en passant capture ``move`` leaves the King of
+        input_color safe by playing it.
+
+        :type: move: int
+        :type: king_loc: Location
+        :type: input_color: Color
+        :rtype: bool
+        """
+        if king_loc is None:
+            return True
+
+        undo = self.make_move(move)
+        in_check = self.is_square_attacked(king_loc, -input_color)
+        self.unmake_move(undo)
+        return not in_check
+
+    def _is_legal_packed(self, move, input_color, king_loc, checkers, pins):
+        """
+        Finds if the pseudo legal packed ``move`` of input_color is
+        legal given the checkers and pins found by ``_checks_and_pins``
+        for the King on ``king_loc``.
+
+        :type: move: int
+        :type: input_color: Color
+        :type: king_loc: Location
+        :type: checkers: list
+        :type: pins: dict
+        :rtype: bool
+        """
+        if king_loc is None:
+            return True
+
+        start = move & 63
+        end = move >> 6 & 63
+        flag = move >> 12
+
+        if start == king_loc.index:
+            if flag == packed_move.KING_CASTLE or flag == packed_move.QUEEN_CASTLE:
+                # Castling is only generated when it is legal
+                return True
+            return self._legal_king_move(king_loc, end)
+
+        if len(checkers) > 1:
+            return False
+
+        if flag == packed_move.EN_PASSANT:
+            return self._legal_en_passant(move, king_loc, input_color)
+
+        allowed = (checkers[0] if checkers else ALL_SQUARES) & pins.get(start, ALL_SQUARES)
+        return bool(allowed >> end & 1)
+
     def runInParallel(*fns):
         """
         Runs multiple processes in parallel.
@@ -277,23 +1004,126 @@ class Board:
         for p in proc:
             p.join()
 
-    def no_moves(self, input_color):
+    def generate(self, input_color, mode=LEGAL):
+        """
+        Generates the packed moves of input_color in ``mode``, one of
+        ``PSEUDO``, ``LEGAL``, ``CAPTURES``, ``EVASIONS``,
+        ``PSEUDO_CAPTURES`` or ``PSEUDO_QUIETS``. Unlike ``packed_moves``
+        the moves are not cached. ``EVASIONS`` may only be used while
+        input_color is in check. The last two modes split the pseudo
+        legal moves into captures, including en passant and capturing
+        promotions, and the rest, so they can be tested one at a time
+        with ``is_legal``.
+
+        :type: input_color: Color
+        :type: mode: str
+        :rtype: gen
+        """
+        if mode == PSEUDO:
+            return self._calc_packed_moves(input_color, legal=False)
+        if mode == LEGAL:
+            return self._calc_packed_moves(input_color)
+        if mode == CAPTURES:
+            return self._calc_packed_moves(input_color, quiets=False)
+        if mode == EVASIONS:
+            king_loc = self.king_square(input_color)
+            if king_loc is None or not self.is_square_attacked(king_loc, -input_color):
+                raise ValueError("{} is not in check".format(input_color))
+
+            # In check the legal moves are exactly the evasions
+            return self._calc_packed_moves(input_color)
+        if mode == PSEUDO_CAPTURES:
+            return self._calc_packed_moves(input_color, quiets=False, legal=False)
+        if mode == PSEUDO_QUIETS:
+            return self._calc_packed_moves(input_color, captures=False, legal=False)
+
+        raise ValueError("Unknown move generation mode {}".format(mode))
+
+    def _is_pseudo_legal(self, move, input_color):
+        """
+        Finds if the packed ``move`` is one of the pseudo legal moves
+        of the piece of input_color it starts from, generating the moves
+        of that piece only.
 
-        # Loops through columns
-        for piece in self:
+        :type: move: int
+        :type: input_color: Color
+        :rtype: bool
+        """
+        return move in self._calc_packed_moves(input_color, legal=False,
+                                               start_squares=1 << (move & 63))
+
+    def is_legal(self, move, pseudo_legal=False):
+        """
+        Finds if ``move`` is legal without generating any other move.
+        The side making it is the owner of the piece it starts from.
+        ``move`` may be a ``Move`` or a packed move. If it is already
+        known to be pseudo legal, for example because it came from
+        ``generate`` in ``PSEUDO`` mode, set ``pseudo_legal`` to skip
+        testing that again. Checkers and pins are found once and reused
+        while the position stays the same, so testing many moves of one
+        position in turn is cheap.
+
+        :type: move: Move
+        :type: pseudo_legal: bool
+        :rtype: bool
+        """
+        if isinstance(move, Move):
+            move = packed_move.from_move(move)
 
-            # Tests if square on the board is not empty
-            if piece is not None and piece.color == input_color:
+        piece = self.position[move >> 3 & 7][move & 7]
+        if piece is None:
+            return False
 
-                for move in piece.possible_moves(self):
+        input_color = piece.color
+        if not pseudo_legal and not self._is_pseudo_legal(move, input_color):
+            return False
 
-                    test = cp(self)
-                    test.update(move)
+        king_loc, checkers, pins = self._legality_of(input_color)
+        return self._is_legal_packed(move, input_color, king_loc, checkers, pins)
 
-                    if not test.get_king(input_color).in_check(test):
-                        return False
+    def _legality_of(self, input_color):
+        """
+        Finds the King of input_color with the checkers and pins found
+        by ``_checks_and_pins``, kept under the Zobrist key until the
+        position changes.
 
-        return True
+        :type: input_color: Color
+        :rtype: tuple
+        """
+        key = self.zobrist_key, bool(input_color)
+        legality = self._legality
+        if legality is None or legality[0] != key:
+            king_loc = self.king_square(input_color)
+            checkers, pins = ([], {}) if king_loc is None else self._checks_and_pins(king_loc, input_color)
+            legality = self._legality = key, king_loc, checkers, pins
+
+        return legality[1:]
+
+    def has_legal_move(self, input_color):
+        """
+        Finds if ``input_color`` has a legal move, stopping at the first
+        one found. Moves already in the ``move_cache`` are used instead.
+
+        :type: input_color: Color
+        :rtype: bool
+        """
+        key = self.zobrist_key, bool(input_color)
+        if key in self.move_cache:
+            return len(self.move_cache.get(key)) > 0
+
+        for _ in self._calc_packed_moves(input_color):
+            return True
+
+        return False
+
+    def no_moves(self, input_color):
+        """
+        Finds if ``input_color`` has no legal moves.
+
+        :type: input_color: Color
+        :rtype: bool
+        """
+        return not self.has_legal_move(input_color)
 
     def find_piece(self, piece):
         """
@@ -303,15 +1133,11 @@ class Board:
         :type: piece: Piece
         :rtype: Location
         """
-        for i, _ in enumerate(self.position):
-            for j, _ in enumerate(self.position):
-                loc = Location(i, j)
-
-                if not self.is_square_empty(loc) and \
-                        self.piece_at_square(loc) == piece:
-                    return loc
+        locations = self.piece_locations[bool(piece.color)].get(type(piece))
+        if not locations:
+            raise ValueError("{} \nPiece not found: {}".format(self, piece))
 
-        raise ValueError("{} \nPiece not found: {}".format(self, piece))
+        return min(locations, key=lambda loc: (loc.rank, loc.file))
 
     def get_piece(self, piece_type, input_color):
         """
@@ -321,15 +1147,11 @@ class Board:
         :type: input_color: Color 
         :rtype: Location
         """
-        for loc in self:
-            piece = self.piece_at_square(loc)
+        locations = self.piece_locations[bool(input_color)].get(piece_type)
+        if not locations:
+            raise Exception("{} \nPiece not found: {}".format(self, piece_type))
 
-            if not self.is_square_empty(loc) and \
-                    isinstance(piece, piece_type) and \
-                    piece.color == input_color:
-                return loc
-
-        raise Exception("{} \nPiece not found: {}".format(self, piece_type))
+        return min(locations, key=lambda loc: (loc.rank, loc.file))
 
     def find_king(self, input_color):
         """
@@ -338,7 +1160,11 @@ class Board:
         :type: input_color: Color
         :rtype: Location
         """
-        return self.find_piece(King(input_color, Location(0, 0)))
+        king_loc = self.king_square(input_color)
+        if king_loc is None:
+            raise ValueError("{} \nPiece not found: {}".format(self, King(input_color, Location(0, 0))))
+
+        return king_loc
 
     def get_king(self, input_color):
         """
@@ -349,23 +1175,93 @@ class Board:
         """
         return self.piece_at_square(self.find_king(input_color))
 
+    def _add_piece_location(self, piece, location):
+        """
+        Records that ``piece`` occupies ``location`` in the
+        occupancy bitboards, piece location sets and Zobrist key.
+
+        :type: piece: Piece
+        :type: location: Location
+        """
+        side = bool(piece.color)
+        index = location.index
+        self.color_occupancy[side] |= 1 << index
+        self._piece_location_set(side, type(piece)).add(location)
+        self._pieces_key ^= PIECE_KEYS[side][type(piece)][index]
+
+    def _discard_piece_location(self, piece, location):
+        """
+        Records that ``piece`` no longer occupies ``location``.
+
+        :type: piece: Piece
+        :type: location: Location
+        """
+        side = bool(piece.color)
+        index = location.index
+        self.color_occupancy[side] &= ~(1 << index)
+        self._piece_location_set(side, type(piece)).discard(location)
+        self._pieces_key ^= PIECE_KEYS[side][type(piece)][index]
+
+    def _piece_location_set(self, side, piece_type):
+        """
+        Finds the set of squares of ``piece_type`` pieces of ``side``
+        to change, copying it first if it is shared with another board.
+
+        :type: side: bool
+        :type: piece_type: type
+        :rtype: set
+        """
+        if self._shared_locations:
+            bit = _LOCATION_SET_BITS[side][piece_type]
+            if self._shared_locations & bit:
+                self.piece_locations[side][piece_type] = set(self.piece_locations[side][piece_type])
+                self._shared_locations &= ~bit
+
+        return self.piece_locations[side][piece_type]
+
+    def _rank_to_change(self, rank):
+        """
+        Finds the list of squares on ``rank`` to change, copying it
+        first if it is shared with another board.
+
+        :type: rank: int
+        :rtype: list
+        """
+        if self._shared_ranks >> rank & 1:
+            self.position[rank] = list(self.position[rank])
+            self._shared_ranks &= ~(1 << rank)
+
+        return self.position[rank]
+
     def remove_piece_at_square(self, location):
         """
         Removes piece at square
 
         :type: location: Location
         """
-        self.position[location.rank][location.file] = None
+        piece = self.position[location.rank][location.file]
+        if piece is not None:
+            self._discard_piece_location(piece, location)
+
+        self._rank_to_change(location.rank)[location.file] = None
 
     def place_piece_at_square(self, piece, location):
         """
-        Places piece at given get_location
+        Places piece at given get_location. Pieces are immutable so
+        the instance of ``piece`` for ``location`` is placed.
 
         :type: piece: Piece
         :type: location: Location
         """
-        self.position[location.rank][location.file] = piece
-        piece.location = location
+        if piece.location is not location:
+            piece = piece.at(location)
+
+        occupant = self.position[location.rank][location.file]
+        if occupant is not None:
+            self._discard_piece_location(occupant, location)
+
+        self._rank_to_change(location.rank)[location.file] = piece
+        self._add_piece_location(piece, location)
 
     def move_piece(self, initial, final):
         """
@@ -383,45 +1279,119 @@ class Board:
 
         :type: move: Move
         """
+        self.make_move(move)
+
+    def make_move(self, move):
+        """
+        Applies move in place and returns an undo token.
+        Passing the token to ``unmake_move`` restores the
+        exact prior state of the board, including the castling rights,
+        the en passant square, ``king_loc_dict``, the side to move, the
+        move counters and the Zobrist key.
+
+        ``move`` may be a ``Move`` or a packed move from ``packed_moves``.
+
+        :type: move: Move
+        :rtype: tuple
+        """
         if move is None:
             raise TypeError("Move cannot be type None")
 
-        if self.king_loc_dict is not None and isinstance(move.piece, King):
-            self.king_loc_dict[move.color] = move.end_loc
-
-        # Invalidates en-passant
-        for square in self:
-            pawn = square
-            if isinstance(pawn, Pawn):
-                pawn.just_moved_two_steps = False
-
-        # Sets King and Rook has_moved property to True is piece has moved
-        if type(move.piece) is King or type(move.piece) is Rook:
-            move.piece.has_moved = True
-
-        elif move.status == notation_const.MOVEMENT and \
-                isinstance(move.piece, Pawn) and \
-                fabs(move.end_loc.rank - move.start_loc.rank) == 2:
-            move.piece.just_moved_two_steps = True
-
-        if move.status == notation_const.KING_SIDE_CASTLE:
-            self.move_piece(Location(move.end_loc.rank, 7), Location(move.end_loc.rank, 5))
-            self.piece_at_square(Location(move.end_loc.rank, 5)).has_moved = True
-
-        elif move.status == notation_const.QUEEN_SIDE_CASTLE:
-            self.move_piece(Location(move.end_loc.rank, 0), Location(move.end_loc.rank, 3))
-            self.piece_at_square(Location(move.end_loc.rank, 3)).has_moved = True
-
-        elif move.status == notation_const.EN_PASSANT:
-            self.remove_piece_at_square(Location(move.start_loc.rank, move.end_loc.file))
-
-        elif move.status == notation_const.PROMOTE or \
-                move.status == notation_const.CAPTURE_AND_PROMOTE:
-            try:
-                self.remove_piece_at_square(move.start_loc)
-                self.place_piece_at_square(move.promoted_to_piece(move.color, move.end_loc), move.end_loc)
-            except TypeError as e:
-                raise ValueError("Promoted to piece cannot be None in Move {}\n{}".format(repr(move), e))
-            return
+        if isinstance(move, Move):
+            start_loc, end_loc, status = move.start_loc, move.end_loc, move.status
+            promoted_to_piece = move.promoted_to_piece
+        else:
+            start_loc = SQUARES[packed_move.start_index(move)]
+            end_loc = SQUARES[packed_move.end_index(move)]
+            status = packed_move.status(move)
+            promoted_to_piece = packed_move.promoted_to(move)
+
+        piece = self.piece_at_square(start_loc)
+        if piece is None:
+            raise ValueError("No piece to move in Move {}\n{}".format(repr(move), self))
+
+        if (status == notation_const.PROMOTE or
+                status == notation_const.CAPTURE_AND_PROMOTE) and \
+                promoted_to_piece is None:
+            raise ValueError("Promoted to piece cannot be None in Move {}".format(repr(move)))
+
+        rank = end_loc.rank
+        touched = [start_loc, end_loc]
+        if status == notation_const.KING_SIDE_CASTLE:
+            touched += [Location(rank, 7), Location(rank, 5)]
+        elif status == notation_const.QUEEN_SIDE_CASTLE:
+            touched += [Location(rank, 0), Location(rank, 3)]
+        elif status == notation_const.EN_PASSANT:
+            touched.append(Location(start_loc.rank, end_loc.file))
+
+        squares = [(location, self.piece_at_square(location)) for location in touched]
+
+        king_loc = None
+        if self.king_loc_dict is not None and isinstance(piece, King):
+            king_loc = piece.color, self.king_loc_dict[piece.color]
+            self.king_loc_dict[piece.color] = end_loc
+
+        undo = squares, king_loc, (self.side_to_move, self._state_key, self.castling_rights,
+                                   self.en_passant_square, self.halfmove_clock, self.fullmove_number)
+        self.side_to_move = -piece.color
+
+        # Pawn moves and captures reset the clock of the fifty move rule
+        if type(piece) is Pawn or squares[1][1] is not None:
+            self.halfmove_clock = 0
+        else:
+            self.halfmove_clock += 1
+
+        if piece.color is black:
+            self.fullmove_number += 1
+
+        # Moving from or to a King or Rook home square loses its rights
+        self.castling_rights &= CASTLING_MASKS[start_loc.index] & CASTLING_MASKS[end_loc.index]
+
+        if status == notation_const.MOVEMENT and \
+                isinstance(piece, Pawn) and \
+                abs(end_loc.rank - start_loc.rank) == 2:
+            self.en_passant_square = Location((start_loc.rank + end_loc.rank) // 2, start_loc.file)
+        else:
+            self.en_passant_square = None
+
+        if status == notation_const.KING_SIDE_CASTLE:
+            self.move_piece(Location(rank, 7), Location(rank, 5))
+
+        elif status == notation_const.QUEEN_SIDE_CASTLE:
+            self.move_piece(Location(rank, 0), Location(rank, 3))
+
+        elif status == notation_const.EN_PASSANT:
+            self.remove_piece_at_square(Location(start_loc.rank, end_loc.file))
+
+        elif status == notation_const.PROMOTE or \
+                status == notation_const.CAPTURE_AND_PROMOTE:
+            self.remove_piece_at_square(start_loc)
+            self.place_piece_at_square(promoted_to_piece(piece.color, end_loc), end_loc)
+
+        if status != notation_const.PROMOTE and \
+                status != notation_const.CAPTURE_AND_PROMOTE:
+            self.move_piece(start_loc, end_loc)
+
+        self._state_key = self._calc_state_key()
+        return undo
+
+    def unmake_move(self, undo):
+        """
+        Takes back a move applied by ``make_move`` given its undo token.
+        Moves must be taken back in the reverse order they were made.
+
+        :type: undo: tuple
+        """
+        squares, king_loc, state = undo
+
+        for location, piece in reversed(squares):
+            if piece is None:
+                self.remove_piece_at_square(location)
+            else:
+                self.place_piece_at_square(piece, location)
+
+        if king_loc is not None:
+            self.king_loc_dict[king_loc[0]] = king_loc[1]
 
-        self.move_piece(move.piece.location, move.end_loc)
+        self.side_to_move, self._state_key, self.castling_rights, self.en_passant_square, \
+            self.halfmove_clock, self.fullmove_number = state
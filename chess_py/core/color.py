@@ -8,7 +8,8 @@ Copyright © 2016 Aubhro Sengupta. All rights reserved.
 """
 
 
-class Color:
+class Color(object):
+    __slots__ = ('_bool',)
 
     _color_dict = {
         'white': True,
@@ -60,7 +61,7 @@ class Color:
         return hash(self.__key())
 
     def __neg__(self):
-        return Color(not self._bool)
+        return black if self._bool else white
 
     def __eq__(self, other):
         """
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+"""
+Bounded cache of legal move lists used by ``Board.all_possible_moves``.
+
+Entries are keyed by a position key and the side to move. When the
+cache is full the least recently used entry is evicted. Hits and misses
+are counted so the benefit of the cache can be measured.
+
+| cache = MoveCache(max_size=4096)
+| board.move_cache = cache
+
+Copyright © 2016 Aubhro Sengupta. All rights reserved.
+"""
+
+from collections import OrderedDict
+
+DEFAULT_MAX_SIZE = 1024
+
+
+class MoveCache:
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        """
+        Creates an empty cache holding at most ``max_size`` move lists.
+
+        :type: max_size: int
+        """
+        if max_size < 1:
+            raise ValueError("MoveCache max_size must be at least 1, not {}".format(max_size))
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        """
+        Finds the move list stored under ``key`` and marks it as
+        most recently used. Returns ``None`` on a miss.
+
+        :type: key: tuple
+        :rtype: tuple
+        """
+        moves = self._entries.pop(key, None)
+        if moves is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries[key] = moves
+        return moves
+
+    def put(self, key, moves):
+        """
+        Stores ``moves`` under ``key``, evicting the least
+        recently used entry if the cache is full.
+
+        :type: key: tuple
+        :type: moves: tuple
+        """
+        self._entries.pop(key, None)
+        self._entries[key] = moves
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Removes every entry and resets the hit and miss counters.
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self):
+        """
+        Fraction of lookups that were hits.
+
+        :rtype: float
+        """
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+
+        return self.hits / float(lookups)
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+"""
+Staged move generation for search.
+
+``MovePicker`` yields the legal packed moves of a position in the order a
+search wants to try them, generating each stage only when the previous
+one is used up and testing legality with ``Board.is_legal`` only when a
+move is pulled:
+
+| 1. the transposition table move
+| 2. captures, most valuable victim first, then least valuable attacker
+| 3. killer moves
+| 4. the other quiet moves
+
+| for move in MovePicker(board, color.white, tt_move=entry.move, killers=killers[ply]):
+|     undo = board.make_move(move)
+|     ...
+|     board.unmake_move(undo)
+|     if score >= beta:
+|         break
+
+The position must be the same every time a move is pulled, so a move
+made on it must be taken back before the next one is asked for.
+
+Copyright © 2016 Aubhro Sengupta. All rights reserved.
+"""
+
+from . import packed_move
+from .attack_tables import SQUARES
+from .board import PSEUDO_CAPTURES, PSEUDO_QUIETS
+from ..pieces.bishop import Bishop
+from ..pieces.king import King
+from ..pieces.knight import Knight
+from ..pieces.pawn import Pawn
+from ..pieces.queen import Queen
+from ..pieces.rook import Rook
+
+# Rank of each piece type when ordering captures
+_ORDER = {Pawn: 1, Knight: 2, Bishop: 3, Rook: 4, Queen: 5, King: 6}
+
+
+class MovePicker:
+    def __init__(self, position, input_color, tt_move=0, killers=()):
+        """
+        Creates a picker for the moves of input_color on ``position``.
+        ``tt_move`` and ``killers`` are packed moves, usually from a
+        ``TranspositionTable`` entry and the killer slots of the ply,
+        and are only yielded if they are legal on ``position``.
+
+        :type: position: Board
+        :type: input_color: Color
+        :type: tt_move: int
+        :type: killers: tuple
+        """
+        self.position = position
+        self.color = input_color
+        self.tt_move = tt_move
+        self.killers = killers
+
+    def __iter__(self):
+        position = self.position
+        tt_move = self.tt_move
+
+        if tt_move and self._is_own(tt_move) and position.is_legal(tt_move):
+            yield tt_move
+
+        captures = [move for move in position.generate(self.color, PSEUDO_CAPTURES)
+                    if move != tt_move]
+        captures.sort(key=self._capture_order)
+        for move in captures:
+            if position.is_legal(move, pseudo_legal=True):
+                yield move
+
+        tried = set([tt_move])
+        for move in self.killers:
+            if move in tried or move >> 12 & packed_move.CAPTURE:
+                continue
+
+            tried.add(move)
+            if self._is_own(move) and position.is_legal(move):
+                yield move
+
+        for move in position.generate(self.color, PSEUDO_QUIETS):
+            if move not in tried and position.is_legal(move, pseudo_legal=True):
+                yield move
+
+    def _capture_order(self, move):
+        """
+        Sorts captures by the value of the piece taken, then by the
+        value of the piece taking it, then by the promotion.
+
+        :type: move: int
+        :rtype: tuple
+        """
+        position = self.position
+        attacker = position.piece_at_square(SQUARES[move & 63])
+        victim = position.piece_at_square(SQUARES[move >> 6 & 63])
+        victim_order = _ORDER[Pawn] if victim is None else _ORDER[type(victim)]
+
+        promoted_to = packed_move.promoted_to(move)
+        return -victim_order, _ORDER[type(attacker)], -(_ORDER[promoted_to] if promoted_to else 0)
+
+    def _is_own(self, move):
+        """
+        Finds if ``move`` starts from a piece of the picker's color.
+
+        :type: move: int
+        :rtype: bool
+        """
+        piece = self.position.piece_at_square(SQUARES[move & 63])
+        return piece is not None and piece.color == self.color
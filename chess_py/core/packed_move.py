@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compact 16 bit integer encoding of moves.
+
+Board generates legal moves as plain ints so move lists for search and
+perft hold no ``Move``, ``Piece`` or ``Location`` objects. A ``Move`` is
+only built with ``to_move`` when a caller of the public API asks for one.
+
+| bits  0-5   square the move starts from, ``rank * 8 + file``
+| bits  6-11  square the move ends on
+| bits 12-15  flag
+
+| flag  0  QUIET
+| flag  1  DOUBLE_PAWN_PUSH
+| flag  2  KING_CASTLE
+| flag  3  QUEEN_CASTLE
+| flag  4  CAPTURE
+| flag  5  EN_PASSANT
+| flag  8  promotion to Knight, Bishop, Rook or Queen at 8 to 11
+| flag 12  capture and promotion to Knight, Bishop, Rook or Queen at 12 to 15
+
+``Board.make_move`` accepts either form.
+
+Copyright © 2016 Aubhro Sengupta. All rights reserved.
+"""
+
+from .algebraic import notation_const
+from .algebraic.move import Move
+from .attack_tables import SQUARES
+from ..pieces.bishop import Bishop
+from ..pieces.knight import Knight
+from ..pieces.pawn import Pawn
+from ..pieces.queen import Queen
+from ..pieces.rook import Rook
+
+QUIET = 0
+DOUBLE_PAWN_PUSH = 1
+KING_CASTLE = 2
+QUEEN_CASTLE = 3
+CAPTURE = 4
+EN_PASSANT = 5
+PROMOTION = 8
+CAPTURE_PROMOTION = 12
+
+# Promotion flags add the index of the piece promoted to
+PROMOTION_TYPES = (Knight, Bishop, Rook, Queen)
+
+_STATUSES = {
+    QUIET: notation_const.MOVEMENT,
+    DOUBLE_PAWN_PUSH: notation_const.MOVEMENT,
+    KING_CASTLE: notation_const.KING_SIDE_CASTLE,
+    QUEEN_CASTLE: notation_const.QUEEN_SIDE_CASTLE,
+    CAPTURE: notation_const.CAPTURE,
+    EN_PASSANT: notation_const.EN_PASSANT,
+}
+
+_FLAGS = {
+    notation_const.MOVEMENT: QUIET,
+    notation_const.KING_SIDE_CASTLE: KING_CASTLE,
+    notation_const.QUEEN_SIDE_CASTLE: QUEEN_CASTLE,
+    notation_const.CAPTURE: CAPTURE,
+    notation_const.EN_PASSANT: EN_PASSANT,
+}
+
+_PROMOTION_SYMBOLS = "nbrq"
+
+
+def pack(start, end, flag=QUIET):
+    """
+    Packs a move given its start and end square indices and its flag.
+
+    :type: start: int
+    :type: end: int
+    :type: flag: int
+    :rtype: int
+    """
+    return start | end << 6 | flag << 12
+
+
+def start_index(packed):
+    """
+    Finds the square index the move starts from.
+
+    :type: packed: int
+    :rtype: int
+    """
+    return packed & 63
+
+
+def end_index(packed):
+    """
+    Finds the square index the move ends on.
+
+    :type: packed: int
+    :rtype: int
+    """
+    return packed >> 6 & 63
+
+
+def status(packed):
+    """
+    Finds the ``notation_const`` status of the move.
+
+    :type: packed: int
+    :rtype: int
+    """
+    flag = packed >> 12
+    if flag & CAPTURE_PROMOTION == CAPTURE_PROMOTION:
+        return notation_const.CAPTURE_AND_PROMOTE
+    if flag & PROMOTION:
+        return notation_const.PROMOTE
+
+    return _STATUSES[flag]
+
+
+def promoted_to(packed):
+    """
+    Finds the piece type the move promotes to, or ``None``.
+
+    :type: packed: int
+    :rtype: type
+    """
+    flag = packed >> 12
+    if flag & PROMOTION:
+        return PROMOTION_TYPES[flag & 3]
+
+    return None
+
+
+def from_move(move):
+    """
+    Packs a ``Move``.
+
+    :type: move: Move
+    :rtype: int
+    """
+    start = move.start_loc.index
+    end = move.end_loc.index
+
+    if move.status == notation_const.PROMOTE or \
+            move.status == notation_const.CAPTURE_AND_PROMOTE:
+        if move.promoted_to_piece not in PROMOTION_TYPES:
+            raise ValueError("Cannot pack promotion to {} in Move {}".format(move.promoted_to_piece,
+                                                                             repr(move)))
+        flag = CAPTURE_PROMOTION if move.status == notation_const.CAPTURE_AND_PROMOTE else PROMOTION
+        return pack(start, end, flag | PROMOTION_TYPES.index(move.promoted_to_piece))
+
+    if move.status not in _FLAGS:
+        raise ValueError("Cannot pack Move {}".format(repr(move)))
+
+    flag = _FLAGS[move.status]
+    if flag == QUIET and isinstance(move.piece, Pawn) and abs(end - start) == 16:
+        flag = DOUBLE_PAWN_PUSH
+
+    return pack(start, end, flag)
+
+
+def to_move(packed, position):
+    """
+    Builds the ``Move`` object of a packed move on ``position``.
+
+    :type: packed: int
+    :type: position: Board
+    :rtype: Move
+    """
+    start_loc = SQUARES[packed & 63]
+    piece = position.piece_at_square(start_loc)
+    if piece is None:
+        raise ValueError("No piece to move from {}".format(start_loc))
+
+    return Move(end_loc=SQUARES[packed >> 6 & 63],
+                piece=piece,
+                status=status(packed),
+                start_loc=start_loc,
+                promoted_to_piece=promoted_to(packed))
+
+
+def to_string(packed):
+    """
+    Finds the long algebraic notation of the move, such as ``e2e4``
+    or ``e7e8q``.
+
+    :type: packed: int
+    :rtype: str
+    """
+    move_str = str(SQUARES[packed & 63]) + str(SQUARES[packed >> 6 & 63])
+    if packed >> 12 & PROMOTION:
+        move_str += _PROMOTION_SYMBOLS[packed >> 12 & 3]
+
+    return move_str
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+"""
+Fixed size transposition table for players that search over ``Board``.
+
+Entries are keyed by ``Board.zobrist_key`` and hold the depth searched,
+the bound type of the score, the score and a packed best move. They are
+stored back to back in one preallocated ``bytearray`` of 20 byte slots,
+so the table never grows past the size it was created with. Scores are
+kept as double precision floats, so they probe back exactly as stored,
+and depths may be negative, as in quiescence search, down to
+``MIN_DEPTH``.
+
+| table = TranspositionTable(size_mb=32)
+| table.store(board.zobrist_key, depth, EXACT, score, move)
+| entry = table.probe(board.zobrist_key)
+
+Slots are grouped into buckets chosen by the key. The replacement policy
+decides which slot of a bucket a new entry overwrites:
+
+``DEPTH_PREFERRED``
+    One slot per bucket, only replaced by an entry searched at least as deep.
+``ALWAYS_REPLACE``
+    One slot per bucket, always replaced by the newest entry.
+``TWO_TIER``
+    A depth preferred slot and an always replace slot per bucket.
+
+Copyright © 2016 Aubhro Sengupta. All rights reserved.
+"""
+
+import numbers
+import struct
+from collections import namedtuple
+
+# Bound types of a stored score. Zero marks an empty slot.
+EXACT = 1
+LOWER_BOUND = 2
+UPPER_BOUND = 3
+
+DEPTH_PREFERRED = "depth_preferred"
+ALWAYS_REPLACE = "always_replace"
+TWO_TIER = "two_tier"
+
+DEFAULT_SIZE_MB = 16
+
+MIN_DEPTH = -128
+MAX_DEPTH = 127
+
+# key, score, move, depth, bound
+_SLOT = struct.Struct("<QdHbB")
+SLOT_SIZE = _SLOT.size
+
+_BYTES_PER_MB = 1024 * 1024
+
+Entry = namedtuple("Entry", ["depth", "bound", "score", "move"])
+
+
+class TranspositionTable:
+    def __init__(self, size_mb=DEFAULT_SIZE_MB, policy=TWO_TIER):
+        """
+        Creates an empty table using at most ``size_mb`` megabytes.
+
+        :type: size_mb: float
+        :type: policy: str
+        """
+        if policy not in (DEPTH_PREFERRED, ALWAYS_REPLACE, TWO_TIER):
+            raise ValueError("Unknown replacement policy {}".format(policy))
+
+        self.policy = policy
+        self.bucket_size = 2 if policy == TWO_TIER else 1
+        self.num_buckets = int(size_mb * _BYTES_PER_MB) // (SLOT_SIZE * self.bucket_size)
+        if self.num_buckets < 1:
+            raise ValueError("TranspositionTable size_mb is too small: {}".format(size_mb))
+
+        self.size = self.num_buckets * self.bucket_size
+        self._slots = bytearray(self.size * SLOT_SIZE)
+        self._filled = 0
+
+    def __len__(self):
+        return self._filled
+
+    @property
+    def size_bytes(self):
+        """
+        Memory held by the slots.
+
+        :rtype: int
+        """
+        return len(self._slots)
+
+    @property
+    def fill_rate(self):
+        """
+        Fraction of slots holding an entry.
+
+        :rtype: float
+        """
+        return self._filled / float(self.size)
+
+    def _bucket(self, key):
+        """
+        Finds the offset of the first slot of the bucket for ``key``.
+
+        :type: key: int
+        :rtype: int
+        """
+        return (key % self.num_buckets) * self.bucket_size * SLOT_SIZE
+
+    def probe(self, key):
+        """
+        Finds the entry stored for ``key``. Returns ``None`` if there
+        is none.
+
+        :type: key: int
+        :rtype: Entry
+        """
+        offset = self._bucket(key)
+        for _ in range(self.bucket_size):
+            slot_key, score, move, depth, bound = _SLOT.unpack_from(self._slots, offset)
+            if bound and slot_key == key:
+                return Entry(depth, bound, score, move)
+
+            offset += SLOT_SIZE
+
+        return None
+
+    def store(self, key, depth, bound, score, move=0):
+        """
+        Stores the result of searching the position with ``key`` to
+        ``depth`` plies, unless the replacement policy keeps the entry
+        already in its slot. ``move`` is the best move packed as in
+        ``packed_move``, or 0 if there is none.
+
+        :type: key: int
+        :type: depth: int
+        :type: bound: int
+        :type: score: float
+        :type: move: int
+        """
+        if bound not in (EXACT, LOWER_BOUND, UPPER_BOUND):
+            raise ValueError("Unknown bound type {}".format(bound))
+        if not MIN_DEPTH <= depth <= MAX_DEPTH:
+            raise ValueError("Depth must be from {} to {}, not {}".format(MIN_DEPTH, MAX_DEPTH, depth))
+        if not 0 <= move <= 0xFFFF:
+            raise ValueError("Move must be a 16 bit packed move, not {}".format(move))
+        if not isinstance(score, numbers.Real):
+            raise ValueError("Score must be a number, not {!r}".format(score))
+
+        offset = self._bucket(key)
+        slot_key, _, _, slot_depth, slot_bound = _SLOT.unpack_from(self._slots, offset)
+
+        if self.policy == TWO_TIER and slot_bound and slot_key != key and depth < slot_depth:
+            # Keep the deeper entry and use the always replace slot
+            offset += SLOT_SIZE
+            slot_key, _, _, slot_depth, slot_bound = _SLOT.unpack_from(self._slots, offset)
+
+        elif self.policy == DEPTH_PREFERRED and slot_bound and slot_key != key and depth < slot_depth:
+            return
+
+        if not slot_bound:
+            self._filled += 1
+
+        _SLOT.pack_into(self._slots, offset, key, score, move, depth, bound)
+
+    def clear(self):
+        """
+        Removes every entry.
+        """
+        self._slots[:] = bytearray(len(self._slots))
+        self._filled = 0
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+"""
+Random 64 bit keys used to build Zobrist hashes of positions.
+
+A position's key is the XOR of one key per piece on the board, indexed by
+side (``True`` for white), piece type and square ``rank * 8 + file``,
+together with the keys for the castling rights, the en passant file and
+black to move. Since XOR is its own inverse, ``Board`` updates its key
+incrementally as pieces are placed and removed.
+
+The keys come from a fixed seed so every process computes the same key
+for the same position.
+
+Copyright © 2016 Aubhro Sengupta. All rights reserved.
+"""
+
+import random
+
+from ..pieces.bishop import Bishop
+from ..pieces.king import King
+from ..pieces.knight import Knight
+from ..pieces.pawn import Pawn
+from ..pieces.queen import Queen
+from ..pieces.rook import Rook
+
+_random = random.Random(2016)
+
+
+def _key():
+    return _random.getrandbits(64)
+
+
+PIECE_KEYS = dict((side, dict((piece_type, tuple(_key() for _ in range(64)))
+                              for piece_type in (Pawn, Knight, Bishop, Rook, Queen, King)))
+                  for side in (True, False))
+
+# One key per combination of the four castling rights
+CASTLING_KEYS = (0,) + tuple(_key() for _ in range(15))
+
+EN_PASSANT_KEYS = tuple(_key() for _ in range(8))
+
+BLACK_TO_MOVE_KEY = _key()
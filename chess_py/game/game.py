@@ -10,14 +10,13 @@ from each of the players and updates the board using
 each corresponding result.
 
 Start game using play(), which returns the result 
-(1 - white wins, 0 - black wins, 0.5 - draw)
-when the game is finished.
+(0 - white wins, 1 - black wins, 0.5 - draw)
+when the game is finished, that is when the side to move
+is checkmated or stalemated.
 
 Copyright © 2016 Aubhro Sengupta. All rights reserved.
 """
 
-import itertools
-
 from ..core.board import Board
 from ..core import color
 from . import game_state
@@ -25,16 +24,20 @@ from ..core.algebraic.converter import make_legal
 
 
 class Game:
-    def __init__(self, player_white, player_black):
+    def __init__(self, player_white, player_black, position=None):
         """
-        Creates new game given the players.
+        Creates new game given the players. The game starts from
+        the standard starting position unless another position,
+        such as a ``BitBoard``, is given.
 
         :type: player_white: Player
         :type: player_black: Player
+        :type: position: Board
         """
         self.player_white = player_white
         self.player_black = player_black
-        self.position = Board.init_default()
+        self.position = position if position is not None else Board.init_default()
+        self.status = None
 
     def play(self):
         """
@@ -44,24 +47,40 @@ class Game:
         method calls the respective player's ``generate_move()``
         method.
 
+        The ``GameStatus`` of each ply is computed once, kept in
+        ``status``, and used both to end the game and to complete the
+        move the player returns.
+
         :rtype: int
         """
-        colors = [lambda: self.white_move(), lambda: self.black_move()]
-        colors = itertools.cycle(colors)
+        input_color = self.position.side_to_move
 
         while True:
-            color_fn = next(colors)
-            if game_state.no_moves(self.position):
-                if self.position.get_king(color.white).in_check(self.position):
-                    return 1
+            self.status = game_state.GameStatus(self.position, input_color)
+            if self.status.is_over:
+                return self.status.result
+
+            if input_color == color.white:
+                self.white_move()
+            else:
+                self.black_move()
 
-                elif self.position.get_king(color.black).in_check(self.position):
-                    return 0
+            input_color = -input_color
 
-                else:
-                    return 0.5
+    def _legal_moves(self, input_color):
+        """
+        Finds the legal moves of input_color from ``status`` if it is
+        for the current ply.
+
+        :type: input_color: Color
+        :rtype: list
+        """
+        status = self.status
+        if status is not None and status.side_to_move == input_color and \
+                status.position is self.position and status.key == self.position.zobrist_key:
+            return status.legal_moves
 
-            color_fn()
+        return None
 
     def white_move(self):
         """
@@ -69,7 +88,7 @@ class Game:
         method and updates the board with the move returned.
         """
         move = self.player_white.generate_move(self.position)
-        move = make_legal(move, self.position)
+        move = make_legal(move, self.position, self._legal_moves(color.white))
         self.position.update(move)
 
     def black_move(self):
@@ -78,7 +97,7 @@ class Game:
         method and updates the board with the move returned.
         """
         move = self.player_black.generate_move(self.position)
-        move = make_legal(move, self.position)
+        move = make_legal(move, self.position, self._legal_moves(color.black))
         self.position.update(move)
 
     def all_possible_moves(self, input_color):
@@ -4,10 +4,64 @@
 Static methods which check to see if
 game is over, and if a King is checkmated.
 
+``GameStatus`` holds everything about the position at one ply that
+``Game`` needs: the side to move, its legal moves, whether it is in
+check and the result if the game is over. It is computed once per ply
+and shared by the game over check and ``make_legal``.
+
 Copyright © 2016 Aubhro Sengupta. All rights reserved.
 """
 
 from ..core import color
+from ..core import packed_move
+
+
+class GameStatus:
+    def __init__(self, position, input_color):
+        """
+        Finds the status of ``position`` with input_color to move.
+
+        :type: position: Board
+        :type: input_color: Color
+        """
+        self.position = position
+        self.key = position.zobrist_key
+        self.side_to_move = input_color
+        self.packed_moves = position.packed_moves(input_color)
+
+        king_loc = position.king_square(input_color)
+        self.in_check = king_loc is not None and position.is_square_attacked(king_loc, -input_color)
+
+        if self.packed_moves:
+            self.result = None
+        elif self.in_check:
+            self.result = 1 if input_color == color.white else 0
+        else:
+            self.result = 0.5
+
+        self._legal_moves = None
+
+    @property
+    def legal_moves(self):
+        """
+        Legal moves of the side to move as ``Move`` objects, built the
+        first time they are asked for.
+
+        :rtype: list
+        """
+        if self._legal_moves is None:
+            self._legal_moves = [packed_move.to_move(move, self.position) for move in self.packed_moves]
+
+        return self._legal_moves
+
+    @property
+    def is_over(self):
+        """
+        Finds if the side to move is checkmated or stalemated.
+
+        :rtype: bool
+        """
+        return self.result is not None
 
 
 def no_moves(position):
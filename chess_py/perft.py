@@ -0,0 +1,422 @@
+# -*- coding: utf-8 -*-
+
+"""
+Counts the leaf nodes of the legal move tree of a position to a fixed
+depth. The counts of well known positions are published, so comparing
+against them checks move generation, and timing them measures its speed.
+
+| perft(Board.init_default(), 4)
+| 197281
+| divide(Board.init_default(), 2)["e2e4"]
+| 20
+
+``SUITE`` holds positions with their expected counts, covering castling,
+en passant, promotions, discovered checks and stalemate. From the
+command line:
+
+| python -m chess_py.perft                   runs the suite to depth 3
+| python -m chess_py.perft --depth 5 --position kiwipete
+| python -m chess_py.perft --fen "8/8/8/8/8/8/8/K1k5 w - - 0 1" --depth 4 --divide
+| python -m chess_py.perft --depth 6 --position startpos --workers 32
+
+With more than one worker the tree is split by root move, or by the moves two
+plies deep when there are too few root moves to keep every worker busy,
+and the subtrees are counted by a ``multiprocessing`` pool. Each task is
+the root board in FEN with the moves leading to its subtree. ``workers``
+is ``None`` for one worker per CPU, while 0 and 1 both count in the
+calling process; ``--workers`` given without a number means one per CPU.
+
+With ``hash_mb`` the counts of subtrees are kept in a ``PerftTable`` of
+that size, keyed by Zobrist key and depth, so a position reached again
+by another move order is only counted once. With workers each process
+keeps a table of its own.
+
+| python -m chess_py.perft --depth 7 --position startpos --hash 256
+
+Copyright © 2016 Aubhro Sengupta. All rights reserved.
+"""
+
+from __future__ import print_function
+
+import argparse
+import multiprocessing
+import struct
+import sys
+import time
+from collections import namedtuple
+
+from .core import packed_move
+from .core.bitboard import BitBoard
+from .core.board import LEGAL, Board
+
+PerftPosition = namedtuple("PerftPosition", ["name", "fen", "counts"])
+
+# Expected counts start at depth 1
+SUITE = (
+    PerftPosition("startpos", "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+                  (20, 400, 8902, 197281, 4865609)),
+    PerftPosition("kiwipete", "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+                  (48, 2039, 97862, 4085603)),
+    PerftPosition("en passant pins", "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+                  (14, 191, 2812, 43238, 674624)),
+    PerftPosition("promotions", "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+                  (6, 264, 9467, 422333)),
+    PerftPosition("discovered checks", "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+                  (44, 1486, 62379, 2103487)),
+    PerftPosition("middlegame", "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+                  (46, 2079, 89890, 3894594)),
+    PerftPosition("illegal en passant", "3k4/3p4/8/K1P4r/8/8/8/8 b - - 0 1",
+                  (18, 92, 1670, 10138, 185429, 1134888)),
+    PerftPosition("en passant gives check", "8/8/1k6/2b5/2pP4/8/5K2/8 b - d3 0 1",
+                  (15, 126, 1928, 13931, 206379, 1440467)),
+    PerftPosition("short castle gives check", "5k2/8/8/8/8/8/8/4K2R w K - 0 1",
+                  (15, 66, 1198, 6399, 120330, 661072)),
+    PerftPosition("long castle gives check", "3k4/8/8/8/8/8/8/R3K3 w Q - 0 1",
+                  (16, 71, 1286, 7418, 141077, 803711)),
+    PerftPosition("castling rights", "r3k2r/1b4bq/8/8/8/8/7B/R3K2R w KQkq - 0 1",
+                  (26, 1141, 27826, 1274206)),
+    PerftPosition("promote out of check", "2K2r2/4P3/8/8/8/8/8/3k4 w - - 0 1",
+                  (11, 133, 1442, 19174, 266199, 3821001)),
+    PerftPosition("promote to give check", "4k3/1P6/8/8/8/8/K7/8 w - - 0 1",
+                  (9, 40, 472, 2661, 38983, 217342)),
+    PerftPosition("underpromote to check", "8/P1k5/K7/8/8/8/8/8 w - - 0 1",
+                  (6, 27, 273, 1329, 18135, 92683)),
+    PerftPosition("self stalemate", "K1k5/8/P7/8/8/8/8/8 w - - 0 1",
+                  (2, 6, 13, 63, 382, 2217)),
+    PerftPosition("stalemate and checkmate", "8/k1P5/8/1K6/8/8/8/8 w - - 0 1",
+                  (10, 25, 268, 926, 10857, 43261, 567584)),
+)
+
+# Subtrees per worker below which the tree is split two plies deep
+_TASKS_PER_WORKER = 4
+
+# key, then depth in the top byte and the count below it
+_SLOT = struct.Struct("<QQ")
+_COUNT_BITS = 56
+_COUNT_MASK = (1 << _COUNT_BITS) - 1
+
+# Spreads the depths of one position over different slots
+_DEPTH_MULTIPLIER = 0x9E3779B97F4A7C15
+
+_BYTES_PER_MB = 1024 * 1024
+
+
+def _pack_board(board):
+    """
+    Packs ``board`` into a small picklable tuple of its class and its
+    position in FEN.
+
+    :type: board: Board
+    :rtype: tuple
+    """
+    return board.__class__, board.to_fen()
+
+
+def _unpack_board(packed):
+    """
+    Builds the board packed by ``_pack_board``.
+
+    :type: packed: tuple
+    :rtype: Board
+    """
+    board_class, fen = packed
+    return board_class.from_fen(fen)
+
+
+class PerftTable:
+    def __init__(self, size_mb):
+        """
+        Creates an empty table of subtree counts using at most
+        ``size_mb`` megabytes. Each 16 byte slot holds the full Zobrist
+        key, the depth and the count, and a new count always replaces
+        the one in its slot.
+
+        :type: size_mb: float
+        """
+        self.size = int(size_mb * _BYTES_PER_MB) // _SLOT.size
+        if self.size < 1:
+            raise ValueError("PerftTable size_mb is too small: {}".format(size_mb))
+
+        self._slots = bytearray(self.size * _SLOT.size)
+        self.hits = 0
+        self.misses = 0
+
+    def _offset(self, key, depth):
+        return ((key ^ depth * _DEPTH_MULTIPLIER) & _COUNT_MASK) % self.size * _SLOT.size
+
+    def probe(self, key, depth):
+        """
+        Finds the count stored for the position with ``key`` searched
+        to ``depth``. Returns ``None`` unless both the key and the depth
+        match, so positions sharing a slot are never confused.
+
+        :type: key: int
+        :type: depth: int
+        :rtype: int
+        """
+        slot_key, value = _SLOT.unpack_from(self._slots, self._offset(key, depth))
+        if slot_key == key and value >> _COUNT_BITS == depth:
+            self.hits += 1
+            return value & _COUNT_MASK
+
+        self.misses += 1
+        return None
+
+    def store(self, key, depth, nodes):
+        """
+        Stores the count of the position with ``key`` searched to ``depth``.
+
+        :type: key: int
+        :type: depth: int
+        :type: nodes: int
+        """
+        _SLOT.pack_into(self._slots, self._offset(key, depth), key, depth << _COUNT_BITS | nodes)
+
+
+def _perft(board, input_color, depth, table=None):
+    if table is not None:
+        key = board.zobrist_key
+        nodes = table.probe(key, depth)
+        if nodes is not None:
+            return nodes
+
+    moves = list(board.generate(input_color, LEGAL))
+    if depth == 1:
+        if table is not None:
+            table.store(key, depth, len(moves))
+        return len(moves)
+
+    nodes = 0
+    for move in moves:
+        undo = board.make_move(move)
+        nodes += _perft(board, -input_color, depth - 1, table)
+        board.unmake_move(undo)
+
+    if table is not None:
+        table.store(key, depth, nodes)
+
+    return nodes
+
+
+def _count_subtree(task):
+    """
+    Counts one subtree in a worker process. ``task`` is the packed
+    root board, the packed moves leading to the subtree and the depth
+    left below it, and the size of the table to count with.
+
+    :type: task: tuple
+    :rtype: tuple
+    """
+    packed, path, depth, hash_mb = task
+    board = _unpack_board(packed)
+    for move in path:
+        board.make_move(move)
+
+    global _worker_table
+    if hash_mb and _worker_table is None:
+        _worker_table = PerftTable(hash_mb)
+
+    return path, _perft_with_table(board, depth, _worker_table if hash_mb else None)
+
+
+# Table kept by a worker process across the tasks it counts
+_worker_table = None
+
+
+def _subtrees(board, depth, workers):
+    """
+    Finds the paths of one or two moves that split the tree under
+    ``board`` into enough subtrees for ``workers`` processes.
+
+    :type: board: Board
+    :type: depth: int
+    :type: workers: int
+    :rtype: list
+    """
+    root_moves = list(board.generate(board.side_to_move, LEGAL))
+    if depth < 3 or len(root_moves) >= workers * _TASKS_PER_WORKER:
+        return [(move,) for move in root_moves]
+
+    paths = []
+    for move in root_moves:
+        undo = board.make_move(move)
+        replies = list(board.generate(board.side_to_move, LEGAL))
+        board.unmake_move(undo)
+
+        if replies:
+            paths.extend((move, reply) for reply in replies)
+        else:
+            paths.append((move,))
+
+    return paths
+
+
+def _parallel_divide(board, depth, workers, hash_mb=None):
+    """
+    Counts the subtree of each root move with a pool of ``workers``
+    processes.
+
+    :type: board: Board
+    :type: depth: int
+    :type: workers: int
+    :type: hash_mb: float
+    :rtype: dict
+    """
+    packed = _pack_board(board)
+    tasks = [(packed, path, depth - len(path), hash_mb) for path in _subtrees(board, depth, workers)]
+
+    counts = {}
+    pool = multiprocessing.Pool(workers)
+    try:
+        for path, nodes in pool.imap_unordered(_count_subtree, tasks):
+            root = packed_move.to_string(path[0])
+            counts[root] = counts.get(root, 0) + nodes
+    finally:
+        pool.close()
+        pool.join()
+
+    return counts
+
+
+def _perft_with_table(board, depth, table):
+    if depth < 1:
+        return 1
+
+    return _perft(board, board.side_to_move, depth, table)
+
+
+def _worker_count(workers):
+    """
+    Finds how many processes to count with: one per CPU if ``workers``
+    is ``None``, otherwise ``workers``, where 0 and 1 both mean counting
+    in this process.
+
+    :type: workers: int
+    :rtype: int
+    """
+    return multiprocessing.cpu_count() if workers is None else workers
+
+
+def perft(board, depth, workers=1, hash_mb=None):
+    """
+    Counts the positions reached after ``depth`` plies from ``board``
+    with its side to move. The board is left as it was. With more than
+    one worker, or ``workers`` set to ``None`` for one per CPU, the
+    subtrees are counted by a process pool. With
+    ``hash_mb`` subtree counts are kept in a ``PerftTable`` of that
+    size, one per worker.
+
+    :type: board: Board
+    :type: depth: int
+    :type: workers: int
+    :type: hash_mb: float
+    :rtype: int
+    """
+    workers = _worker_count(workers)
+    if workers > 1 and depth > 1:
+        return sum(_parallel_divide(board, depth, workers, hash_mb).values())
+
+    return _perft_with_table(board, depth, PerftTable(hash_mb) if hash_mb else None)
+
+
+def divide(board, depth, workers=1, hash_mb=None):
+    """
+    Counts the positions reached after ``depth`` plies separately for
+    each legal move of the side to move, keyed by the move in long
+    algebraic notation. Comparing a divide against another program
+    finds the move whose subtree is wrong. ``workers`` is as for
+    ``perft``.
+
+    :type: board: Board
+    :type: depth: int
+    :type: workers: int
+    :type: hash_mb: float
+    :rtype: dict
+    """
+    workers = _worker_count(workers)
+    if workers > 1 and depth > 1:
+        return _parallel_divide(board, depth, workers, hash_mb)
+
+    table = PerftTable(hash_mb) if hash_mb else None
+    input_color = board.side_to_move
+    counts = {}
+    for move in list(board.generate(input_color, LEGAL)):
+        undo = board.make_move(move)
+        counts[packed_move.to_string(move)] = _perft_with_table(board, depth - 1, table)
+        board.unmake_move(undo)
+
+    return counts
+
+
+def _timed(fn, *args):
+    start = time.time()
+    result = fn(*args)
+    return result, time.time() - start
+
+
+def _report(label, nodes, seconds):
+    nps = nodes / seconds if seconds > 0 else float("inf")
+    print("{:<36} {:>10} nodes {:>8.2f} s {:>10.0f} nodes/s".format(label, nodes, seconds, nps))
+
+
+def main(args=None):
+    """
+    Runs perft from the command line. Returns 1 if a count from the
+    suite does not match.
+
+    :type: args: list
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(prog="python -m chess_py.perft",
+                                     description="Count leaf nodes of the legal move tree.")
+    parser.add_argument("--depth", type=int, default=3, help="plies to search (default 3)")
+    parser.add_argument("--position", choices=[entry.name for entry in SUITE],
+                        help="run only this position of the suite")
+    parser.add_argument("--fen", help="run a position given in FEN instead of the suite")
+    parser.add_argument("--divide", action="store_true", help="print the count of each root move")
+    parser.add_argument("--bitboard", action="store_true", help="use BitBoard instead of Board")
+    parser.add_argument("--workers", type=int, nargs="?", default=1, const=None,
+                        help="processes to count with (default 1, one per CPU if no number is given)")
+    parser.add_argument("--hash", type=float, default=0, metavar="MB",
+                        help="megabytes of subtree counts to keep per process (default none)")
+    args = parser.parse_args(args)
+
+    board_class = BitBoard if args.bitboard else Board
+
+    if args.fen is not None:
+        entries = [PerftPosition("fen", args.fen, ())]
+    else:
+        entries = [entry for entry in SUITE if args.position in (None, entry.name)]
+
+    failed = False
+    total_nodes = 0
+    total_seconds = 0.0
+    for entry in entries:
+        board = board_class.from_fen(entry.fen)
+
+        if args.divide:
+            counts, seconds = _timed(divide, board, args.depth, args.workers, args.hash)
+            for move in sorted(counts):
+                print("{} {}".format(move, counts[move]))
+            nodes = sum(counts.values())
+        else:
+            nodes, seconds = _timed(perft, board, args.depth, args.workers, args.hash)
+
+        total_nodes += nodes
+        total_seconds += seconds
+
+        label = "{} depth {}".format(entry.name, args.depth)
+        if args.depth <= len(entry.counts) and nodes != entry.counts[args.depth - 1]:
+            failed = True
+            label += " FAILED, expected {}".format(entry.counts[args.depth - 1])
+
+        _report(label, nodes, seconds)
+
+    if len(entries) > 1:
+        _report("total", total_nodes, total_seconds)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
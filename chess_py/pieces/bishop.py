@@ -20,21 +20,14 @@ Class stores Bishop on the board
 | Copyright © 2016 Aubhro Sengupta. All rights reserved.
 """
 
-import itertools
-
 from .piece import Piece
 from .rook import Rook
+from ..core.attack_tables import DIAG_OFFSETS, bishop_attacks
 from ..core import color
 
 
 class Bishop(Rook, Piece):
-    def __init__(self, input_color, location):
-        """
-        Creates Bishop object that can be compared to and return possible moves
-
-        :type: input_color: Color
-        """
-        Piece.__init__(self, input_color, location)
+    __slots__ = ()
 
     def _symbols(self):
         return {color.white: "♝", color.black: "♗"}
@@ -49,6 +42,6 @@ class Bishop(Rook, Piece):
         :type: position: Board
         :rtype: list
         """
-
-        for move in itertools.chain(*[self.moves_in_direction(fn, position) for fn in self.diag_fn]):
+        attacks = bishop_attacks(self.location.index, position.occupancy)
+        for move in self.slide_moves(attacks, DIAG_OFFSETS, position):
             yield move
@@ -20,27 +20,16 @@ Class stores King on the board
 | Copyright © 2016 Aubhro Sengupta. All rights reserved.
 """
 
-import itertools
-from copy import copy as cp
-
 from .piece import Piece
 from .rook import Rook
 from ..core.algebraic import notation_const
+from ..core.attack_tables import KING_TARGETS
 from ..core import color
 from ..core.algebraic.location import Location
 
 
 class King(Piece):
-    def __init__(self, input_color, location):
-        """
-        Creates a King.
-
-        :type: input_color: Color
-        :type: location: Location
-        """
-        super(King, self).__init__(input_color, location)
-        self.has_moved = False
-        self.cardinal_directions = self.cross_fn + self.diag_fn
+    __slots__ = ()
 
     def _symbols(self):
         return {color.white: "♚", color.black: "♔"}
@@ -56,11 +45,12 @@ class King(Piece):
         :type: move: Move
         :rtype: bool
         """
-        test = cp(pos)
-        test.update(move)
-        test_king = test.get_king(move.color)
+        undo = pos.make_move(move)
+        test_king = pos.get_king(move.color)
+        adjacent = self.loc_adjacent_to_opponent_king(test_king.location, pos)
+        pos.unmake_move(undo)
 
-        return self.loc_adjacent_to_opponent_king(test_king.location, test)
+        return adjacent
 
     def loc_adjacent_to_opponent_king(self, location, position):
         """
@@ -70,40 +60,33 @@ class King(Piece):
         :type: position: Board
         :rtype: bool
         """
-        for fn in self.cardinal_directions:
-            try:
-                if isinstance(position.piece_at_square(fn(location)), King) and \
-                        position.piece_at_square(fn(location)).color != self.color:
-                    return True
-
-            except IndexError:
-                pass
+        for neighbor in KING_TARGETS[location.index]:
+            piece = position.piece_at_square(neighbor)
+            if isinstance(piece, King) and piece.color != self.color:
+                return True
 
         return False
 
-    def add(self, func, position):
+    def _add_target(self, end_loc, position):
         """
-        Adds all 8 cardinal directions as moves for the King if legal.
+        Adds move to ``end_loc`` for the King if legal.
 
-        :type: function: function
+        :type: end_loc: Location
         :type: position: Board
         :rtype: gen
         """
-        try:
-            if self.loc_adjacent_to_opponent_king(func(self.location), position):
-                return
-        except IndexError:
+        if self.loc_adjacent_to_opponent_king(end_loc, position):
             return
 
-        if position.is_square_empty(func(self.location)):
-            yield self.create_move(func(self.location), notation_const.MOVEMENT)
+        if position.is_square_empty(end_loc):
+            yield self.create_move(end_loc, notation_const.MOVEMENT)
 
-        elif position.piece_at_square(func(self.location)).color != self.color:
-            yield self.create_move(func(self.location), notation_const.CAPTURE)
+        elif position.piece_at_square(end_loc).color != self.color:
+            yield self.create_move(end_loc, notation_const.CAPTURE)
 
     def _rook_legal_for_castle(self, rook):
         """
-        Decides if given rook exists, is of this color, and has not moved so it
+        Decides if given rook exists and is of this color so it
         is eligible to castle.
 
         :type: rook: Rook
@@ -111,8 +94,7 @@ class King(Piece):
         """
         return rook is not None and \
             type(rook) is Rook and \
-            rook.color == self.color and \
-            not rook.has_moved
+            rook.color == self.color
 
     def _empty_not_in_check(self, position, direction):
         """
@@ -131,26 +113,45 @@ class King(Piece):
         return valid_square(direction(self.location, 1)) and \
             valid_square(direction(self.location, 2))
 
+    def _rook_path_empty(self, position, rook_file):
+        """
+        Checks that every square between ``King`` and ``Rook`` is empty,
+        including the b-file square the King does not cross when castling
+        queenside.
+
+        :type: position: Board
+        :type: rook_file: int
+        :rtype: bool
+        """
+        low, high = sorted((self.location.file, rook_file))
+        return all(position.is_square_empty(Location(self.location.rank, file))
+                   for file in range(low + 1, high))
+
     def add_castle(self, position):
         """
         Adds kingside and queenside castling moves if legal
 
         :type: position: Board
         """
-        if self.has_moved or self.in_check(position):
-            return
-
         if self.color == color.white:
             rook_rank = 0
+            king_side, queen_side = notation_const.WHITE_KING_SIDE, notation_const.WHITE_QUEEN_SIDE
         else:
             rook_rank = 7
+            king_side, queen_side = notation_const.BLACK_KING_SIDE, notation_const.BLACK_QUEEN_SIDE
+
+        if not position.castling_rights & (king_side | queen_side) or \
+                self.location != Location(rook_rank, 4) or self.in_check(position):
+            return
 
         castle_type = {
             notation_const.KING_SIDE_CASTLE: {
+                "right": king_side,
                 "rook_file": 7,
                 "direction": lambda king_square, times: king_square.shift_right(times)
             },
             notation_const.QUEEN_SIDE_CASTLE: {
+                "right": queen_side,
                 "rook_file": 0,
                 "direction": lambda king_square, times: king_square.shift_left(times)
             }
@@ -158,7 +159,9 @@ class King(Piece):
         for castle_key in castle_type:
             castle_dict = castle_type[castle_key]
             castle_rook = position.piece_at_square(Location(rook_rank, castle_dict["rook_file"]))
-            if self._rook_legal_for_castle(castle_rook) and \
+            if position.castling_rights & castle_dict["right"] and \
+                    self._rook_legal_for_castle(castle_rook) and \
+                    self._rook_path_empty(position, castle_dict["rook_file"]) and \
                     self._empty_not_in_check(position, castle_dict["direction"]):
                 yield self.create_move(castle_dict["direction"](self.location, 2), castle_key)
 
@@ -169,9 +172,9 @@ class King(Piece):
         :type: position: Board
         :rtype: list
         """
-        # Chain used to combine multiple generators
-        for move in itertools.chain(*[self.add(fn, position) for fn in self.cardinal_directions]):
-            yield move
+        for end_loc in KING_TARGETS[self.location.index]:
+            for move in self._add_target(end_loc, position):
+                yield move
 
         for move in self.add_castle(position):
             yield move
@@ -184,16 +187,4 @@ class King(Piece):
         :return: bool
         """
         location = location or self.location
-        for piece in position:
-
-            if piece is not None and piece.color != self.color:
-                if not isinstance(piece, King):
-                    for move in piece.possible_moves(position):
-
-                        if move.end_loc == location:
-                            return True
-                else:
-                    if self.loc_adjacent_to_opponent_king(piece.location, position):
-                        return True
-
-        return False
+        return position.is_square_attacked(location, -self.color)
@@ -28,19 +28,13 @@ from .rook import Rook
 from .knight import Knight
 from ..core import color
 from ..core.algebraic import notation_const
+from ..core.algebraic.location import Location
 from ..core.algebraic.move import Move
+from ..core.attack_tables import PAWN_PUSHES, PAWN_CAPTURES
 
 
 class Pawn(Piece):
-    def __init__(self, input_color, location):
-        """
-        Initializes a Pawn that is capable of moving
-
-        :type: input_color: Color
-        :type: location: Location
-        """
-        self.just_moved_two_steps = False
-        super(Pawn, self).__init__(input_color, location)
+    __slots__ = ()
 
     def _symbols(self):
         return {color.white: "♟", color.black: "♙"}
@@ -110,27 +104,29 @@ class Pawn(Piece):
         :type: position: Board
         :rtype: list
         """
-        if position.is_square_empty(self.square_in_front(self.location)):
+        pushes = PAWN_PUSHES[self.color == color.white]
+        one_step = pushes[self.location.index]
+
+        if one_step is not None and position.is_square_empty(one_step):
             """
             If square in front is empty add the move
             """
             if self.would_move_be_promotion():
-                for move in self.create_promotion_moves(notation_const.PROMOTE):
+                for move in self.create_promotion_moves(notation_const.PROMOTE, one_step):
                     yield move
             else:
-                yield self.create_move(end_loc=self.square_in_front(self.location),
+                yield self.create_move(end_loc=one_step,
                                        status=notation_const.MOVEMENT)
 
-            if self.on_home_row() and \
-                    position.is_square_empty(self.two_squares_in_front(self.location)):
-                """
-                If pawn is on home row and two squares in front of the pawn is empty
-                add the move
-                """
-                yield self.create_move(
-                    end_loc=self.square_in_front(self.square_in_front(self.location)),
-                    status=notation_const.MOVEMENT
-                )
+            if self.on_home_row():
+                two_steps = pushes[one_step.index]
+                if position.is_square_empty(two_steps):
+                    """
+                    If pawn is on home row and two squares in front of the pawn is empty
+                    add the move
+                    """
+                    yield self.create_move(end_loc=two_steps,
+                                           status=notation_const.MOVEMENT)
 
     def _one_diagonal_capture_square(self, capture_square, position):
         """
@@ -153,19 +149,10 @@ class Pawn(Piece):
 
         :rtype: list
         """
-        try:
-            right_diagonal = self.square_in_front(self.location.shift_right())
-            for move in self._one_diagonal_capture_square(right_diagonal, position):
+        captures = PAWN_CAPTURES[self.color == color.white]
+        for capture_square in captures[self.location.index]:
+            for move in self._one_diagonal_capture_square(capture_square, position):
                 yield move
-        except IndexError:
-            pass
-
-        try:
-            left_diagonal = self.square_in_front(self.location.shift_left())
-            for move in self._one_diagonal_capture_square(left_diagonal, position):
-                yield move
-        except IndexError:
-            pass
 
     def on_en_passant_valid_location(self):
         """
@@ -178,35 +165,29 @@ class Pawn(Piece):
 
     def _is_en_passant_valid(self, opponent_pawn_location, position):
         """
-        Finds if their opponent's pawn is next to this pawn
+        Finds if their opponent's pawn is next to this pawn and
+        has just moved two steps past ``position.en_passant_square``.
 
         :rtype: bool
         """
-        try:
-            pawn = position.piece_at_square(opponent_pawn_location)
-            return pawn is not None and \
-                isinstance(pawn, Pawn) and \
-                pawn.color != self.color and \
-                position.piece_at_square(opponent_pawn_location).just_moved_two_steps
-        except IndexError:
-            return False
+        pawn = position.piece_at_square(opponent_pawn_location)
+        return pawn is not None and \
+            isinstance(pawn, Pawn) and \
+            pawn.color != self.color and \
+            position.en_passant_square is self.square_in_front(opponent_pawn_location)
 
-    def add_one_en_passant_move(self, direction, position):
+    def _en_passant_move(self, capture_square, position):
         """
-        Yields en_passant moves in given direction if it is legal.
+        Yields en passant move onto ``capture_square`` if it is legal.
 
-        :type: direction: function
+        :type: capture_square: Location
         :type: position: Board
         :rtype: gen
         """
-        try:
-            if self._is_en_passant_valid(direction(self.location), position):
-                yield self.create_move(
-                    end_loc=self.square_in_front(direction(self.location)),
-                    status=notation_const.EN_PASSANT
-                )
-        except IndexError:
-            pass
+        opponent_pawn_location = Location(self.location.rank, capture_square.file)
+        if self._is_en_passant_valid(opponent_pawn_location, position):
+            yield self.create_move(end_loc=capture_square,
+                                   status=notation_const.EN_PASSANT)
 
     def en_passant_moves(self, position):
         """
@@ -217,9 +198,10 @@ class Pawn(Piece):
 
         # if pawn is not on a valid en passant get_location then return None
         if self.on_en_passant_valid_location():
-            for move in itertools.chain(self.add_one_en_passant_move(lambda x: x.shift_right(), position),
-                                        self.add_one_en_passant_move(lambda x: x.shift_left(), position)):
-                yield move
+            captures = PAWN_CAPTURES[self.color == color.white]
+            for capture_square in captures[self.location.index]:
+                for move in self._en_passant_move(capture_square, position):
+                    yield move
 
     def possible_moves(self, position):
         """
@@ -3,6 +3,12 @@
 """
 Parent class for all pieces
 
+Pieces are immutable and shared. There is one instance for each type,
+color and square, so ``Pawn(white, Location(1, 4))`` always returns the
+same object and moving a piece means placing the instance for its new
+square, found with ``at``. Castling rights and the en passant square
+belong to ``Board``.
+
 Copyright © 2016 Aubhro Sengupta. All rights reserved.
 """
 
@@ -12,31 +18,40 @@ from ..core.algebraic.location import Location
 from ..core import color
 from ..core.color import Color
 
+# Shared instances keyed by type, side and square index
+_PIECES = {}
+
 
-class Piece:
+class Piece(object):
     __metaclass__ = ABCMeta
+    __slots__ = ('color', 'location')
 
-    @abstractmethod
-    def __init__(self, input_color, location):
+    def __new__(cls, input_color, location):
         """
-        Initializes a piece that is capable of moving
+        Finds the piece of this type and color on ``location``.
 
         :type: input_color: Color
         :type: location: Location
-        :type: white_symbol: str
-        :type: black_symbol: str
+        :rtype: Piece
         """
         assert isinstance(input_color, Color)
         assert isinstance(location, Location)
 
-        self.color = input_color
-        self.location = location
+        key = cls, bool(input_color), location.index
+        piece = _PIECES.get(key)
+        if piece is None:
+            piece = object.__new__(cls)
+            object.__setattr__(piece, "color", color.white if input_color == color.white else color.black)
+            object.__setattr__(piece, "location", location)
+            _PIECES[key] = piece
 
-        self.cross_fn = [lambda x: x.shift_up(), lambda x: x.shift_right(),
-                         lambda x: x.shift_down(), lambda x: x.shift_left()]
+        return piece
 
-        self.diag_fn = [lambda x: x.shift_up_right(), lambda x: x.shift_up_left(),
-                        lambda x: x.shift_down_right(), lambda x: x.shift_down_left()]
+    def __setattr__(self, name, value):
+        raise AttributeError("{} is immutable".format(self.__class__.__name__))
+
+    def __reduce__(self):
+        return self.__class__, (self.color, self.location)
 
     def __key(self):
         return self.color, self.location
@@ -70,7 +85,19 @@ class Piece:
         pass
 
     def __copy__(self):
-        return self.__class__(self.color, self.location)
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def at(self, location):
+        """
+        Finds the piece of the same type and color on ``location``.
+
+        :type: location: Location
+        :rtype: Piece
+        """
+        return self.__class__(self.color, location)
 
     @property
     def symbol(self):
@@ -29,8 +29,7 @@ from ..core import color
 
 
 class Queen(Bishop, Piece):
-    def __init__(self, input_color, location):
-        Piece.__init__(self, input_color, location)
+    __slots__ = ()
 
     def _symbols(self):
         return {color.white: "♛", color.black: "♕"}
@@ -20,24 +20,15 @@ Class stores Rook on the board
 | Copyright © 2016 Aubhro Sengupta. All rights reserved.
 """
 
-import itertools
-
 from .piece import Piece
 from ..core.algebraic import notation_const
+from ..core.algebraic.location import Location
+from ..core.attack_tables import RAYS, CROSS_OFFSETS, rook_attacks, iter_ray
 from ..core import color
 
 
 class Rook(Piece):
-    def __init__(self, input_color, location):
-        """
-        Initializes a rook that is capable of being compared to another rook,
-        and returning a list of possible moves.
-
-        :type: input_color: Color
-        :type: location: Location
-        """
-        super(Rook, self).__init__(input_color, location)
-        self.has_moved = False
+    __slots__ = ()
 
     def _symbols(self):
         return {color.white: "♜", color.black: "♖"}
@@ -45,29 +36,29 @@ class Rook(Piece):
     def __str__(self):
         return "R"
 
-    def moves_in_direction(self, direction, position):
+    def slide_moves(self, attacks, offsets, position):
         """
-        Finds moves in a given direction
+        Turns the attack set of a sliding piece into moves, ray by ray
+        in the order of ``offsets`` and outward from the piece.
 
-        :type: direction: lambda
+        :type: attacks: int
+        :type: offsets: tuple
         :type: position: Board
-        :rtype: list
+        :rtype: gen
         """
-        current_square = self.location
-
-        while True:
-            try:
-                current_square = direction(current_square)
-            except IndexError:
-                return
-
-            if self.contains_opposite_color_piece(current_square, position):
-                yield self.create_move(current_square, notation_const.CAPTURE)
+        index = self.location.index
+        own = position.color_occupancy[bool(self.color)]
+        attacks &= ~own
+        captures = attacks & position.occupancy
 
-            if not position.is_square_empty(current_square):
-                return
+        for offset in offsets:
+            for target in iter_ray(attacks & RAYS[offset][index], offset):
+                if (captures >> target) & 1:
+                    status = notation_const.CAPTURE
+                else:
+                    status = notation_const.MOVEMENT
 
-            yield self.create_move(current_square, notation_const.MOVEMENT)
+                yield self.create_move(Location.from_index(target), status)
 
     def possible_moves(self, position):
         """
@@ -76,5 +67,6 @@ class Rook(Piece):
         :type: position: Board
         :rtype: list
         """
-        for move in itertools.chain(*[self.moves_in_direction(fn, position) for fn in self.cross_fn]):
+        attacks = rook_attacks(self.location.index, position.occupancy)
+        for move in self.slide_moves(attacks, CROSS_OFFSETS, position):
             yield move
@@ -0,0 +1,403 @@
+# -*- coding: utf-8 -*-
+
+"""
+Profiles chess_py on a fixed workload so that profiles taken on
+different machines, or before and after a change, can be compared.
+
+| python -m chess_py.profile perft --depth 4
+| python -m chess_py.profile selfplay --iterations 2 --top 5
+| python -m chess_py.profile pgn-replay --pgn games.pgn
+| python -m chess_py.profile legal-moves --sampling --collapsed legal-moves.folded
+
+The workloads are
+
+| perft        counts the legal move tree of the starting position
+| selfplay     plays seeded random games with ``Game.play``
+| pgn-replay   replays games given in PGN with ``converter.short_alg``
+| legal-moves  finds every legal move of the positions of ``perft.SUITE``
+
+The time spent in each function is grouped by the chess_py module it is
+defined in, such as ``core.board`` or ``core.algebraic.converter``, with
+everything else grouped together last. Functions are timed with
+``cProfile`` unless ``--sampling`` is given, in which case the stack is
+sampled on a timer, which slows the workload down much less but only
+works where ``signal.setitimer`` does. Sampled stacks can be written
+with ``--collapsed`` in the folded format read by flamegraph.pl and
+speedscope.
+
+Copyright © 2016 Aubhro Sengupta. All rights reserved.
+"""
+
+from __future__ import absolute_import, print_function
+
+import argparse
+import cProfile
+import os
+import pstats
+import random
+import re
+import signal
+import sys
+
+from .core import color
+from .core.algebraic import converter
+from .core.board import Board
+from .game.game import Game
+from .perft import SUITE, perft
+from .players.player import Player
+
+WORKLOADS = ("perft", "selfplay", "pgn-replay", "legal-moves")
+
+# Iterations of each workload but perft, which is sized by depth
+DEFAULT_ITERATIONS = {"selfplay": 4, "pgn-replay": 20, "legal-moves": 100}
+
+# Plies after which a self play game is stopped
+SELFPLAY_PLIES = 200
+
+DEFAULT_INTERVAL = 0.001
+
+OTHER = "(outside chess_py)"
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+GAMES = """
+[Event "Paris"]
+[White "Paul Morphy"]
+[Black "Duke Karl / Count Isouard"]
+[Result "1-0"]
+
+1. e4 e5 2. Nf3 d6 3. d4 Bg4 4. dxe5 Bxf3 5. Qxf3 dxe5 6. Bc4 Nf6 7. Qb3 Qe7
+8. Nc3 c6 9. Bg5 b5 10. Nxb5 cxb5 11. Bxb5+ Nbd7 12. O-O-O Rd8 13. Rxd7 Rxd7
+14. Rd1 Qe6 15. Bxd7+ Nxd7 16. Qb8+ Nxb8 17. Rd8# 1-0
+
+[Event "London"]
+[White "Adolf Anderssen"]
+[Black "Lionel Kieseritzky"]
+[Result "1-0"]
+
+1. e4 e5 2. f4 exf4 3. Bc4 Qh4+ 4. Kf1 b5 5. Bxb5 Nf6 6. Nf3 Qh6 7. d3 Nh5
+8. Nh4 Qg5 9. Nf5 c6 10. g4 Nf6 11. Rg1 cxb5 12. h4 Qg6 13. h5 Qg5 14. Qf3 Ng8
+15. Bxf4 Qf6 16. Nc3 Bc5 17. Nd5 Qxb2 18. Bd6 Bxg1 19. e5 Qxa1+ 20. Ke2 Na6
+21. Nxg7+ Kd8 22. Qf6+ Nxf6 23. Be7# 1-0
+"""
+
+_RESULTS = ("1-0", "0-1", "1/2-1/2", "*")
+
+
+class _PlyLimit(Exception):
+    pass
+
+
+class _RandomPlayer(Player):
+    def __init__(self, input_color, rand, plies):
+        """
+        Creates a player that plays a random legal move, and stops the
+        game once ``plies`` has no plies left.
+
+        :type: input_color: Color
+        :type: rand: Random
+        :type: plies: list
+        """
+        super(_RandomPlayer, self).__init__(input_color)
+        self.rand = rand
+        self.plies = plies
+
+    def generate_move(self, position):
+        if self.plies[0] == 0:
+            raise _PlyLimit()
+
+        self.plies[0] -= 1
+        return self.rand.choice(position.all_possible_moves(self.color))
+
+
+def pgn_games(text):
+    """
+    Finds the moves of every game in PGN ``text`` in standard
+    algebraic notation. Tags, comments, variations, move numbers and
+    annotations are left out.
+
+    :type: text: str
+    :rtype: list
+    """
+    text = re.sub(r"^\s*\[.*\]\s*$", " ", text, flags=re.MULTILINE)
+    text = re.sub(r"\{[^}]*\}|;[^\n]*", " ", text)
+    while "(" in text:
+        text = re.sub(r"\([^()]*\)", " ", text)
+
+    games = []
+    moves = []
+    for token in text.split():
+        if token in _RESULTS:
+            games.append(moves)
+            moves = []
+            continue
+
+        token = re.sub(r"^\d+\.+", "", token).rstrip("+#!?")
+        if token and not token.startswith("$"):
+            moves.append(token)
+
+    if moves:
+        games.append(moves)
+
+    return games
+
+
+def _replay(games):
+    for moves in games:
+        board = Board.init_default()
+        input_color = color.white
+        for move in moves:
+            board.update(converter.short_alg(move, input_color, board))
+            input_color = -input_color
+
+
+def _selfplay(games, seed):
+    rand = random.Random(seed)
+    for _ in range(games):
+        plies = [SELFPLAY_PLIES]
+        try:
+            Game(_RandomPlayer(color.white, rand, plies), _RandomPlayer(color.black, rand, plies)).play()
+        except _PlyLimit:
+            pass
+
+
+def _legal_moves(boards, rounds):
+    for _ in range(rounds):
+        for board in boards:
+            board.move_cache.clear()
+            board.all_possible_moves(board.side_to_move)
+
+
+def workload(name, depth=4, iterations=None, seed=0, pgn=GAMES):
+    """
+    Finds a function running the workload ``name``, one of
+    ``WORKLOADS``, with everything it needs already set up.
+
+    :type: name: str
+    :type: depth: int
+    :type: iterations: int
+    :type: seed: int
+    :type: pgn: str
+    :rtype: function
+    """
+    if name not in WORKLOADS:
+        raise ValueError("Unknown workload {}".format(name))
+
+    if iterations is None:
+        iterations = DEFAULT_ITERATIONS.get(name)
+
+    if name == "perft":
+        return lambda: perft(Board.init_default(), depth)
+    if name == "selfplay":
+        return lambda: _selfplay(iterations, seed)
+    if name == "pgn-replay":
+        games = pgn_games(pgn) * iterations
+        return lambda: _replay(games)
+
+    boards = [Board.from_fen(entry.fen) for entry in SUITE]
+    return lambda: _legal_moves(boards, iterations)
+
+
+class Sampler:
+    def __init__(self, interval=DEFAULT_INTERVAL):
+        """
+        Creates a profiler that records the stack every ``interval``
+        seconds of CPU time.
+
+        :type: interval: float
+        """
+        self.interval = interval
+        self.stacks = {}
+
+    def _sample(self, signum, frame):
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+            frame = frame.f_back
+
+        stack = tuple(reversed(stack))
+        self.stacks[stack] = self.stacks.get(stack, 0) + 1
+
+    def run(self, fn):
+        """
+        Samples the stack while ``fn`` runs.
+
+        :type: fn: function
+        """
+        previous = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        try:
+            fn()
+        finally:
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, previous)
+
+    def timings(self):
+        """
+        Finds the time spent in each function as in ``_timings``. Calls
+        are not known and are ``None``.
+
+        :rtype: dict
+        """
+        timings = {}
+        for stack, samples in self.stacks.items():
+            seconds = samples * self.interval
+            for function in set(stack):
+                timings.setdefault(function, [0.0, 0.0, None])[1] += seconds
+
+            timings[stack[-1]][0] += seconds
+
+        return timings
+
+    def collapsed(self):
+        """
+        Finds the sampled stacks in the folded format, one line per
+        stack with the frames from the outermost and the sample count.
+
+        :rtype: list
+        """
+        lines = []
+        for stack, samples in self.stacks.items():
+            frames = ";".join(_label(function) for function in stack)
+            lines.append("{} {}".format(frames, samples))
+
+        return sorted(lines)
+
+
+def _timings(profiler):
+    """
+    Finds the time spent in each function profiled by ``profiler``, keyed
+    by file, line and name, as a list of the time spent in the function
+    itself, the time including the functions it called and the calls.
+
+    :type: profiler: cProfile.Profile
+    :rtype: dict
+    """
+    return dict((function, [tt, ct, nc])
+                for function, (cc, nc, tt, ct, callers) in pstats.Stats(profiler).stats.items())
+
+
+def module_name(filename):
+    """
+    Finds the name of the chess_py module defined in ``filename``
+    relative to the package, such as ``core.board``. Returns ``None``
+    for files outside of chess_py.
+
+    :type: filename: str
+    :rtype: str
+    """
+    path = os.path.abspath(filename)
+    if not path.startswith(_PACKAGE_DIR + os.sep):
+        return None
+
+    module = os.path.splitext(os.path.relpath(path, _PACKAGE_DIR))[0].replace(os.sep, ".")
+    if module.endswith("__init__"):
+        module = module[:-len("__init__")].rstrip(".") or "__init__"
+
+    return module
+
+
+def _label(function):
+    filename, line, name = function
+    module = module_name(filename)
+    if module is None:
+        return "{}:{}".format(os.path.basename(filename), name)
+
+    return "chess_py.{}:{}".format(module, name)
+
+
+def report(timings, top=10, out=sys.stdout):
+    """
+    Prints the time spent in each chess_py module, most first, with the
+    ``top`` functions of each by their own time. Every row has the same
+    columns: own seconds, own time as a percent of the whole profile,
+    cumulative seconds and calls, which modules leave as ``-``.
+
+    :type: timings: dict
+    :type: top: int
+    :type: out: file
+    """
+    modules = {}
+    for function, timing in timings.items():
+        modules.setdefault(module_name(function[0]) or OTHER, []).append((function, timing))
+
+    total = sum(timing[0] for timing in timings.values()) or 1.0
+
+    def module_time(module):
+        return sum(timing[0] for function, timing in modules[module])
+
+    order = sorted((module for module in modules if module != OTHER), key=module_time, reverse=True)
+    if OTHER in modules:
+        order.append(OTHER)
+
+    print("{:<44} {:>10} {:>8} {:>10} {:>10}".format("module / function", "own s", "own %", "total s", "calls"),
+          file=out)
+    for module in order:
+        seconds = module_time(module)
+        print("{:<44} {:>10.3f} {:>7.1f}% {:>10} {:>10}".format(module, seconds, seconds / total * 100, "-", "-"),
+              file=out)
+
+        functions = sorted(modules[module], key=lambda entry: entry[1][0], reverse=True)
+        for (filename, line, name), (own, cumulative, calls) in functions[:top]:
+            print("    {:<40} {:>10.3f} {:>7.1f}% {:>10.3f} {:>10}".format(
+                "{}:{}".format(name, line), own, own / total * 100, cumulative,
+                "-" if calls is None else calls), file=out)
+
+
+def main(args=None):
+    """
+    Profiles a workload from the command line.
+
+    :type: args: list
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(prog="python -m chess_py.profile",
+                                     description="Profile chess_py on a fixed workload.")
+    parser.add_argument("workload", choices=WORKLOADS)
+    parser.add_argument("--depth", type=int, default=4, help="perft depth (default 4)")
+    parser.add_argument("--iterations", type=int,
+                        help="games, replays of the PGN or rounds of legal-moves (default {})".format(
+                            ", ".join("{} {}".format(value, name)
+                                      for name, value in sorted(DEFAULT_ITERATIONS.items()))))
+    parser.add_argument("--seed", type=int, default=0, help="random seed of selfplay (default 0)")
+    parser.add_argument("--pgn", help="PGN file to replay instead of the built in games")
+    parser.add_argument("--top", type=int, default=10, help="functions to print per module (default 10)")
+    parser.add_argument("--sampling", action="store_true", help="sample the stack instead of using cProfile")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL,
+                        help="seconds between samples (default {:g})".format(DEFAULT_INTERVAL))
+    parser.add_argument("--collapsed", metavar="FILE", help="write sampled stacks for a flamegraph")
+    args = parser.parse_args(args)
+
+    if args.collapsed and not args.sampling:
+        parser.error("--collapsed needs --sampling")
+    if args.sampling and not hasattr(signal, "setitimer"):
+        parser.error("--sampling is not supported on this platform")
+
+    pgn = GAMES
+    if args.pgn is not None:
+        with open(args.pgn) as pgn_file:
+            pgn = pgn_file.read()
+
+    fn = workload(args.workload, args.depth, args.iterations, args.seed, pgn)
+
+    if args.sampling:
+        sampler = Sampler(args.interval)
+        sampler.run(fn)
+        timings = sampler.timings()
+
+        if args.collapsed:
+            with open(args.collapsed, "w") as collapsed_file:
+                for line in sampler.collapsed():
+                    collapsed_file.write(line + "\n")
+    else:
+        profiler = cProfile.Profile()
+        profiler.runcall(fn)
+        timings = _timings(profiler)
+
+    report(timings, args.top)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
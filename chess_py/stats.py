@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+"""
+Counts the work chess_py does inside a block of code.
+
+| with stats.collect() as counters:
+|     for move in board.all_possible_moves(color.white):
+|         child = copy(board)
+|         child.update(move)
+|         child.all_possible_moves(color.black)
+| print(counters)
+
+From the starting position this prints
+``Counters(copies=20, updates=20, legal_moves=420, pseudo_legal_moves=0,
+legality_tests=0, in_check_calls=0, cache_hits=0, cache_misses=21)``.
+
+``copies`` counts ``Board.__copy__`` and ``Board.child`` calls, ``updates``
+counts ``Board.update`` calls, ``legal_moves`` counts the moves yielded
+by legal move generation, which drops illegal moves before they are
+yielded, and ``pseudo_legal_moves`` the moves yielded by pseudo legal
+generation, as in ``PSEUDO`` modes. ``legality_tests`` counts single
+pseudo legal moves tested for legality, as ``MovePicker`` and
+``Board.is_legal`` do, ``in_check_calls`` counts ``King.in_check`` calls
+and ``cache_hits`` and ``cache_misses`` count lookups in the move caches.
+
+While a ``collect`` block is running the counted methods are replaced by
+wrappers, and the originals are put back when the last block ends, so
+code run outside of one pays nothing. Blocks may be nested, and each
+counts everything run inside it. Only work done in the current process
+is counted.
+
+Copyright © 2016 Aubhro Sengupta. All rights reserved.
+"""
+
+import functools
+from contextlib import contextmanager
+
+from .core.board import ALL_SQUARES, Board
+from .core.move_cache import MoveCache
+from .pieces.king import King
+
+# Counters being filled by a running ``collect`` block
+_active = []
+
+# Original methods as (class, name, method), while they are replaced
+_originals = []
+
+
+class Counters:
+    FIELDS = ("copies", "updates", "legal_moves", "pseudo_legal_moves", "legality_tests",
+              "in_check_calls", "cache_hits", "cache_misses")
+
+    def __init__(self):
+        """
+        Creates counters that are all 0.
+        """
+        for field in self.FIELDS:
+            setattr(self, field, 0)
+
+    def __repr__(self):
+        return "Counters({})".format(", ".join("{}={}".format(field, getattr(self, field))
+                                               for field in self.FIELDS))
+
+    def as_dict(self):
+        """
+        Finds every counter by name.
+
+        :rtype: dict
+        """
+        return dict((field, getattr(self, field)) for field in self.FIELDS)
+
+
+def _add(field, amount=1):
+    for counters in _active:
+        setattr(counters, field, getattr(counters, field) + amount)
+
+
+def _counting_calls(field, method):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        _add(field)
+        return method(*args, **kwargs)
+
+    return wrapper
+
+
+def _counting_moves(method):
+    @functools.wraps(method)
+    def wrapper(self, input_color, captures=True, quiets=True, legal=True, start_squares=ALL_SQUARES):
+        field = "legal_moves" if legal else "pseudo_legal_moves"
+        for move in method(self, input_color, captures, quiets, legal, start_squares):
+            _add(field)
+            yield move
+
+    return wrapper
+
+
+def _counting_lookups(method):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        moves = method(*args, **kwargs)
+        _add("cache_misses" if moves is None else "cache_hits")
+        return moves
+
+    return wrapper
+
+
+def _wrappers():
+    return [(Board, "__copy__", functools.partial(_counting_calls, "copies")),
+            (Board, "child", functools.partial(_counting_calls, "copies")),
+            (Board, "update", functools.partial(_counting_calls, "updates")),
+            (Board, "_calc_packed_moves", _counting_moves),
+            (Board, "_is_legal_packed", functools.partial(_counting_calls, "legality_tests")),
+            (King, "in_check", functools.partial(_counting_calls, "in_check_calls")),
+            (MoveCache, "get", _counting_lookups)]
+
+
+def _install():
+    for cls, name, wrap in _wrappers():
+        method = vars(cls)[name]
+        _originals.append((cls, name, method))
+        setattr(cls, name, wrap(method))
+
+
+def _uninstall():
+    while _originals:
+        cls, name, method = _originals.pop()
+        setattr(cls, name, method)
+
+
+def is_enabled():
+    """
+    Finds if a ``collect`` block is running.
+
+    :rtype: bool
+    """
+    return bool(_active)
+
+
+@contextmanager
+def collect():
+    """
+    Counts the work done until the block ends. Yields the ``Counters``,
+    which keep their values after it ends.
+
+    :rtype: Counters
+    """
+    counters = Counters()
+    if not _active:
+        _install()
+
+    _active.append(counters)
+    try:
+        yield counters
+    finally:
+        _active.remove(counters)
+        if not _active:
+            _uninstall()
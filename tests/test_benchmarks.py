@@ -0,0 +1,41 @@
+import gc
+from unittest import TestCase
+
+from benchmarks import micro
+
+
+class TestMicro(TestCase):
+    def test_regressions(self):
+        baseline = {"a": 1.0, "b": 1.0, "c": 2.0, "d": 0}
+        results = {"a": 1.2, "b": 1.3, "c": 1.0, "d": 1.0, "e": 5.0}
+
+        self.assertEqual(list(micro.regressions(results, baseline, 25)), ["b"])
+        self.assertAlmostEqual(micro.regressions(results, baseline, 25)["b"], 30)
+        self.assertEqual(sorted(micro.regressions(results, baseline, 10)), ["a", "b"])
+
+    def test_opera_game_is_won_by_white(self):
+        self.assertEqual(micro._opera_game().play(), 0)
+
+    def test_metric_names_are_unique(self):
+        names = [metric[0] for metric in micro.metrics()]
+
+        self.assertEqual(len(names), len(set(names)))
+        self.assertEqual(len(names), 7 * len(micro.POSITIONS) + 1)
+
+    def test_median(self):
+        self.assertEqual(micro._median([3.0, 1.0, 2.0]), 2.0)
+        self.assertEqual(micro._median([4.0, 1.0, 2.0, 3.0]), 2.5)
+
+    def test_time_calls_disables_gc(self):
+        enabled = []
+        calls = []
+
+        micro._time_calls(lambda: None, lambda arg: enabled.append(gc.isenabled()), 5)
+        micro._time_calls(lambda: calls.append(1), lambda arg: None, micro._BATCH + 1)
+
+        self.assertEqual(enabled, [False] * 5)
+        self.assertTrue(gc.isenabled())
+        self.assertEqual(len(calls), micro._BATCH + 1)
+
+    def test_calibrate(self):
+        self.assertGreater(micro._calibrate(lambda: None, lambda arg: None, 0.01), 100)
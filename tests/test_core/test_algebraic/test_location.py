@@ -1,6 +1,9 @@
+import copy
+import pickle
 import unittest
 
 from chess_py import Location
+from chess_py.core.algebraic.location import NEIGHBORS
 
 
 class TestLocation(unittest.TestCase):
@@ -43,5 +46,25 @@ class TestLocation(unittest.TestCase):
     def testShiftDownLeft(self):
         self.assertEqual(Location(1, 1).shift_down_left(), Location(0, 0))
 
+    def testInterned(self):
+        self.assertIs(Location(3, 4), Location(3, 4))
+        self.assertIs(Location.from_string("e4"), Location(3, 4))
+        self.assertIs(copy.deepcopy(Location(3, 4)), Location(3, 4))
+        self.assertIs(pickle.loads(pickle.dumps(Location(3, 4))), Location(3, 4))
+
+    def testFromIndex(self):
+        self.assertIs(Location.from_index(28), Location(3, 4))
+        self.assertEqual(Location(7, 7).index, 63)
+        self.assertRaises(IndexError, Location.from_index, 64)
+        self.assertRaises(IndexError, Location, 8, 0)
+
+    def testNeighbor(self):
+        self.assertIs(Location(3, 4).neighbor(1, 0), Location(4, 4))
+        self.assertIs(Location(0, 0).neighbor(2, 1), Location(2, 1))
+        self.assertIs(Location(3, 4).neighbor(3, -3), Location(6, 1))
+        self.assertIsNone(Location(7, 4).neighbor(1, 0))
+        self.assertIsNone(Location(0, 0).neighbor(-1, -1))
+        self.assertIsNone(NEIGHBORS[(0, 1)][Location(3, 7).index])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,48 @@
+from unittest import TestCase
+
+from chess_py import Location
+from chess_py.core import attack_tables
+
+
+class TestAttackTables(TestCase):
+    def test_knight_targets(self):
+        self.assertEqual(len(attack_tables.KNIGHT_TARGETS[0]), 2)
+        self.assertEqual(len(attack_tables.KNIGHT_TARGETS[Location.from_string("e4").rank * 8 + 4]), 8)
+        self.assertEqual(set(attack_tables.KNIGHT_TARGETS[0]),
+                         {Location.from_string("b3"), Location.from_string("c2")})
+
+    def test_king_targets(self):
+        self.assertEqual(len(attack_tables.KING_TARGETS[63]), 3)
+        self.assertEqual(attack_tables.KING_ATTACKS[0], (1 << 1) | (1 << 8) | (1 << 9))
+
+    def test_pawn_pushes(self):
+        self.assertEqual(attack_tables.PAWN_PUSHES[True][12], Location.from_string("e3"))
+        self.assertEqual(attack_tables.PAWN_PUSHES[False][12], Location.from_string("e1"))
+        self.assertIsNone(attack_tables.PAWN_PUSHES[True][60])
+
+    def test_pawn_captures(self):
+        self.assertEqual(attack_tables.PAWN_CAPTURES[True][12],
+                         (Location.from_string("f3"), Location.from_string("d3")))
+        self.assertEqual(attack_tables.PAWN_CAPTURES[False][8], (Location.from_string("b1"),))
+        self.assertEqual(attack_tables.PAWN_ATTACKS[True][8], 1 << 17)
+
+    def test_rook_attacks(self):
+        # Rook on a1 of an empty board sees the whole first rank and a-file
+        self.assertEqual(attack_tables.rook_attacks(0, 0), 0xFE | 0x0101010101010100)
+
+        # Rook on d4 blocked on d6 and f4
+        blockers = (1 << 43) | (1 << 29)
+        attacks = attack_tables.rook_attacks(27, blockers)
+        self.assertTrue(attacks & (1 << 43))
+        self.assertFalse(attacks & (1 << 51))
+        self.assertTrue(attacks & (1 << 29))
+        self.assertFalse(attacks & (1 << 30))
+        self.assertTrue(attacks & (1 << 3))
+
+    def test_bishop_attacks(self):
+        self.assertEqual(attack_tables.bishop_attacks(0, 0), 0x8040201008040200)
+        self.assertEqual(attack_tables.bishop_attacks(0, 1 << 18), (1 << 9) | (1 << 18))
+
+    def test_iter_ray(self):
+        ray = attack_tables.RAYS[(-1, 0)][27]
+        self.assertEqual(list(attack_tables.iter_ray(ray, (-1, 0))), [19, 11, 3])
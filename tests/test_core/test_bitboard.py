@@ -0,0 +1,88 @@
+from copy import copy as cp
+from unittest import TestCase
+
+from chess_py import Board, BitBoard, color, Location, converter
+from chess_py import Pawn, Rook, King, piece_const
+
+
+class TestBitBoard(TestCase):
+    def setUp(self):
+        self.board = BitBoard.init_default()
+
+    def test_iter_matches_board(self):
+        board = Board.init_default()
+        board.update(converter.long_alg("e2e4", board))
+        self.board.update(converter.long_alg("e2e4", self.board))
+
+        self.assertEqual(list(self.board), list(board))
+        self.assertEqual(len(list(self.board)), 64)
+        self.assertEqual(list(self.board.pieces()), [piece for piece in board if piece is not None])
+
+    def test_init_default(self):
+        self.assertEqual(self.board.pieces_bitboard(Pawn, color.white), 0xFF00)
+        self.assertEqual(self.board.pieces_bitboard(Pawn, color.black), 0xFF << 48)
+        self.assertEqual(self.board.pieces_bitboard(King, color.white), 1 << 4)
+        self.assertEqual(self.board.occupancy, 0xFFFF00000000FFFF)
+
+    def test_is_square_empty(self):
+        self.assertTrue(self.board.is_square_empty(Location(2, 0)))
+        self.assertFalse(self.board.is_square_empty(Location(0, 3)))
+
+    def test_update_keeps_bitboards_in_sync(self):
+        self.board.update(converter.long_alg("e2e4", self.board))
+
+        self.assertTrue(self.board.is_square_empty(Location.from_string("e2")))
+        self.assertFalse(self.board.is_square_empty(Location.from_string("e4")))
+        self.assertEqual(self.board.pieces_bitboard(Pawn, color.white), 0xEF00 | (1 << 28))
+
+    def test_capture_clears_captured_piece(self):
+        self.board.update(converter.short_alg("e4", color.white, self.board))
+        self.board.update(converter.short_alg("d5", color.black, self.board))
+        self.board.update(converter.short_alg("exd5", color.white, self.board))
+
+        self.assertEqual(self.board.pieces_bitboard(Pawn, color.black) >> 32 & 0xFF, 0)
+        self.assertEqual(bin(self.board.pieces_bitboard(Pawn, color.black)).count("1"), 7)
+
+    def test_find_king(self):
+        self.assertEqual(self.board.find_king(color.white), Location(0, 4))
+        self.assertEqual(self.board.find_king(color.black), Location(7, 4))
+
+    def test_get_piece(self):
+        self.assertEqual(self.board.get_piece(Rook, color.black), Location(7, 0))
+
+    def test_material_advantage(self):
+        self.board.remove_piece_at_square(Location(0, 0))
+
+        self.assertEqual(self.board.material_advantage(color.white, piece_const.PieceValues()), -5)
+        self.assertEqual(self.board.material_advantage(color.black, piece_const.PieceValues()), 5)
+
+    def test_copy(self):
+        tester = cp(self.board)
+        tester.update(converter.long_alg("e2e4", tester))
+
+        self.assertFalse(self.board.is_square_empty(Location.from_string("e2")))
+        self.assertNotEqual(self.board.occupancy, tester.occupancy)
+
+    def test_child(self):
+        child = self.board.child(converter.long_alg("e2e4", self.board))
+
+        self.assertIsInstance(child, BitBoard)
+        self.assertEqual(self.board.pieces_bitboard(Pawn, color.white), 0xFF00)
+        self.assertEqual(child.pieces_bitboard(Pawn, color.white), 0x1000EF00)
+
+    def test_from_fen(self):
+        board = BitBoard.from_fen("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1")
+
+        self.assertIsInstance(board, BitBoard)
+        self.assertEqual(board.pieces_bitboard(Pawn, color.white), 0xFF00)
+        self.assertEqual(board.to_fen(), self.board.to_fen())
+
+    def test_all_possible_moves_matches_board(self):
+        board = Board.init_default()
+        for alg, turn in [("e4", color.white), ("e5", color.black), ("Nf3", color.white),
+                          ("Nc6", color.black), ("Bc4", color.white)]:
+            board.update(converter.short_alg(alg, turn, board))
+            self.board.update(converter.short_alg(alg, turn, self.board))
+
+        self.assertEqual({str(move) for move in board.all_possible_moves(color.black)},
+                         {str(move) for move in self.board.all_possible_moves(color.black)})
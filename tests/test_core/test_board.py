@@ -1,7 +1,12 @@
 from unittest import TestCase
+from copy import copy as cp
 
 from chess_py import Board, color, Location
 from chess_py import Pawn, Knight, Bishop, Rook, Queen, King, piece_const, converter
+from chess_py.core.algebraic import notation_const
+from chess_py.core import packed_move
+from chess_py.core.board import ALL_CASTLING_RIGHTS, PSEUDO, LEGAL, CAPTURES, EVASIONS, \
+    PSEUDO_CAPTURES, PSEUDO_QUIETS
 
 
 class TestBoard(TestCase):
@@ -104,7 +109,7 @@ class TestBoard(TestCase):
         self.assertEqual(self.board.advantage_as_result(converter.long_alg("e2e4", self.board),
                                                         piece_const.PieceValues()), 0)
 
-        self.board.position[1][3] = None
+        self.board.remove_piece_at_square(Location(1, 3))
         self.assertEqual(
             self.board.advantage_as_result(converter.long_alg("d1d7", self.board), piece_const.PieceValues()), 0)
 
@@ -212,7 +217,7 @@ class TestBoard(TestCase):
         self.assertIsInstance(pawn, Pawn)
         self.assertEqual(self.board.piece_at_square(Location.from_string("e3")), pawn)
         self.assertIsNone(self.board.piece_at_square(Location.from_string("e2")))
-        self.assertFalse(pawn.just_moved_two_steps)
+        self.assertIsNone(self.board.en_passant_square)
 
     def test_update_pawn_moves_two_steps(self):
         pawn = self.board.piece_at_square(Location.from_string("e2"))
@@ -222,11 +227,15 @@ class TestBoard(TestCase):
         self.assertEqual(self.board.piece_at_square(Location.from_string("e4")), pawn)
         self.assertIsNone(self.board.piece_at_square(Location.from_string("e2")))
         self.assertIsNone(self.board.piece_at_square(Location.from_string("e3")))
-        self.assertTrue(pawn.just_moved_two_steps)
+        self.assertIs(self.board.en_passant_square, Location.from_string("e3"))
 
         self.board.update(converter.long_alg("d2d4", self.board))
 
-        self.assertFalse(pawn.just_moved_two_steps)
+        self.assertIs(self.board.en_passant_square, Location.from_string("d3"))
+
+        self.board.update(converter.long_alg("g8f6", self.board))
+
+        self.assertIsNone(self.board.en_passant_square)
 
     def test_update_moves_king_side_castle(self):
         self.board.update(converter.short_alg("e4", color.white, self.board))
@@ -236,8 +245,431 @@ class TestBoard(TestCase):
 
         king = self.board.piece_at_square(Location.from_string("g1"))
         self.assertIsInstance(king, King)
-        self.assertTrue(king.has_moved)
+        self.assertEqual(king.location, Location.from_string("g1"))
 
         rook = self.board.piece_at_square(Location.from_string("f1"))
         self.assertIsInstance(rook, Rook)
-        self.assertTrue(rook.has_moved)
+        self.assertEqual(self.board.castling_rights,
+                         notation_const.BLACK_KING_SIDE | notation_const.BLACK_QUEEN_SIDE)
+
+    def test_update_rook_move_loses_castling_right(self):
+        self.board.update(converter.long_alg("a2a4", self.board))
+        self.board.update(converter.long_alg("h7h5", self.board))
+        self.board.update(converter.long_alg("a1a3", self.board))
+        self.board.update(converter.long_alg("h8h6", self.board))
+
+        self.assertEqual(self.board.castling_rights,
+                         notation_const.WHITE_KING_SIDE | notation_const.BLACK_QUEEN_SIDE)
+
+        # Moving the Rook back does not restore the right
+        self.board.update(converter.long_alg("a3a1", self.board))
+        self.assertFalse(self.board.castling_rights & notation_const.WHITE_QUEEN_SIDE)
+
+    def test_make_move_unmake_move(self):
+        self.board.update(converter.short_alg("e4", color.white, self.board))
+        test = Board.init_default()
+        test.update(converter.short_alg("e4", color.white, test))
+
+        undo = self.board.make_move(converter.short_alg("e5", color.black, self.board))
+        self.assertIs(self.board.en_passant_square, Location.from_string("e6"))
+        self.board.unmake_move(undo)
+
+        self.assertEqual(self.board, test)
+        self.assertIs(self.board.en_passant_square, Location.from_string("e3"))
+
+    def test_unmake_move_castle(self):
+        self.board.update(converter.short_alg("e4", color.white, self.board))
+        self.board.update(converter.short_alg("Nf3", color.white, self.board))
+        self.board.update(converter.short_alg("Be2", color.white, self.board))
+
+        king = self.board.piece_at_square(Location.from_string("e1"))
+        rook = self.board.piece_at_square(Location.from_string("h1"))
+        undo = self.board.make_move(converter.short_alg("o-o", color.white, self.board))
+
+        self.assertEqual(self.board.king_loc_dict[color.white], Location.from_string("g1"))
+        self.assertFalse(self.board.castling_rights & notation_const.WHITE_KING_SIDE)
+        self.board.unmake_move(undo)
+
+        self.assertIs(self.board.piece_at_square(Location.from_string("e1")), king)
+        self.assertIs(self.board.piece_at_square(Location.from_string("h1")), rook)
+        self.assertEqual(king.location, Location.from_string("e1"))
+        self.assertEqual(self.board.castling_rights, ALL_CASTLING_RIGHTS)
+        self.assertEqual(self.board.king_loc_dict[color.white], Location.from_string("e1"))
+        self.assertTrue(self.board.is_square_empty(Location.from_string("f1")))
+        self.assertTrue(self.board.is_square_empty(Location.from_string("g1")))
+
+    def test_is_square_attacked(self):
+        self.assertTrue(self.board.is_square_attacked(Location.from_string("f3"), color.white))
+        self.assertTrue(self.board.is_square_attacked(Location.from_string("d6"), color.black))
+        self.assertFalse(self.board.is_square_attacked(Location.from_string("e4"), color.white))
+        self.assertFalse(self.board.is_square_attacked(Location.from_string("f3"), color.black))
+
+        # Sliding attacks are blocked by the first piece on the ray
+        self.board.update(converter.short_alg("e4", color.white, self.board))
+        self.assertTrue(self.board.is_square_attacked(Location.from_string("h5"), color.white))
+        self.assertTrue(self.board.is_square_attacked(Location.from_string("a6"), color.white))
+        self.assertFalse(self.board.is_square_attacked(Location.from_string("e7"), color.white))
+
+    def _empty_board(self, *pieces, **kwargs):
+        position = [[None for _ in range(8)] for _ in range(8)]
+        for piece in pieces:
+            position[piece.location.rank][piece.location.file] = piece
+        return Board(position, **kwargs)
+
+    def test_all_possible_moves_pinned_piece(self):
+        board = self._empty_board(King(color.white, Location.from_string("e1")),
+                                  Rook(color.white, Location.from_string("e2")),
+                                  Rook(color.black, Location.from_string("e8")),
+                                  King(color.black, Location.from_string("a8")))
+
+        rook_moves = {str(move) for move in board.all_possible_moves(color.white)
+                      if isinstance(move.piece, Rook)}
+
+        self.assertEqual(rook_moves, {"e2e3", "e2e4", "e2e5", "e2e6", "e2e7", "e2e8"})
+
+    def test_all_possible_moves_double_check(self):
+        board = self._empty_board(King(color.white, Location.from_string("e1")),
+                                  Queen(color.white, Location.from_string("a1")),
+                                  Rook(color.black, Location.from_string("e8")),
+                                  Knight(color.black, Location.from_string("d3")),
+                                  King(color.black, Location.from_string("a8")))
+
+        moves = board.all_possible_moves(color.white)
+
+        self.assertTrue(len(moves) > 0)
+        for move in moves:
+            self.assertIsInstance(move.piece, King)
+
+    def test_all_possible_moves_en_passant_discovered_check(self):
+        board = self._empty_board(King(color.white, Location.from_string("a5")),
+                                  Pawn(color.white, Location.from_string("b5")),
+                                  Pawn(color.black, Location.from_string("c5")),
+                                  Rook(color.black, Location.from_string("h5")),
+                                  King(color.black, Location.from_string("h8")),
+                                  en_passant_square=Location.from_string("c6"))
+
+        self.assertNotIn("b5c6", {str(move) for move in board.all_possible_moves(color.white)})
+
+    def test_pieces_of(self):
+        self.assertEqual(len(self.board.pieces_of(color.white)), 16)
+        self.assertEqual(len(self.board.pieces_of(color.black, Pawn)), 8)
+
+        self.board.update(converter.short_alg("e4", color.white, self.board))
+        self.board.update(converter.short_alg("d5", color.black, self.board))
+        self.board.update(converter.short_alg("exd5", color.white, self.board))
+
+        self.assertEqual(len(self.board.pieces_of(color.black, Pawn)), 7)
+        self.assertIn(Location.from_string("d5"),
+                      [pawn.location for pawn in self.board.pieces_of(color.white, Pawn)])
+
+    def test_king_square(self):
+        self.assertEqual(self.board.king_square(color.white), Location.from_string("e1"))
+
+        self.board.update(converter.short_alg("e4", color.white, self.board))
+        self.board.update(converter.short_alg("Ke2", color.white, self.board))
+
+        self.assertEqual(self.board.king_square(color.white), Location.from_string("e2"))
+        self.assertIsNone(Board([[None for _ in range(8)] for _ in range(8)]).king_square(color.white))
+
+    def test_get_piece(self):
+        self.assertEqual(self.board.get_piece(Queen, color.black), Location.from_string("d8"))
+        self.assertEqual(self.board.get_piece(Knight, color.white), Location.from_string("b1"))
+
+    def test_zobrist_key_make_unmake(self):
+        key = self.board.zobrist_key
+        undo = self.board.make_move(converter.short_alg("e4", color.white, self.board))
+        self.assertNotEqual(self.board.zobrist_key, key)
+        self.assertEqual(self.board.side_to_move, color.black)
+
+        self.board.unmake_move(undo)
+        self.assertEqual(self.board.zobrist_key, key)
+        self.assertEqual(self.board.side_to_move, color.white)
+
+    def _play(self, board, *moves):
+        input_color = color.white
+        for move in moves:
+            board.update(converter.short_alg(move, input_color, board))
+            input_color = -input_color
+
+    def _played(self, *moves):
+        board = Board.init_default()
+        self._play(board, *moves)
+        return board
+
+    def test_zobrist_key_transposition(self):
+        test = Board.init_default()
+        self._play(self.board, "Nf3", "Nc6", "Nc3", "Nf6")
+        self._play(test, "Nc3", "Nf6", "Nf3", "Nc6")
+
+        self.assertEqual(self.board.zobrist_key, test.zobrist_key)
+        self.assertEqual(self.board.zobrist_key, Board(self.board.position).zobrist_key)
+
+    def test_zobrist_key_en_passant(self):
+        pieces = (King(color.white, Location.from_string("e1")),
+                  Pawn(color.white, Location.from_string("e5")),
+                  Pawn(color.black, Location.from_string("d5")),
+                  King(color.black, Location.from_string("e8")))
+        d6 = Location.from_string("d6")
+
+        # Same pieces and side to move, but only one can capture en passant
+        self.assertNotEqual(self._empty_board(*pieces, en_passant_square=d6).zobrist_key,
+                            self._empty_board(*pieces).zobrist_key)
+        self.assertEqual(hash(self._empty_board(*pieces, en_passant_square=d6)),
+                         hash(self._empty_board(*pieces)))
+
+    def test_zobrist_key_en_passant_without_capture(self):
+        test = Board.init_default()
+        self._play(self.board, "e4", "Nf6", "Nf3", "Ng8", "Ng1")
+        self._play(test, "e4")
+
+        # No black pawn can take on e3, so the positions are the same
+        self.assertIsNotNone(test.en_passant_square)
+        self.assertEqual(self.board.zobrist_key, test.zobrist_key)
+
+    def test_zobrist_key_castling(self):
+        test = Board.init_default()
+        self._play(self.board, "e4", "e5", "Ke2", "Ke7", "Ke1", "Ke8")
+        self._play(test, "e4", "e5")
+
+        self.assertEqual(self.board.castling_rights, 0)
+        self.assertEqual(test.castling_rights, 15)
+        self.assertNotEqual(self.board.zobrist_key, test.zobrist_key)
+
+    def test_zobrist_key_copy(self):
+        self._play(self.board, "e4", "e5", "Ke2")
+
+        self.assertEqual(cp(self.board).zobrist_key, self.board.zobrist_key)
+
+    def test_no_instance_dicts(self):
+        move = converter.short_alg("e4", color.white, self.board)
+
+        for obj in [move, move.end_loc, color.white] + self.board.pieces_of(color.white):
+            self.assertFalse(hasattr(obj, "__dict__"), obj)
+
+    def test_pieces_are_shared(self):
+        pawn = Pawn(color.white, Location.from_string("e2"))
+
+        self.assertIs(pawn, self.board.piece_at_square(Location.from_string("e2")))
+        self.assertIs(pawn.at(Location.from_string("e4")), Pawn(color.white, Location.from_string("e4")))
+        self.assertIsNot(pawn, Pawn(color.black, Location.from_string("e2")))
+
+        with self.assertRaises(AttributeError):
+            pawn.location = Location.from_string("e4")
+
+    def test_copy_shares_pieces(self):
+        self._play(self.board, "e4")
+        board = cp(self.board)
+
+        self.assertIs(board.position[0][4], self.board.position[0][4])
+        self.assertIs(board.en_passant_square, self.board.en_passant_square)
+        self.assertEqual(board.castling_rights, self.board.castling_rights)
+
+        board.update(converter.short_alg("e5", color.black, board))
+        self.assertIsNotNone(self.board.piece_at_square(Location.from_string("e7")))
+        self.assertIs(self.board.en_passant_square, Location.from_string("e3"))
+
+    def test_castling_rights_from_position(self):
+        board = self._empty_board(King(color.white, Location.from_string("e1")),
+                                  Rook(color.white, Location.from_string("h1")),
+                                  King(color.black, Location.from_string("e8")),
+                                  Rook(color.black, Location.from_string("a8")))
+
+        self.assertEqual(board.castling_rights,
+                         notation_const.WHITE_KING_SIDE | notation_const.BLACK_QUEEN_SIDE)
+        self.assertEqual(self._empty_board(King(color.white, Location.from_string("e1")),
+                                           Rook(color.white, Location.from_string("h1")),
+                                           castling_rights=0).castling_rights, 0)
+
+    def test_child(self):
+        move = converter.short_alg("e4", color.white, self.board)
+        child = self.board.child(move)
+
+        self.assertEqual(self.board, Board.init_default())
+        self.assertIsNotNone(self.board.piece_at_square(Location.from_string("e2")))
+        self.assertIsInstance(child.piece_at_square(Location.from_string("e4")), Pawn)
+        self.assertIs(child.en_passant_square, Location.from_string("e3"))
+        self.assertEqual(child.zobrist_key, self._played("e4").zobrist_key)
+
+        # Only the ranks the move touched are copied
+        self.assertIsNot(child.position[1], self.board.position[1])
+        self.assertIsNot(child.position[3], self.board.position[3])
+        for rank in (0, 2, 4, 5, 6, 7):
+            self.assertIs(child.position[rank], self.board.position[rank])
+
+    def test_child_parent_changes_are_not_shared(self):
+        child = self.board.child(converter.short_alg("e4", color.white, self.board))
+        self.board.update(converter.short_alg("d4", color.white, self.board))
+        grandchild = child.child(converter.short_alg("e5", color.black, child))
+
+        self.assertIsNone(child.piece_at_square(Location.from_string("d4")))
+        self.assertIsNone(child.piece_at_square(Location.from_string("e5")))
+        self.assertEqual(len(child.pieces_of(color.black, Pawn)), 8)
+        self.assertEqual(grandchild, self._played("e4", "e5"))
+        self.assertEqual(self.board, self._played("d4"))
+
+    def test_generate_modes(self):
+        board = self._empty_board(King(color.white, Location.from_string("e1")),
+                                  Rook(color.white, Location.from_string("e2")),
+                                  Pawn(color.white, Location.from_string("a2")),
+                                  Rook(color.black, Location.from_string("e8")),
+                                  King(color.black, Location.from_string("a8")))
+
+        pseudo = {packed_move.to_string(move) for move in board.generate(color.white, PSEUDO)}
+        legal = {packed_move.to_string(move) for move in board.generate(color.white, LEGAL)}
+        captures = {packed_move.to_string(move) for move in board.generate(color.white, CAPTURES)}
+
+        self.assertIn("e2d2", pseudo)
+        self.assertNotIn("e2d2", legal)
+        self.assertTrue(legal < pseudo)
+        self.assertEqual(legal, {packed_move.to_string(move) for move in board.packed_moves(color.white)})
+        self.assertEqual(captures, {"e2e8"})
+
+        pseudo_captures = [packed_move.to_string(move) for move in board.generate(color.white, PSEUDO_CAPTURES)]
+        pseudo_quiets = [packed_move.to_string(move) for move in board.generate(color.white, PSEUDO_QUIETS)]
+        self.assertEqual(pseudo_captures, ["e2e8"])
+        self.assertIn("e2d2", pseudo_quiets)
+        self.assertEqual(set(pseudo_captures) | set(pseudo_quiets), pseudo)
+
+        with self.assertRaises(ValueError):
+            board.generate(color.white, EVASIONS)
+        with self.assertRaises(ValueError):
+            board.generate(color.white, "all")
+
+    def test_pseudo_keeps_squares_next_to_enemy_king(self):
+        king = King(color.white, Location.from_string("e1"))
+        board = self._empty_board(king, King(color.black, Location.from_string("e3")))
+
+        pseudo = {packed_move.to_string(move) for move in board.generate(color.white, PSEUDO)}
+        possible = {packed_move.to_string(packed_move.from_move(move)) for move in king.possible_moves(board)}
+
+        self.assertEqual(pseudo - possible, {"e1d2", "e1e2", "e1f2"})
+        self.assertEqual(possible, {"e1d1", "e1f1"})
+
+    def test_generate_evasions(self):
+        board = self._empty_board(King(color.white, Location.from_string("e1")),
+                                  Rook(color.white, Location.from_string("a2")),
+                                  Rook(color.black, Location.from_string("e8")),
+                                  King(color.black, Location.from_string("a8")))
+
+        evasions = {packed_move.to_string(move) for move in board.generate(color.white, EVASIONS)}
+
+        self.assertEqual(evasions, {"a2e2", "e1d1", "e1d2", "e1f1", "e1f2"})
+
+    def test_is_legal(self):
+        board = self._empty_board(King(color.white, Location.from_string("e1")),
+                                  Rook(color.white, Location.from_string("e2")),
+                                  Rook(color.black, Location.from_string("e8")),
+                                  King(color.black, Location.from_string("a8")))
+        e1 = Location.from_string("e1").index
+        e2 = Location.from_string("e2").index
+
+        self.assertTrue(board.is_legal(packed_move.pack(e2, Location.from_string("e5").index)))
+        self.assertFalse(board.is_legal(packed_move.pack(e2, Location.from_string("d2").index),
+                                        pseudo_legal=True))
+        self.assertFalse(board.is_legal(packed_move.pack(e1, Location.from_string("e3").index)))
+        self.assertFalse(board.is_legal(packed_move.pack(Location.from_string("e4").index, e1)))
+
+        self.assertTrue(self.board.is_legal(converter.short_alg("Nf3", color.white, self.board)))
+
+    def test_has_legal_move(self):
+        self.assertTrue(self.board.has_legal_move(color.white))
+        self.board.packed_moves(color.white)
+        self.assertTrue(self.board.has_legal_move(color.white))
+
+        self._play(self.board, "f3", "e5", "g4", "Qh4")
+        self.assertFalse(self.board.has_legal_move(color.white))
+        self.assertTrue(self.board.no_moves(color.white))
+
+    def test_from_fen(self):
+        board = Board.from_fen("r3k2r/8/8/3pP3/8/8/8/R3K2R w Kq d6 4 31")
+
+        self.assertEqual(board.side_to_move, color.white)
+        self.assertEqual(board.castling_rights, notation_const.WHITE_KING_SIDE | notation_const.BLACK_QUEEN_SIDE)
+        self.assertEqual(str(board.en_passant_square), "d6")
+        self.assertEqual(board.halfmove_clock, 4)
+        self.assertEqual(board.fullmove_number, 31)
+        self.assertIs(board.piece_at_square(Location.from_string("e5")), Pawn(color.white, Location.from_string("e5")))
+        self.assertIn("e5d6", [packed_move.to_string(move) for move in board.packed_moves(color.white)])
+
+        start = Board.from_fen("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1")
+        self.assertEqual(start, self.board)
+        self.assertEqual(start.zobrist_key, self.board.zobrist_key)
+        self.assertEqual(start.color_occupancy, self.board.color_occupancy)
+
+    def test_from_fen_without_move_counters(self):
+        board = Board.from_fen("8/8/1k6/2b5/2pP4/8/5K2/8 b - d3")
+
+        self.assertEqual(board.side_to_move, color.black)
+        self.assertEqual(board.castling_rights, 0)
+        self.assertEqual((board.halfmove_clock, board.fullmove_number), (0, 1))
+
+    def test_from_fen_invalid(self):
+        for fen in ("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq",
+                    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP w KQkq - 0 1",
+                    "rnbqkbnr/ppppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+                    "rnbqkbnr/pppppppp/9/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+                    "rnbqkbnr/pppppppp/7/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+                    "rnbqkbnr/ppppxppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+                    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR x KQkq - 0 1",
+                    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkx - 0 1",
+                    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq e4 0 1",
+                    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - x 1",
+                    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 0"):
+            with self.assertRaises(ValueError):
+                Board.from_fen(fen)
+
+    def test_from_fen_drops_unsupported_castling_rights(self):
+        board = Board.from_fen("4k3/8/8/8/8/8/8/R2K3R w KQ - 0 1")
+
+        self.assertEqual(board.castling_rights, 0)
+        self.assertEqual(board.to_fen(), "4k3/8/8/8/8/8/8/R2K3R w - - 0 1")
+        self.assertNotIn("d1f1", [packed_move.to_string(move) for move in board.packed_moves(color.white)])
+        self.assertNotIn("d1b1", [packed_move.to_string(move) for move in board.packed_moves(color.white)])
+
+        board = Board.from_fen("r3k2r/8/8/8/8/8/8/4K2R w KQkq - 0 1")
+        self.assertEqual(board.castling_rights, notation_const.WHITE_KING_SIDE |
+                         notation_const.BLACK_KING_SIDE | notation_const.BLACK_QUEEN_SIDE)
+
+    def test_castling_needs_king_on_home_square(self):
+        board = Board.from_fen("4k3/8/8/8/8/8/8/R2K3R w - - 0 1")
+        board.castling_rights = ALL_CASTLING_RIGHTS
+
+        self.assertFalse([move for move in board.packed_moves(color.white)
+                          if move >> 12 in (packed_move.KING_CASTLE, packed_move.QUEEN_CASTLE)])
+
+    def test_from_fen_en_passant_needs_pawn(self):
+        for fen in ("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq e6 0 1",
+                    "rnbqkbnr/pppppppp/8/8/4P3/8/PPPPPPPP/RNBQKBNR b KQkq e6 0 1",
+                    "rnbqkbnr/pppp1ppp/4p3/4p3/8/8/PPPPPPPP/RNBQKBNR w KQkq e6 0 1",
+                    "rnbqkbnr/pppppppp/8/8/4p3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1"):
+            with self.assertRaises(ValueError):
+                Board.from_fen(fen)
+
+        board = Board.from_fen("rnbqkbnr/pppp1ppp/8/4p3/8/8/PPPPPPPP/RNBQKBNR w KQkq e6 0 2")
+        self.assertEqual(str(board.en_passant_square), "e6")
+
+    def test_to_fen(self):
+        self.assertEqual(self.board.to_fen(), "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1")
+
+        self._play(self.board, "e4", "c5", "Nf3")
+        self.assertEqual(self.board.to_fen(), "rnbqkbnr/pp1ppppp/8/2p5/4P3/5N2/PPPP1PPP/RNBQKB1R b KQkq - 1 2")
+
+        for fen in ("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+                    "8/8/1k6/2b5/2pP4/8/5K2/8 b - d3 0 1",
+                    "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8"):
+            self.assertEqual(Board.from_fen(fen).to_fen(), fen)
+
+    def test_move_counters(self):
+        board = self._played("Nf3", "Nf6", "Ng1")
+        self.assertEqual((board.halfmove_clock, board.fullmove_number), (3, 2))
+
+        undo = board.make_move(converter.short_alg("e5", color.black, board))
+        self.assertEqual((board.halfmove_clock, board.fullmove_number), (0, 3))
+        self.assertEqual(cp(board).fullmove_number, 3)
+
+        board.unmake_move(undo)
+        self.assertEqual((board.halfmove_clock, board.fullmove_number), (3, 2))
+
+        board = Board.from_fen("4k3/8/8/3p4/8/8/8/3RK3 w - - 12 40")
+        board.update(converter.long_alg("d1d5", board))
+        self.assertEqual((board.halfmove_clock, board.fullmove_number), (0, 40))
@@ -0,0 +1,65 @@
+from copy import copy as cp
+from unittest import TestCase
+
+from chess_py import Board, MoveCache, color, converter
+
+
+class TestMoveCache(TestCase):
+    def setUp(self):
+        self.cache = MoveCache(max_size=2)
+
+    def test_get_miss_and_hit(self):
+        self.assertIsNone(self.cache.get("a"))
+        self.cache.put("a", (1, 2))
+
+        self.assertEqual(self.cache.get("a"), (1, 2))
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+        self.assertEqual(self.cache.hit_rate, 0.5)
+
+    def test_evicts_least_recently_used(self):
+        self.cache.put("a", ())
+        self.cache.put("b", ())
+        self.cache.get("a")
+        self.cache.put("c", ())
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertIn("a", self.cache)
+        self.assertNotIn("b", self.cache)
+        self.assertIn("c", self.cache)
+
+    def test_clear(self):
+        self.cache.put("a", ())
+        self.cache.get("a")
+        self.cache.clear()
+
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.hits, 0)
+
+    def test_invalid_size(self):
+        self.assertRaises(ValueError, MoveCache, 0)
+
+    def test_board_all_possible_moves(self):
+        board = Board.init_default()
+        white_moves = board.packed_moves(color.white)
+
+        self.assertIs(board.packed_moves(color.white), white_moves)
+        self.assertEqual(len(board.all_possible_moves(color.white)), 20)
+        self.assertEqual(board.move_cache.hits, 2)
+
+        # Side to move is part of the key
+        self.assertNotEqual(board.packed_moves(color.black), white_moves)
+
+        board.update(converter.long_alg("e2e4", board))
+        self.assertEqual(len(board.all_possible_moves(color.white)), 30)
+
+    def test_copies_share_cache(self):
+        board = Board.init_default()
+        board.move_cache = MoveCache(4)
+        board.packed_moves(color.white)
+        copied = cp(board)
+
+        self.assertIs(copied.move_cache, board.move_cache)
+        self.assertEqual(copied.move_cache.max_size, 4)
+        copied.packed_moves(color.white)
+        self.assertEqual(board.move_cache.hits, 1)
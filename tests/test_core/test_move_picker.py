@@ -0,0 +1,76 @@
+from unittest import TestCase
+
+from chess_py import Board, MovePicker, color, converter, Location, stats
+from chess_py import King, Rook, Knight, Queen, Pawn
+from chess_py.core import packed_move
+
+
+def _move(board, alg):
+    return packed_move.from_move(converter.long_alg(alg, board))
+
+
+class TestMovePicker(TestCase):
+    def setUp(self):
+        self.board = Board.init_default()
+        input_color = color.white
+        for alg in ("e4", "d5", "Nf3", "Nc6"):
+            self.board.update(converter.short_alg(alg, input_color, self.board))
+            input_color = -input_color
+
+    def test_same_moves_as_packed_moves(self):
+        picked = list(MovePicker(self.board, color.white))
+
+        self.assertEqual(len(picked), len(set(picked)))
+        self.assertEqual(set(picked), set(self.board.packed_moves(color.white)))
+
+    def test_stage_order(self):
+        tt_move = _move(self.board, "b1c3")
+        killer = _move(self.board, "a2a3")
+        picked = list(self.board.staged_moves(color.white, tt_move=tt_move, killers=(killer,)))
+
+        self.assertEqual(picked[0], tt_move)
+        self.assertEqual(picked[1], _move(self.board, "e4d5"))
+        self.assertEqual(picked[2], killer)
+        self.assertEqual(picked.count(tt_move), 1)
+        self.assertEqual(picked.count(killer), 1)
+
+    def test_captures_most_valuable_victim_first(self):
+        board = Board([[None] * 8 for _ in range(8)])
+        for piece in (King(color.white, Location.from_string("a1")),
+                      Queen(color.white, Location.from_string("d1")),
+                      Pawn(color.white, Location.from_string("c4")),
+                      Knight(color.black, Location.from_string("d5")),
+                      Rook(color.black, Location.from_string("d7")),
+                      King(color.black, Location.from_string("h8"))):
+            board.place_piece_at_square(piece, piece.location)
+
+        picked = [packed_move.to_string(move) for move in MovePicker(board, color.white)]
+
+        self.assertEqual(picked[:2], ["c4d5", "d1d5"])
+
+    def test_skips_illegal_tt_move_and_killers(self):
+        self.board.update(converter.short_alg("Bb5", color.white, self.board))
+        other_side = packed_move.pack(4, 12)
+        pinned = packed_move.pack(Location.from_string("c6").index, Location.from_string("b4").index)
+        picked = list(MovePicker(self.board, color.black, tt_move=other_side, killers=(pinned,)))
+
+        self.assertNotIn(other_side, picked)
+        self.assertNotIn(pinned, picked)
+        self.assertEqual(set(picked), set(self.board.packed_moves(color.black)))
+
+    def test_legality_checked_when_pulled(self):
+        board = Board([[None] * 8 for _ in range(8)])
+        for piece in (King(color.white, Location.from_string("e1")),
+                      Rook(color.white, Location.from_string("e2")),
+                      Rook(color.black, Location.from_string("e8")),
+                      King(color.black, Location.from_string("a8"))):
+            board.place_piece_at_square(piece, piece.location)
+
+        with stats.collect() as counters:
+            picker = MovePicker(board, color.white)
+            self.assertEqual(counters.legality_tests, 0)
+            first = next(iter(picker))
+
+        self.assertEqual(packed_move.to_string(first), "e2e8")
+        self.assertEqual(counters.legality_tests, 1)
+        self.assertNotIn("e2d2", [packed_move.to_string(move) for move in picker])
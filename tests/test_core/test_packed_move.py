@@ -0,0 +1,60 @@
+from unittest import TestCase
+
+from chess_py import Board, Move, Location, color, converter, notation_const
+from chess_py import Pawn, Queen, Knight
+from chess_py.core import packed_move
+
+
+class TestPackedMove(TestCase):
+    def setUp(self):
+        self.board = Board.init_default()
+
+    def test_pack(self):
+        move = packed_move.pack(12, 28, packed_move.DOUBLE_PAWN_PUSH)
+
+        self.assertTrue(move < 1 << 16)
+        self.assertEqual(packed_move.start_index(move), 12)
+        self.assertEqual(packed_move.end_index(move), 28)
+        self.assertEqual(move >> 12, packed_move.DOUBLE_PAWN_PUSH)
+        self.assertEqual(packed_move.status(move), notation_const.MOVEMENT)
+        self.assertEqual(packed_move.to_string(move), "e2e4")
+
+    def test_promotion(self):
+        move = packed_move.pack(52, 61, packed_move.CAPTURE_PROMOTION | 3)
+
+        self.assertEqual(packed_move.status(move), notation_const.CAPTURE_AND_PROMOTE)
+        self.assertIs(packed_move.promoted_to(move), Queen)
+        self.assertEqual(packed_move.to_string(move), "e7f8q")
+        self.assertIsNone(packed_move.promoted_to(packed_move.pack(52, 60)))
+
+    def test_from_move_and_to_move(self):
+        move = converter.short_alg("e4", color.white, self.board)
+        packed = packed_move.from_move(move)
+
+        self.assertEqual(packed, packed_move.pack(12, 28, packed_move.DOUBLE_PAWN_PUSH))
+        self.assertEqual(packed_move.to_move(packed, self.board), move)
+
+        promotion = Move(end_loc=Location.from_string("e8"),
+                         piece=Pawn(color.white, Location.from_string("e7")),
+                         status=notation_const.PROMOTE,
+                         start_loc=Location.from_string("e7"),
+                         promoted_to_piece=Knight)
+        self.assertIs(packed_move.promoted_to(packed_move.from_move(promotion)), Knight)
+
+    def test_board_packed_moves(self):
+        moves = self.board.packed_moves(color.white)
+
+        self.assertEqual(len(moves), 20)
+        self.assertEqual({packed_move.to_string(move) for move in moves},
+                         {str(move) for move in self.board.all_possible_moves(color.white)})
+
+    def test_make_packed_move(self):
+        test = Board.init_default()
+        test.update(converter.short_alg("e4", color.white, test))
+
+        undo = self.board.make_move(packed_move.pack(12, 28, packed_move.DOUBLE_PAWN_PUSH))
+        self.assertEqual(self.board, test)
+        self.assertEqual(self.board.zobrist_key, test.zobrist_key)
+
+        self.board.unmake_move(undo)
+        self.assertEqual(self.board, Board.init_default())
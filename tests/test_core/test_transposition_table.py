@@ -0,0 +1,85 @@
+from unittest import TestCase
+
+from chess_py import Board, TranspositionTable, color, converter
+from chess_py.core import transposition_table
+from chess_py.core.transposition_table import EXACT, LOWER_BOUND, UPPER_BOUND, \
+    DEPTH_PREFERRED, ALWAYS_REPLACE, MIN_DEPTH, MAX_DEPTH
+
+
+class TestTranspositionTable(TestCase):
+    def setUp(self):
+        self.table = TranspositionTable(size_mb=0.001)
+
+    def test_size(self):
+        self.assertEqual(self.table.size_bytes, self.table.size * transposition_table.SLOT_SIZE)
+        self.assertTrue(self.table.size_bytes <= 0.001 * 1024 * 1024)
+        self.assertRaises(ValueError, TranspositionTable, 0)
+        self.assertRaises(ValueError, TranspositionTable, 1, "newest")
+
+    def test_store_and_probe(self):
+        board = Board.init_default()
+        self.assertIsNone(self.table.probe(board.zobrist_key))
+
+        self.table.store(board.zobrist_key, 3, EXACT, 0.5, 1234)
+        entry = self.table.probe(board.zobrist_key)
+
+        self.assertEqual(entry, (3, EXACT, 0.5, 1234))
+        self.assertEqual(entry.move, 1234)
+
+        board.update(converter.short_alg("e4", color.white, board))
+        self.assertIsNone(self.table.probe(board.zobrist_key))
+
+    def test_fill_rate(self):
+        self.assertEqual(self.table.fill_rate, 0)
+
+        self.table.store(1, 1, EXACT, 0)
+        self.table.store(1, 2, EXACT, 0)
+        self.assertEqual(len(self.table), 1)
+        self.assertEqual(self.table.fill_rate, 1.0 / self.table.size)
+
+        self.table.clear()
+        self.assertEqual(len(self.table), 0)
+        self.assertIsNone(self.table.probe(1))
+
+    def test_two_tier(self):
+        other = 1 + self.table.num_buckets
+        self.table.store(1, 5, LOWER_BOUND, 1)
+        self.table.store(other, 2, UPPER_BOUND, 2)
+
+        self.assertEqual(self.table.probe(1).depth, 5)
+        self.assertEqual(self.table.probe(other).depth, 2)
+
+        # The shallower entry is replaced, the deeper one is kept
+        self.table.store(other + self.table.num_buckets, 1, EXACT, 3)
+        self.assertEqual(self.table.probe(1).depth, 5)
+        self.assertIsNone(self.table.probe(other))
+
+    def test_depth_preferred(self):
+        table = TranspositionTable(size_mb=0.001, policy=DEPTH_PREFERRED)
+        other = 1 + table.num_buckets
+        table.store(1, 5, EXACT, 1)
+        table.store(other, 2, EXACT, 2)
+
+        self.assertIsNotNone(table.probe(1))
+        self.assertIsNone(table.probe(other))
+
+    def test_always_replace(self):
+        table = TranspositionTable(size_mb=0.001, policy=ALWAYS_REPLACE)
+        other = 1 + table.num_buckets
+        table.store(1, 5, EXACT, 1)
+        table.store(other, 2, EXACT, 2)
+
+        self.assertIsNone(table.probe(1))
+        self.assertEqual(table.probe(other).score, 2)
+
+    def test_round_trip(self):
+        for key, depth, score in ((1, -1, 0.1), (2, MIN_DEPTH, -1.0 / 3), (3, MAX_DEPTH, 12345.678), (4, 0, -7)):
+            self.table.store(key, depth, EXACT, score, 0xFFFF)
+            self.assertEqual(self.table.probe(key), (depth, EXACT, score, 0xFFFF))
+
+    def test_store_out_of_range(self):
+        self.assertRaises(ValueError, self.table.store, 1, MIN_DEPTH - 1, EXACT, 0)
+        self.assertRaises(ValueError, self.table.store, 1, MAX_DEPTH + 1, EXACT, 0)
+        self.assertRaises(ValueError, self.table.store, 1, 1, EXACT, 0, 1 << 16)
+        self.assertRaises(ValueError, self.table.store, 1, 1, EXACT, "0.5")
+        self.assertEqual(len(self.table), 0)
@@ -0,0 +1,48 @@
+from unittest import TestCase
+
+from chess_py import Board, Game, Player, color, converter, Location
+from chess_py import King, Queen
+from chess_py.game import game_state
+
+
+class Scripted(Player):
+    def __init__(self, input_color, moves):
+        super(Scripted, self).__init__(input_color)
+        self.moves = list(moves)
+
+    def generate_move(self, position):
+        return converter.short_alg(self.moves.pop(0), self.color, position)
+
+
+class TestGame(TestCase):
+    def test_play_checkmate(self):
+        game = Game(Scripted(color.white, ["f3", "g4"]),
+                    Scripted(color.black, ["e5", "Qh4"]))
+
+        self.assertEqual(game.play(), 1)
+        self.assertTrue(game.status.in_check)
+        self.assertIs(game.status.side_to_move, color.white)
+
+    def test_play_stalemate(self):
+        position = [[None] * 8 for _ in range(8)]
+        for piece in (King(color.white, Location.from_string("c6")),
+                      Queen(color.white, Location.from_string("b1")),
+                      King(color.black, Location.from_string("a8"))):
+            position[piece.location.rank][piece.location.file] = piece
+
+        game = Game(Scripted(color.white, ["Qb6"]), Scripted(color.black, []), Board(position))
+
+        self.assertEqual(game.play(), 0.5)
+        self.assertFalse(game.status.in_check)
+
+    def test_status_shares_legal_moves(self):
+        board = Board.init_default()
+        status = game_state.GameStatus(board, color.white)
+
+        self.assertIsNone(status.result)
+        self.assertFalse(status.is_over)
+        self.assertEqual(len(status.legal_moves), 20)
+        self.assertIs(status.legal_moves, status.legal_moves)
+
+        move = converter.make_legal(converter.short_alg("e4", color.white, board), board, status.legal_moves)
+        self.assertIn(move, status.legal_moves)
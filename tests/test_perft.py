@@ -0,0 +1,88 @@
+import multiprocessing
+from unittest import TestCase
+
+from chess_py import Board, BitBoard
+from chess_py.perft import SUITE, PerftTable, perft, divide, main, _pack_board, _unpack_board, \
+    _worker_count
+
+
+class TestPerft(TestCase):
+    def test_suite(self):
+        for entry in SUITE:
+            board = Board.from_fen(entry.fen)
+            for depth, expected in enumerate(entry.counts[:2], 1):
+                self.assertEqual(perft(board, depth), expected, entry.name)
+
+    def test_bitboard(self):
+        for entry in SUITE:
+            self.assertEqual(perft(BitBoard.from_fen(entry.fen), 2), entry.counts[1], entry.name)
+
+    def test_perft_restores_board(self):
+        board = Board.from_fen(SUITE[1].fen)
+        key = board.zobrist_key
+
+        self.assertEqual(perft(board, 3), SUITE[1].counts[2])
+        self.assertEqual(board.zobrist_key, key)
+        self.assertEqual(perft(board, 0), 1)
+
+    def test_divide(self):
+        counts = divide(Board.init_default(), 3)
+
+        self.assertEqual(len(counts), 20)
+        self.assertEqual(counts["e2e4"], 600)
+        self.assertEqual(sum(counts.values()), 8902)
+
+    def test_workers(self):
+        board = Board.from_fen(SUITE[1].fen)
+
+        self.assertEqual(perft(board, 3, workers=2), SUITE[1].counts[2])
+        # Too few root moves for eight workers, so split two plies deep
+        self.assertEqual(divide(Board.init_default(), 3, workers=8), divide(Board.init_default(), 3))
+
+    def test_worker_count(self):
+        self.assertEqual(_worker_count(None), multiprocessing.cpu_count())
+        self.assertEqual(_worker_count(0), 0)
+        self.assertEqual(_worker_count(1), 1)
+
+        board = Board.from_fen(SUITE[1].fen)
+        for workers in (None, 0, 1):
+            self.assertEqual(perft(board, 2, workers=workers), SUITE[1].counts[1], workers)
+
+        self.assertEqual(main(["--depth", "2", "--position", "kiwipete", "--workers", "0"]), 0)
+        self.assertEqual(main(["--depth", "2", "--position", "kiwipete", "--workers"]), 0)
+
+    def test_hash(self):
+        for entry in SUITE[:3]:
+            board = Board.from_fen(entry.fen)
+            self.assertEqual(perft(board, 3, hash_mb=1), entry.counts[2], entry.name)
+
+        self.assertEqual(divide(Board.init_default(), 3, hash_mb=1), divide(Board.init_default(), 3))
+        self.assertEqual(perft(Board.init_default(), 3, workers=2, hash_mb=1), SUITE[0].counts[2])
+
+    def test_perft_table(self):
+        # A single slot, so every key shares it
+        table = PerftTable(16.0 / (1024 * 1024))
+        table.store(12345, 3, 97862)
+
+        self.assertEqual(table.probe(12345, 3), 97862)
+        self.assertIsNone(table.probe(12345, 2))
+        self.assertIsNone(table.probe(54321, 3))
+
+        table.store(54321, 3, 8902)
+        self.assertIsNone(table.probe(12345, 3))
+        self.assertEqual(table.probe(54321, 3), 8902)
+
+        with self.assertRaises(ValueError):
+            PerftTable(0)
+
+    def test_pack_board(self):
+        for entry in SUITE:
+            board = BitBoard.from_fen(entry.fen)
+            unpacked = _unpack_board(_pack_board(board))
+
+            self.assertIsInstance(unpacked, BitBoard)
+            self.assertEqual(unpacked, board)
+            self.assertEqual(unpacked.zobrist_key, board.zobrist_key)
+
+    def test_main(self):
+        self.assertEqual(main(["--depth", "2", "--position", "promotions"]), 0)
@@ -15,52 +15,14 @@ class TestKing(TestCase):
 
         # self.assertTrue(self.board.get_king(color.white).in_check_as_result(self.board, converter.long_alg("e3e4", self.board)))
 
-    def test_add(self):
-        self.assertEqual(
-            len(list(self.board.get_king(color.white).add(lambda  x: x.shift_up(), self.board))),
-            0)
+    def test_possible_moves_blocked(self):
+        self.assertEqual(len(list(self.board.get_king(color.white).possible_moves(self.board))), 0)
 
         self.board.update(converter.long_alg("e2e4", self.board))
 
-        # King should be able to move up
-        self.assertEqual(
-            len(list(self.board.get_king(color.white).add(lambda x: x.shift_up(), self.board))),
-            1)
-
-        # King should not be able to move down
-        self.assertEqual(
-            len(list(self.board.get_king(color.white).add(lambda x: x.shift_down(), self.board))),
-            0)
-
-        # King should not be able to move left
-        self.assertEqual(
-            len(list(self.board.get_king(color.white).add(lambda x: x.shift_left(), self.board))),
-            0)
-
-        # King should not be able to move right
-        self.assertEqual(
-            len(list(self.board.get_king(color.white).add(lambda x: x.shift_right(), self.board))),
-            0)
-
-        # King should not be able to move up left
-        self.assertEqual(
-            len(list(self.board.get_king(color.white).add(lambda x: x.shift_up_left(), self.board))),
-            0)
-
-        # King should not be able to move down right
-        self.assertEqual(
-            len(list(self.board.get_king(color.white).add(lambda x: x.shift_down_right(), self.board))),
-            0)
-
-        # King should not be able to move down left
-        self.assertEqual(
-            len(list(self.board.get_king(color.white).add(lambda x: x.shift_down_left(), self.board))),
-            0)
-
-        # King should not be able to move up right
-        self.assertEqual(
-            len(list(self.board.get_king(color.white).add(lambda x: x.shift_up_right(), self.board))),
-            0)
+        # King can only move up
+        self.assertEqual(list(self.board.get_king(color.white).possible_moves(self.board)),
+                         [converter.long_alg("e1e2", self.board)])
 
     def test_kingside_castle(self):
         self.board.update(converter.short_alg("e4", color.white, self.board))
@@ -32,7 +32,7 @@ class TestPawn(TestCase):
         self.assertFalse(self.black_pawn.would_move_be_promotion(Location.from_string("a7")))
 
     def test_create_promotion_moves(self):
-        self.white_pawn.location = Location.from_string("e7")
+        self.white_pawn = Pawn(color.white, Location.from_string("e7"))
         moves = list(self.white_pawn.create_promotion_moves(notation_const.CAPTURE,
                                                             Location.from_string("e7")))
         self.assertEqual(len(list(moves)), 4)
@@ -44,7 +44,6 @@ class TestPawn(TestCase):
         self.assertEqual(moves[3].promoted_to_piece, Knight)
 
     def test_forward_moves(self):
-        self.white_pawn.location = Location.from_string("e2")
         moves = list(self.white_pawn.forward_moves(self.position))
 
         self.assertEqual(len(moves), 2)
@@ -76,6 +75,7 @@ class TestPawn(TestCase):
         self.position.move_piece(Location.from_string("e2"), Location.from_string("e4"))
 
         black_pawn = self.position.piece_at_square(Location.from_string("d5"))
+        self.white_pawn = self.position.piece_at_square(Location.from_string("e4"))
         move = list(self.white_pawn.capture_moves(self.position))
 
         self.assertEqual(len(move), 1)
@@ -87,10 +87,12 @@ class TestPawn(TestCase):
 
     def test_en_passant_moves(self):
         self.position.move_piece(Location.from_string("d7"), Location.from_string("d4"))
-        self.position.move_piece(Location.from_string("e2"), Location.from_string("e4"))
+        self.position.update(Move(end_loc=Location.from_string("e4"),
+                                  piece=self.white_pawn,
+                                  status=notation_const.MOVEMENT,
+                                  start_loc=Location.from_string("e2")))
 
         black_pawn = self.position.piece_at_square(Location.from_string("d4"))
-        self.position.piece_at_square(Location.from_string("e4")).just_moved_two_steps = True
 
         move = list(black_pawn.en_passant_moves(self.position))
 
@@ -103,5 +105,6 @@ class TestPawn(TestCase):
     def test_possible_moves(self):
         self.assertEqual(len(list(self.white_pawn.possible_moves(self.position))), 2)
         self.position.move_piece(Location.from_string("e2"), Location.from_string("e3"))
+        self.white_pawn = self.position.piece_at_square(Location.from_string("e3"))
         self.assertEqual(len(list(self.white_pawn.possible_moves(self.position))), 1)
 
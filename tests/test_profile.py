@@ -0,0 +1,67 @@
+import os
+import signal
+import unittest
+from unittest import TestCase
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+from chess_py import profile
+from chess_py.core import board
+
+
+class TestProfile(TestCase):
+    def test_pgn_games(self):
+        pgn = """[Event "?"]
+[Result "*"]
+
+1. e4 {best by test} e5 2. Nf3 (2. f4 exf4) Nc6?! 3. Bb5 $1 a6 *
+
+1. d4 d5 2. c4 dxc4 3. e3 b5 4. a4 c6 5. axb5 cxb5 6. Qf3 1-0
+"""
+        games = profile.pgn_games(pgn)
+
+        self.assertEqual(games[0], ["e4", "e5", "Nf3", "Nc6", "Bb5", "a6"])
+        self.assertEqual(len(games[1]), 11)
+        self.assertEqual(len(games), 2)
+
+    def test_built_in_games_replay(self):
+        self.assertEqual([len(moves) for moves in profile.pgn_games(profile.GAMES)], [33, 45])
+        profile.workload("pgn-replay", iterations=1)()
+
+    def test_module_name(self):
+        self.assertEqual(profile.module_name(board.__file__), "core.board")
+        self.assertEqual(profile.module_name(os.path.join(os.path.dirname(profile.__file__), "core",
+                                                          "__init__.py")), "core")
+        self.assertIsNone(profile.module_name(os.__file__))
+
+    def test_report_groups_by_module(self):
+        from cProfile import Profile
+
+        profiler = Profile()
+        profiler.runcall(profile.workload("perft", depth=2))
+        out = StringIO()
+        profile.report(profile._timings(profiler), top=3, out=out)
+        lines = out.getvalue().splitlines()
+
+        self.assertEqual(lines[0].split()[-6:], ["s", "own", "%", "total", "s", "calls"])
+        self.assertTrue(lines[1].startswith("core.board"))
+        # Module and function rows have the same number of columns
+        self.assertEqual(len(lines[1].split()), 5)
+        self.assertEqual(len(lines[2].split()), 5)
+        self.assertTrue(lines[-4].startswith(profile.OTHER))
+
+    def test_unknown_workload(self):
+        self.assertRaises(ValueError, profile.workload, "search")
+
+    @unittest.skipUnless(hasattr(signal, "setitimer"), "sampling needs signal.setitimer")
+    def test_sampler(self):
+        sampler = profile.Sampler(0.0005)
+        sampler.run(profile.workload("selfplay", iterations=1))
+
+        self.assertTrue(sampler.stacks)
+        self.assertTrue(all(line.rsplit(" ", 1)[1].isdigit() for line in sampler.collapsed()))
+        self.assertAlmostEqual(sum(timing[0] for timing in sampler.timings().values()),
+                               sum(sampler.stacks.values()) * 0.0005)
@@ -0,0 +1,53 @@
+from copy import copy as cp
+from unittest import TestCase
+
+from chess_py import Board, MovePicker, color, converter, stats
+from chess_py.core.board import Board as CoreBoard
+
+
+class TestStats(TestCase):
+    def setUp(self):
+        self.board = Board.init_default()
+
+    def test_counts(self):
+        move = converter.long_alg("e2e4", self.board)
+        with stats.collect() as counters:
+            board = cp(self.board)
+            board.update(move)
+            moves = board.packed_moves(color.black)
+            board.packed_moves(color.black)
+            board.get_king(color.black).in_check(board)
+            list(MovePicker(board, color.white))
+
+        self.assertEqual(counters.copies, 1)
+        self.assertEqual(counters.updates, 1)
+        self.assertEqual(counters.in_check_calls, 1)
+        self.assertEqual(counters.cache_misses, 1)
+        self.assertEqual(counters.cache_hits, 1)
+        self.assertEqual(counters.legality_tests, 30)
+        self.assertEqual(counters.legal_moves, len(moves))
+        self.assertEqual(counters.pseudo_legal_moves, 30)
+
+    def test_nested(self):
+        move = converter.long_alg("e2e4", self.board)
+        with stats.collect() as outer:
+            cp(self.board)
+            with stats.collect() as inner:
+                self.board.child(move)
+            cp(self.board)
+
+        self.assertEqual(outer.copies, 3)
+        self.assertEqual(inner.copies, 1)
+        self.assertEqual(inner.updates, 0)
+        self.assertEqual(inner.as_dict()["copies"], 1)
+
+    def test_disabled_outside_of_block(self):
+        update = vars(CoreBoard)["update"]
+        with stats.collect() as counters:
+            self.assertTrue(stats.is_enabled())
+            self.assertIsNot(vars(CoreBoard)["update"], update)
+
+        self.assertFalse(stats.is_enabled())
+        self.assertIs(vars(CoreBoard)["update"], update)
+        cp(self.board)
+        self.assertEqual(counters.copies, 0)